@@ -1,12 +1,13 @@
 from typing import Any, Dict
 
 from django.http import HttpRequest
+from django.utils.functional import SimpleLazyObject
 
-from categories.models import Category
+from categories.services.category_menu import CategoryMenuService
 
 
 def categories_context(request: HttpRequest) -> Dict[str, Any]:
-    main_categories = Category.objects.filter(parent=None).prefetch_related('children')[:4]
+    # 메뉴를 그리지 않는 페이지는 캐시/DB 를 조회하지 않는다
     return {
-        'main_categories': main_categories
+        'main_categories': SimpleLazyObject(CategoryMenuService.get_main_categories)
     }
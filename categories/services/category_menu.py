@@ -0,0 +1,71 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+from categories.models import Category
+from config.utils.tiered_cache import TieredCache
+
+MAIN_CATEGORY_MENU_CACHE_KEY = 'category:main:menu'
+MAIN_CATEGORY_MENU_LIMIT = 4
+MAIN_CATEGORY_MENU_CACHE_TIMEOUT = 60 * 60 * 24
+MAIN_CATEGORY_MENU_CACHE_STALE_TIMEOUT = 60 * 10
+
+
+class MenuChildren(List["MenuCategory"]):
+    # 템플릿의 `main_category.children.all` 과 호환되도록 Manager 처럼 all() 을 제공
+    def all(self) -> "MenuChildren":
+        return self
+
+
+@dataclass(frozen=True)
+class MenuCategory:
+    id: int
+    name: str
+    children: MenuChildren = field(default_factory=MenuChildren)
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class CategoryMenuService:
+    @staticmethod
+    def _load_menu() -> List[Dict[str, Any]]:
+        main_categories = Category.objects.filter(parent=None).prefetch_related('children')[:MAIN_CATEGORY_MENU_LIMIT]
+        return [
+            {
+                'id': category.id,
+                'name': category.name,
+                'children': [
+                    {'id': child.id, 'name': child.name}
+                    for child in category.children.all()
+                ],
+            }
+            for category in main_categories
+        ]
+
+    @staticmethod
+    def _build_menu(rows: List[Dict[str, Any]]) -> List[MenuCategory]:
+        return [
+            MenuCategory(
+                id=row['id'],
+                name=row['name'],
+                children=MenuChildren(
+                    MenuCategory(id=child['id'], name=child['name'])
+                    for child in row['children']
+                ),
+            )
+            for row in rows
+        ]
+
+    @staticmethod
+    def get_main_categories() -> List[MenuCategory]:
+        return list(TieredCache.get_or_compute(
+            MAIN_CATEGORY_MENU_CACHE_KEY,
+            CategoryMenuService._load_menu,
+            ttl=MAIN_CATEGORY_MENU_CACHE_TIMEOUT,
+            stale_ttl=MAIN_CATEGORY_MENU_CACHE_STALE_TIMEOUT,
+            build=CategoryMenuService._build_menu,
+        ))
+
+    @staticmethod
+    def invalidate_menu() -> None:
+        TieredCache.invalidate(MAIN_CATEGORY_MENU_CACHE_KEY)
@@ -0,0 +1,26 @@
+import pytest
+
+from categories.models import Category
+from categories.services.category_menu import CategoryMenuService
+
+
+@pytest.mark.django_db
+class TestCategoryMenu:
+    def setup_method(self) -> None:
+        self.category = Category.objects.create(name="상의", parent=None)
+        self.sub_category = Category.objects.create(name="니트", parent=self.category)
+
+    def test_get_main_categories(self) -> None:
+        menu = CategoryMenuService.get_main_categories()
+
+        assert [category.name for category in menu] == ["상의"]
+        assert [child.name for child in menu[0].children.all()] == ["니트"]
+
+    def test_menu_invalidated_on_category_save(self) -> None:
+        CategoryMenuService.get_main_categories()
+
+        self.category.name = "아우터"
+        self.category.save()
+
+        menu = CategoryMenuService.get_main_categories()
+        assert menu[0].name == "아우터"
@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
 application = get_asgi_application()
+
+# 웹 워커에서만 로컬 캐시 무효화 구독을 켠다 (관리 명령/테스트는 이 모듈을 불러오지 않는다)
+from config.utils.tiered_cache import TieredCache  # noqa: E402
+
+TieredCache.enable_subscriber()
@@ -46,6 +46,7 @@ DJANGO_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 ]
 
 THIRD_PARTY_APPS = [
@@ -284,6 +285,12 @@ EMAIL_HOST_PASSWORD = env('EMAIL_HOST_PASSWORD', default='')
 ES_HOST = env('ES_HOST', default='')
 ES_API_KEY = env('ES_API_KEY', default='')
 
+# 상품 검색 백엔드 (ES 클러스터 없이 운영할 때는 PostgresSearchBackend)
+PRODUCT_SEARCH_BACKEND = env(
+    'PRODUCT_SEARCH_BACKEND',
+    default='products.utils.search.elasticsearch_backend.ElasticsearchSearchBackend',
+)
+
 # Redis 설정
 REDIS_HOST = os.getenv("REDIS_HOST", "redis")
 REDIS_PORT = os.getenv("REDIS_PORT", "6379")
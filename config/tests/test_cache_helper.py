@@ -0,0 +1,77 @@
+import json
+import time
+from decimal import Decimal
+from typing import List, Optional, cast
+
+from django.core.cache import cache as django_cache
+
+from config.utils.cache_helper import CACHE_FORMAT_VERSION, CacheHelper
+
+
+class TestCacheHelper:
+    def teardown_method(self) -> None:
+        CacheHelper.delete_many([
+            "test:cache:a", "test:cache:b", "test:cache:legacy", "test:cache:compute", "lock:test:cache:compute"
+        ])
+
+    def test_set_uses_compact_versioned_format(self) -> None:
+        CacheHelper.set("test:cache:a", {"items": [1, 2], "amount": Decimal("10.5")}, timeout=60)
+
+        raw = cast(Optional[bytes], CacheHelper.get_redis_client().get(django_cache.make_key("test:cache:a")))
+
+        assert raw is not None
+        assert raw.startswith(CACHE_FORMAT_VERSION)
+        assert b" " not in raw
+        assert CacheHelper.get("test:cache:a") == {"items": [1, 2], "amount": 10.5}
+
+    def test_get_reads_legacy_indented_json(self) -> None:
+        legacy_value = json.dumps({"user_id": 1}, ensure_ascii=False, indent=2)
+        CacheHelper.get_redis_client().setex(django_cache.make_key("test:cache:legacy"), 60, legacy_value)
+
+        assert CacheHelper.get("test:cache:legacy") == {"user_id": 1}
+
+    def test_set_many_get_many_delete_many(self) -> None:
+        CacheHelper.set_many({"test:cache:a": [1, 2, 3], "test:cache:b": "블랙"}, timeout=60)
+
+        result = CacheHelper.get_many(["test:cache:a", "test:cache:b", "test:cache:missing"])
+
+        assert result == {"test:cache:a": [1, 2, 3], "test:cache:b": "블랙"}
+
+        CacheHelper.delete_many(["test:cache:a", "test:cache:b"])
+
+        assert CacheHelper.get_many(["test:cache:a", "test:cache:b"]) == {}
+
+    def test_empty_batch_operations(self) -> None:
+        assert CacheHelper.get_many([]) == {}
+        CacheHelper.set_many({})
+        CacheHelper.delete_many([])
+
+    def test_get_or_compute_computes_once(self) -> None:
+        calls: List[int] = []
+
+        def compute() -> List[int]:
+            calls.append(1)
+            return [1, 2, 3]
+
+        first = CacheHelper.get_or_compute("test:cache:compute", compute, ttl=60)
+        second = CacheHelper.get_or_compute("test:cache:compute", compute, ttl=60)
+
+        assert first == second == [1, 2, 3]
+        assert len(calls) == 1
+
+    def test_get_or_compute_serves_stale_while_locked(self) -> None:
+        CacheHelper.set("test:cache:compute", {
+            "__cached__": 1, "value": "old", "delta": 0, "expires_at": time.time() - 1,
+        }, timeout=60)
+        token = CacheHelper._acquire_lock("test:cache:compute")
+        assert token is not None
+
+        value = CacheHelper.get_or_compute("test:cache:compute", lambda: "new", ttl=60, stale_ttl=60)
+
+        assert value == "old"
+
+        CacheHelper._release_lock("test:cache:compute", token)
+        value = CacheHelper.get_or_compute("test:cache:compute", lambda: "new", ttl=60, stale_ttl=60)
+
+        assert value == "new"
+
@@ -0,0 +1,66 @@
+from typing import Dict, cast
+
+import pytest
+
+from config.utils.cache_helper import CacheHelper
+from config.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+def fail() -> None:
+    raise ConnectionError("down")
+
+
+class TestCircuitBreaker:
+    def setup_method(self) -> None:
+        self.breaker = CircuitBreaker("test", minimum_calls=2, failure_rate_threshold=0.5, open_seconds=60)
+        self.breaker.reset()
+
+    def teardown_method(self) -> None:
+        self.breaker.reset()
+
+    def test_opens_after_failure_rate_exceeded(self) -> None:
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                self.breaker.call(fail)
+
+        assert self.breaker.is_open()
+        with pytest.raises(CircuitOpenError):
+            self.breaker.call(lambda: "ok")
+
+    def test_successful_calls_keep_circuit_closed(self) -> None:
+        assert self.breaker.call(lambda: "ok") == "ok"
+        assert self.breaker.call(lambda: "ok") == "ok"
+        with pytest.raises(ConnectionError):
+            self.breaker.call(fail)
+        assert self.breaker.call(lambda: "ok") == "ok"
+
+        assert not self.breaker.is_open()
+
+    def test_counters_share_one_window(self) -> None:
+        assert self.breaker.call(lambda: "ok") == "ok"
+        assert self.breaker.call(lambda: "ok") == "ok"
+        with pytest.raises(ConnectionError):
+            self.breaker.call(fail)
+
+        redis_client = CacheHelper.get_redis_client()
+        window = cast(Dict[bytes, bytes], redis_client.hgetall(self.breaker._key("window")))
+        assert {name: int(value) for name, value in window.items()} == {b"calls": 3, b"failures": 1}
+        # 호출 수와 실패 수가 같은 키의 TTL 로 함께 만료된다
+        assert 0 < cast(int, redis_client.ttl(self.breaker._key("window"))) <= self.breaker.window_seconds
+
+    def test_half_open_probe_closes_circuit(self) -> None:
+        self.breaker._trip()
+        # open 기간이 끝난 상황
+        CacheHelper.get_redis_client().delete(self.breaker._key("open"))
+
+        assert self.breaker.call(lambda: "ok") == "ok"
+        assert self.breaker._state() == (False, False)
+
+    def test_half_open_probe_failure_reopens(self) -> None:
+        self.breaker._trip()
+        CacheHelper.get_redis_client().delete(self.breaker._key("open"))
+
+        with pytest.raises(ConnectionError):
+            self.breaker.call(fail)
+
+        assert self.breaker.is_open()
@@ -0,0 +1,67 @@
+import pytest
+from django.test import RequestFactory
+
+from config.utils.filtering import Filtering
+from config.utils.setup_test_method import TestSetupMixin
+from orders.models import Order, OrderItem
+
+
+@pytest.mark.django_db
+class TestAdminFiltering(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.setup_test_products_data()
+        self.setup_test_order_data()
+        self.factory = RequestFactory()
+        self.generated_order = Order.objects.create(
+            user=self.customer_user,
+            order_id='ORD-20260101120000-ABC123',
+            product_name='니트',
+            total_amount=30000,
+            status='PAID',
+        )
+        OrderItem.objects.create(
+            order=self.generated_order, product_id=self.product.id, product_name='캐시미어 니트', quantity=1, unit_price=30000
+        )
+
+    def test_order_id_exact_match(self) -> None:
+        request = self.factory.get('/', {'q': 'ord-20260101120000-abc123'})
+
+        orders = list(Filtering.order_list_filter(request))
+
+        assert orders == [self.generated_order]
+
+    def test_order_id_prefix(self) -> None:
+        request = self.factory.get('/', {'q': 'ORD-2026'})
+
+        assert list(Filtering.order_list_filter(request)) == [self.generated_order]
+
+    def test_email_routes_to_user(self) -> None:
+        request = self.factory.get('/', {'q': self.customer_user.email})
+
+        assert list(Filtering.order_list_filter(request)) == [self.generated_order]
+
+    def test_substring_search_across_tables(self) -> None:
+        by_username = self.factory.get('/', {'q': self.customer_user.username})
+        by_item_name = self.factory.get('/', {'q': '캐시미어'})
+
+        assert list(Filtering.order_list_filter(by_username)) == [self.generated_order]
+        # 주문 상품 항목 이름은 배송 관리에서만 검색
+        assert list(Filtering.shipping_list_filter(by_item_name)) == [self.generated_order]
+        assert list(Filtering.order_list_filter(by_item_name)) == []
+
+    def test_status_default_and_override(self) -> None:
+        Order.objects.filter(id=self.order.id).update(status='CANCELLED')
+
+        paid = Filtering.order_list_filter(self.factory.get('/'))
+        cancelled = Filtering.order_list_filter(self.factory.get('/', {'status': 'CANCELLED'}))
+
+        assert list(paid) == [self.generated_order]
+        assert list(cancelled) == [Order.objects.get(id=self.order.id)]
+
+    def test_user_search(self) -> None:
+        request = self.factory.get('/', {'q': self.customer_user.email.upper()})
+
+        users = list(Filtering.user_list_filter(request))
+
+        assert self.customer_user in users
@@ -0,0 +1,66 @@
+from typing import List, Optional
+
+import pytest
+
+from config.utils.pagination import KeysetPaginator
+from users.models import User
+
+
+@pytest.mark.django_db
+class TestKeysetPaginator:
+    def setup_method(self) -> None:
+        self.users = [
+            User.objects.create_user(
+                email=f"page{i}@example.com",
+                username=f"page{i}",
+                password="testpass",
+                personal_info_consent=True,
+                terms_of_use=True,
+            )
+            for i in range(7)
+        ]
+        self.expected = [user.id for user in sorted(self.users, key=lambda u: (u.date_joined, u.id), reverse=True)]
+
+    def _paginator(self) -> KeysetPaginator[User]:
+        return KeysetPaginator(
+            User.objects.filter(email__startswith="page"), ('-date_joined',), per_page=3, with_total=True
+        )
+
+    def test_walks_forward_and_back(self) -> None:
+        paginator = self._paginator()
+        seen: List[int] = []
+        cursor: Optional[str] = None
+        pages = []
+        while True:
+            page = paginator.get_page(cursor)
+            pages.append(page)
+            seen.extend(user.id for user in page)
+            if not page.has_next:
+                break
+            cursor = page.next_cursor
+
+        assert seen == self.expected
+        assert [len(page) for page in pages] == [3, 3, 1]
+        assert not pages[0].has_previous
+
+        previous = paginator.get_page(pages[-1].previous_cursor)
+        assert [user.id for user in previous] == [user.id for user in pages[1]]
+
+    def test_total(self) -> None:
+        page = self._paginator().get_page()
+
+        assert page.total == 7
+        assert not page.total_is_approximate
+
+    def test_invalid_cursor(self) -> None:
+        with pytest.raises(ValueError):
+            self._paginator().get_page("invalid")
+
+    def test_ascending_ordering(self) -> None:
+        paginator = KeysetPaginator(User.objects.filter(email__startswith="page"), ('id',), per_page=4)
+
+        first = paginator.get_page()
+        second = paginator.get_page(first.next_cursor)
+
+        assert [user.id for user in [*first, *second]] == sorted(user.id for user in self.users)
+        assert second.next_cursor is None
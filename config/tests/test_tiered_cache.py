@@ -0,0 +1,77 @@
+import time
+from typing import List, cast
+from unittest.mock import patch
+
+from django.core.cache import cache as django_cache
+
+from config.utils.cache_helper import CacheHelper
+from config.utils.tiered_cache import LocalLRUCache, TieredCache
+
+
+class TestLocalLRUCache:
+    def test_evicts_least_recently_used(self) -> None:
+        cache = LocalLRUCache(max_entries=2)
+        cache.set("a", 1, timeout=60)
+        cache.set("b", 2, timeout=60)
+        cache.get("a")
+        cache.set("c", 3, timeout=60)
+
+        assert cache.get("a") == (True, 1)
+        assert cache.get("b") == (False, None)
+        assert cache.get("c") == (True, 3)
+
+    def test_expired_entry_is_dropped(self) -> None:
+        cache = LocalLRUCache()
+        cache.set("a", 1, timeout=0)
+        time.sleep(0.01)
+
+        assert cache.get("a") == (False, None)
+
+
+class TestTieredCache:
+    def teardown_method(self) -> None:
+        TieredCache._invalidate_now("test:tiered")
+
+    def test_local_tier_serves_without_recompute(self) -> None:
+        calls: List[int] = []
+
+        def compute() -> List[int]:
+            calls.append(1)
+            return [1, 2]
+
+        first = TieredCache.get_or_compute("test:tiered", compute, ttl=60, build=tuple)
+        second = TieredCache.get_or_compute("test:tiered", compute, ttl=60, build=tuple)
+
+        assert first == second == (1, 2)
+        assert first is second
+        assert len(calls) == 1
+
+    def test_invalidate_drops_both_tiers(self) -> None:
+        TieredCache.get_or_compute("test:tiered", lambda: "old", ttl=60)
+
+        TieredCache.invalidate("test:tiered")
+
+        assert TieredCache.get_or_compute("test:tiered", lambda: "new", ttl=60) == "new"
+
+    def test_stale_ttl_extends_redis_timeout(self) -> None:
+        TieredCache.get_or_compute("test:tiered", lambda: "value", ttl=60, stale_ttl=60)
+
+        # 만료 후 stale_ttl 동안 이전 값을 내줄 수 있도록 Redis 에는 ttl + stale_ttl 만큼 남는다
+        remaining = cast(int, CacheHelper.get_redis_client().ttl(django_cache.make_key("test:tiered")))
+        assert 60 < remaining <= 120
+
+    def test_subscriber_not_started_unless_enabled(self) -> None:
+        with patch("config.utils.tiered_cache.threading.Thread") as mock_thread:
+            TieredCache.get_or_compute("test:tiered", lambda: "value", ttl=60)
+
+        mock_thread.assert_not_called()
+
+    def test_enabled_subscriber_starts_once_per_process(self) -> None:
+        with patch.object(TieredCache, "_subscribe", False), patch.object(TieredCache, "_subscriber_pid", None):
+            TieredCache.enable_subscriber()
+            with patch("config.utils.tiered_cache.threading.Thread") as mock_thread:
+                TieredCache.get_or_compute("test:tiered", lambda: "value", ttl=60)
+                TieredCache.get_or_compute("test:tiered", lambda: "value", ttl=60)
+
+        mock_thread.assert_called_once()
+        mock_thread.return_value.start.assert_called_once()
@@ -1,3 +1,5 @@
+from functools import partial
+
 from django.conf.urls.static import static
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import render
@@ -6,14 +8,35 @@ from django.views.generic import TemplateView
 
 from config import settings
 from config.utils.naver_sitemap import sitemap
+from config.utils.page_cache import (
+    CATALOG_SCOPE,
+    FRAGMENT_CACHE_TIMEOUT,
+    PageCacheVersion,
+    build_page_validators,
+    get_not_modified_response,
+    patch_page_validators,
+)
 from users import urls as users_urls
 
 
 def home(request: HttpRequest) -> HttpResponse:
-    from products.models import Product
-    products = Product.objects.filter(is_live=True, is_sold=False).prefetch_related('colors', 'image').order_by('-created_at')
-    context = {'products': products}
-    return render(request, 'home.html', context)
+    from products.services.home_sections import HomeSectionService
+    catalog_version = PageCacheVersion.get_many([CATALOG_SCOPE])
+    etag, last_modified = build_page_validators(
+        request, catalog_version, request.user.pk, getattr(request.user, 'role', None)
+    )
+    not_modified = get_not_modified_response(request, etag, last_modified)
+    if not_modified is not None:
+        return not_modified
+
+    # 템플릿이 호출할 때 섹션을 조회하므로 섹션 프래그먼트가 캐시되어 있으면 DB 를 읽지 않는다
+    context = {
+        'home': partial(HomeSectionService.get_home, catalog_version[CATALOG_SCOPE]),
+        'page_cache_timeout': FRAGMENT_CACHE_TIMEOUT,
+        'page_version': catalog_version[CATALOG_SCOPE],
+    }
+    response = render(request, 'home.html', context)
+    return patch_page_validators(response, etag, last_modified)
 
 urlpatterns = [
     path('', home, name='home'),
@@ -1,20 +1,53 @@
 import json
+import math
+import random
+import time
+import uuid
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    cast,
+)
 
 from django.core.cache import cache as django_cache
 from django_redis import get_redis_connection
+from redis import Redis
+
+# 직렬화 포맷 버전 (첫 바이트). 버전 바이트가 없는 값은 기존 indent JSON 으로 간주한다.
+CACHE_FORMAT_VERSION = b'\x01'
+
+# get_or_compute 가 저장하는 엔벨로프 마커
+CACHE_ENVELOPE_MARKER = '__cached__'
+CACHE_LOCK_TIMEOUT = 10
+CACHE_LOCK_WAIT_SECONDS = 1.0
+CACHE_LOCK_POLL_INTERVAL = 0.05
+
+# 토큰이 일치할 때만 락을 해제 (다른 워커의 락을 지우지 않도록)
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
 
-if TYPE_CHECKING:
-    from django_redis.client import DefaultClient
 
 
 class CacheHelper:
+    _redis_client: Optional[Redis] = None
+
     @staticmethod
-    def _get_redis_client() -> "DefaultClient":
-        return get_redis_connection("default")
-    
+    def get_redis_client() -> Redis:
+        """django-redis 의 기본 커넥션 풀을 쓰는 redis-py 클라이언트 (프로세스 단위로 재사용)"""
+        if CacheHelper._redis_client is None:
+            CacheHelper._redis_client = get_redis_connection("default")
+        return CacheHelper._redis_client
+
     @staticmethod
     def _make_serializable(obj: Any) -> Any:
         if isinstance(obj, dict):
@@ -31,55 +64,193 @@ class CacheHelper:
             return obj
         else:
             return str(obj)
-    
+
     @staticmethod
-    def _serialize(value: Any) -> str:
+    def _serialize(value: Any) -> bytes:
         serializable_value = CacheHelper._make_serializable(value)
-        return json.dumps(serializable_value, ensure_ascii=False, indent=2)
-    
+        payload = json.dumps(serializable_value, ensure_ascii=False, separators=(',', ':'))
+        return CACHE_FORMAT_VERSION + payload.encode('utf-8')
+
     @staticmethod
-    def _deserialize(value: str) -> Any:
+    def _deserialize(value: bytes | str) -> Any:
+        if isinstance(value, bytes):
+            if value[:1] == CACHE_FORMAT_VERSION:
+                value = value[1:]
+            # 버전 바이트가 없는 기존 JSON 데이터
+            value = value.decode('utf-8')
         return json.loads(value)
-    
+
+    @staticmethod
+    def _decode(key: str, value: Any, default: Any) -> Any:
+        if value is None:
+            return default
+
+        try:
+            return CacheHelper._deserialize(value)
+        except (json.JSONDecodeError, TypeError, UnicodeDecodeError):
+            # 기존 pickle 데이터가 있을 수 있으므로 Django 캐시로 폴백
+            try:
+                return django_cache.get(key, default)
+            except Exception:
+                return default
+
     @staticmethod
     def set(key: str, value: Any, timeout: Optional[int] = None) -> None:
         serialized_value = CacheHelper._serialize(value)
-        redis_client = CacheHelper._get_redis_client()
-        
+        redis_client = CacheHelper.get_redis_client()
+
         cache_key = django_cache.make_key(key)
-        
+
         if timeout is not None:
             redis_client.setex(cache_key, timeout, serialized_value)
         else:
             redis_client.set(cache_key, serialized_value)
-    
+
     @staticmethod
     def get(key: str, default: Any = None) -> Any:
-        redis_client = CacheHelper._get_redis_client()
+        redis_client = CacheHelper.get_redis_client()
         cache_key = django_cache.make_key(key)
-        
+
         value = redis_client.get(cache_key)
-        
-        if value is None:
-            return default
-        
-        try:
-            # bytes를 문자열로 변환
-            if isinstance(value, bytes):
-                value = value.decode('utf-8')
-            
-            # JSON 파싱
-            return CacheHelper._deserialize(value)
-        except (json.JSONDecodeError, TypeError, UnicodeDecodeError):
-            # 기존 pickle 데이터가 있을 수 있으므로 Django 캐시로 폴백
-            try:
-                return django_cache.get(key, default)
-            except Exception:
-                return default
-    
+
+        return CacheHelper._decode(key, value, default)
+
     @staticmethod
     def delete(key: str) -> None:
-        redis_client = CacheHelper._get_redis_client()
+        redis_client = CacheHelper.get_redis_client()
         cache_key = django_cache.make_key(key)
         redis_client.delete(cache_key)
 
+    @staticmethod
+    def get_many(keys: Iterable[str]) -> Dict[str, Any]:
+        """여러 키를 한 번의 MGET 으로 조회한다. 존재하지 않는 키는 결과에서 제외된다."""
+        keys = list(keys)
+        if not keys:
+            return {}
+
+        redis_client = CacheHelper.get_redis_client()
+        values = cast(List[Optional[bytes]], redis_client.mget([django_cache.make_key(key) for key in keys]))
+
+        result: Dict[str, Any] = {}
+        for key, value in zip(keys, values):
+            if value is None:
+                continue
+            result[key] = CacheHelper._decode(key, value, None)
+        return result
+
+    @staticmethod
+    def set_many(data: Dict[str, Any], timeout: Optional[int] = None) -> None:
+        """여러 키를 하나의 파이프라인으로 저장한다."""
+        if not data:
+            return
+
+        redis_client = CacheHelper.get_redis_client()
+        pipeline = redis_client.pipeline(transaction=False)
+
+        for key, value in data.items():
+            cache_key = django_cache.make_key(key)
+            serialized_value = CacheHelper._serialize(value)
+            if timeout is not None:
+                pipeline.setex(cache_key, timeout, serialized_value)
+            else:
+                pipeline.set(cache_key, serialized_value)
+
+        pipeline.execute()
+
+    @staticmethod
+    def delete_many(keys: Iterable[str]) -> None:
+        cache_keys: List[str] = [django_cache.make_key(key) for key in keys]
+        if not cache_keys:
+            return
+
+        redis_client = CacheHelper.get_redis_client()
+        redis_client.delete(*cache_keys)
+
+    @staticmethod
+    def _acquire_lock(key: str, timeout: int = CACHE_LOCK_TIMEOUT) -> Optional[str]:
+        token = uuid.uuid4().hex
+        redis_client = CacheHelper.get_redis_client()
+        lock_key = django_cache.make_key(f"lock:{key}")
+        if redis_client.set(lock_key, token, nx=True, ex=timeout):
+            return token
+        return None
+
+    @staticmethod
+    def _release_lock(key: str, token: str) -> None:
+        redis_client = CacheHelper.get_redis_client()
+        lock_key = django_cache.make_key(f"lock:{key}")
+        redis_client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+
+    @staticmethod
+    def _is_envelope(entry: Any) -> bool:
+        return isinstance(entry, dict) and entry.get(CACHE_ENVELOPE_MARKER) == 1
+
+    @staticmethod
+    def _should_recompute(entry: Dict[str, Any], beta: float) -> bool:
+        # XFetch: 만료 직전일수록, 계산 비용이 클수록 높은 확률로 미리 재계산
+        now = time.time()
+        delta = float(entry.get('delta', 0))
+        expires_at = float(entry.get('expires_at', 0))
+        return now - delta * beta * math.log(1.0 - random.random()) >= expires_at
+
+    @staticmethod
+    def _compute_and_store(
+        key: str, compute: Callable[[], Any], ttl: int, stale_ttl: int
+    ) -> Any:
+        started = time.time()
+        value = compute()
+        delta = time.time() - started
+
+        entry = {
+            CACHE_ENVELOPE_MARKER: 1,
+            'value': value,
+            'delta': delta,
+            'expires_at': time.time() + ttl,
+        }
+        CacheHelper.set(key, entry, timeout=ttl + stale_ttl)
+        return CacheHelper._make_serializable(value)
+
+    @staticmethod
+    def get_or_compute(
+        key: str,
+        compute: Callable[[], Any],
+        ttl: int,
+        stale_ttl: int = 0,
+        beta: float = 1.0,
+    ) -> Any:
+        """
+        캐시를 읽고, 없거나 만료되었으면 락을 잡은 워커 하나만 compute 를 실행한다.
+        - 만료 후 stale_ttl 동안은 재계산 중에도 이전 값을 반환 (stale-while-revalidate)
+        - 만료 전에도 확률적으로 미리 재계산 (probabilistic early expiration)
+        """
+        entry = CacheHelper.get(key)
+
+        if CacheHelper._is_envelope(entry):
+            if not CacheHelper._should_recompute(entry, beta):
+                return entry['value']
+
+            token = CacheHelper._acquire_lock(key)
+            if token is None:
+                # 다른 워커가 재계산 중이면 기존 값을 그대로 사용
+                return entry['value']
+            try:
+                return CacheHelper._compute_and_store(key, compute, ttl, stale_ttl)
+            finally:
+                CacheHelper._release_lock(key, token)
+
+        token = CacheHelper._acquire_lock(key)
+        if token is not None:
+            try:
+                return CacheHelper._compute_and_store(key, compute, ttl, stale_ttl)
+            finally:
+                CacheHelper._release_lock(key, token)
+
+        # 캐시가 비어 있고 다른 워커가 계산 중이면 잠시 결과를 기다린다
+        deadline = time.time() + CACHE_LOCK_WAIT_SECONDS
+        while time.time() < deadline:
+            time.sleep(CACHE_LOCK_POLL_INTERVAL)
+            entry = CacheHelper.get(key)
+            if CacheHelper._is_envelope(entry):
+                return entry['value']
+
+        return CacheHelper._make_serializable(compute())
@@ -0,0 +1,106 @@
+import logging
+from typing import Any, Callable, List, Optional, Tuple, Type, TypeVar, cast
+
+from django.core.cache import cache as django_cache
+
+from config.utils.cache_helper import CacheHelper
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class CircuitBreaker:
+    """
+    Redis 에 상태를 공유하는 서킷 브레이커. 모든 워커가 같은 실패율을 보고 함께 차단한다.
+    - closed: window 내 호출 실패율이 임계치를 넘으면 open
+    - open: open_seconds 동안 호출하지 않고 즉시 CircuitOpenError
+    - half-open: open 이 만료되면 한 워커만 probe 호출, 성공하면 closed / 실패하면 다시 open
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        minimum_calls: int = 10,
+        window_seconds: int = 30,
+        open_seconds: int = 30,
+        probe_timeout: int = 10,
+        expected_exceptions: Tuple[Type[BaseException], ...] = (Exception,),
+    ) -> None:
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self.probe_timeout = probe_timeout
+        self.expected_exceptions = expected_exceptions
+
+    def _key(self, suffix: str) -> str:
+        return django_cache.make_key(f"circuit:{self.name}:{suffix}")
+
+    def _state(self) -> Tuple[bool, bool]:
+        # (open, half_open) 을 한 번의 MGET 으로 조회
+        is_open, tripped = cast(
+            List[Optional[bytes]],
+            CacheHelper.get_redis_client().mget([self._key("open"), self._key("tripped")]),
+        )
+        return bool(is_open), bool(tripped) and not is_open
+
+    def is_open(self) -> bool:
+        return self._state()[0]
+
+    def _record(self, success: bool) -> None:
+        # 호출 수/실패 수를 한 hash 에 두어 같은 TTL 로 함께 만료시킨다 (따로 만료되면 실패율이 1 을 넘을 수 있다)
+        window_key = self._key("window")
+        pipeline = CacheHelper.get_redis_client().pipeline(transaction=False)
+        pipeline.hincrby(window_key, "calls", 1)
+        pipeline.hincrby(window_key, "failures", 0 if success else 1)
+        pipeline.expire(window_key, self.window_seconds, nx=True)
+        calls, failures, _ = pipeline.execute()
+
+        if not success and calls >= self.minimum_calls and failures / calls >= self.failure_rate_threshold:
+            self._trip()
+
+    def _trip(self) -> None:
+        logger.warning("Circuit %s opened", self.name)
+        pipeline = CacheHelper.get_redis_client().pipeline(transaction=False)
+        pipeline.set(self._key("open"), 1, ex=self.open_seconds)
+        pipeline.set(self._key("tripped"), 1)
+        pipeline.delete(self._key("window"), self._key("probe"))
+        pipeline.execute()
+
+    def reset(self) -> None:
+        CacheHelper.get_redis_client().delete(
+            self._key("open"), self._key("tripped"), self._key("window"), self._key("probe")
+        )
+
+    def call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        is_open, is_half_open = self._state()
+        if is_open:
+            raise CircuitOpenError(self.name)
+
+        if is_half_open:
+            redis_client = CacheHelper.get_redis_client()
+            if not redis_client.set(self._key("probe"), 1, nx=True, ex=self.probe_timeout):
+                raise CircuitOpenError(self.name)
+            try:
+                result = func(*args, **kwargs)
+            except self.expected_exceptions:
+                self._trip()
+                raise
+            logger.info("Circuit %s closed", self.name)
+            self.reset()
+            return result
+
+        try:
+            result = func(*args, **kwargs)
+        except self.expected_exceptions:
+            self._record(success=False)
+            raise
+        self._record(success=True)
+        return result
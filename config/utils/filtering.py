@@ -1,86 +1,184 @@
-from django.db.models import Q, QuerySet
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Tuple, TypeVar
+
+from django.db.models import ForeignKey, ManyToOneRel, Model, Q, QuerySet
 from django.http import HttpRequest
 
 from orders.models import Order
 from users.models import User
 
+ModelT = TypeVar('ModelT', bound=Model)
+
+# TossPaymentService.generate_order_id() 형식 (ORD-YYYYmmddHHMMSS-XXXXXX)
+ORDER_ID_PATTERN = re.compile(r'^ORD-\d{14}-[0-9A-F]{6}$', re.IGNORECASE)
+ORDER_ID_PREFIX_PATTERN = re.compile(r'^ORD-', re.IGNORECASE)
+EMAIL_PATTERN = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+
+@dataclass(frozen=True)
+class SearchGroup:
+    """
+    한 테이블에서 검색어를 icontains 로 찾는 필드 묶음 (각 필드는 UPPER(col) gin_trgm_ops 인덱스를 가진다).
+    via 가 있으면 해당 관계의 모델에서 먼저 찾고 FK 로 연결한다.
+    """
+    fields: Tuple[str, ...]
+    via: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ExactMatch:
+    """검색어가 pattern 에 맞으면 trigram 검색 대신 유일/패턴 인덱스 조회로 바로 처리"""
+    pattern: re.Pattern[str]
+    lookup: str
+    normalize: Callable[[str], str] = str
+
+
+@dataclass(frozen=True)
+class FilterSpec:
+    search: Tuple[SearchGroup, ...]
+    exact_matches: Tuple[ExactMatch, ...] = ()
+    choice_param: Optional[str] = None
+    choice_field: Optional[str] = None
+    default_choice: Optional[str] = None
+    ordering: Tuple[str, ...] = ('-created_at',)
+
+
+class FilterEngine:
+    """FilterSpec 으로 관리자 목록의 검색/상태 필터 쿼리를 만든다"""
 
-class Filtering:
     @staticmethod
-    def user_list_filter(request: HttpRequest) -> QuerySet[User]:
-        q = (request.GET.get("q") or "").strip()
-        role = (request.GET.get("role") or "").strip()
+    def _group_condition(group: SearchGroup, q: str) -> Q:
+        condition = Q()
+        for name in group.fields:
+            condition |= Q(**{f'{name}__icontains': q})
+        return condition
 
-        users_qs = User.objects.all().order_by("-date_joined")
+    @staticmethod
+    def _group_pks(queryset: QuerySet[ModelT], group: SearchGroup, q: str) -> QuerySet[Any, Any]:
+        model = queryset.model
+        condition = FilterEngine._group_condition(group, q)
+        if group.via is None:
+            return model._default_manager.filter(condition).values('pk')
+
+        relation = model._meta.get_field(group.via)
+        related_model = relation.related_model
+        if not (isinstance(related_model, type) and issubclass(related_model, Model)):
+            raise ValueError(f"'{group.via}' 관계의 모델을 찾을 수 없습니다.")
+        if isinstance(relation, ForeignKey):
+            # user_id IN (SELECT id FROM users WHERE ...)
+            related_pks = related_model._default_manager.filter(condition).values('pk')
+            return model._default_manager.filter(**{f'{group.via}__in': related_pks}).values('pk')
+        if isinstance(relation, ManyToOneRel):
+            # 역방향 FK (order.items): SELECT order_id FROM order_items WHERE ...
+            return related_model._default_manager.filter(condition).values(relation.field.attname)
+        raise ValueError(f"'{group.via}' 은(는) FK 또는 역방향 FK 관계가 아닙니다.")
 
-        if q:
-            users_qs = users_qs.filter(
-                Q(email__icontains=q)
-                | Q(username__icontains=q)
-                | Q(first_name__icontains=q)
-                | Q(last_name__icontains=q)
-                | Q(phone_number__icontains=q)
-            )
-        if role:
-            users_qs = users_qs.filter(role=role)
-
-        return users_qs
+    @staticmethod
+    def search(queryset: QuerySet[ModelT], spec: FilterSpec, q: str) -> QuerySet[ModelT]:
+        for exact_match in spec.exact_matches:
+            if exact_match.pattern.match(q):
+                return queryset.filter(**{exact_match.lookup: exact_match.normalize(q)})
+
+        if len(spec.search) == 1 and spec.search[0].via is None:
+            # 같은 테이블의 OR 는 trigram 인덱스 BitmapOr 로 처리된다
+            return queryset.filter(FilterEngine._group_condition(spec.search[0], q))
+
+        # 테이블을 넘나드는 OR 는 인덱스를 쓰지 못하므로 테이블별로 인덱스를 타는 pk 목록을 UNION 한다
+        branches = [FilterEngine._group_pks(queryset, group, q) for group in spec.search]
+        return queryset.filter(pk__in=branches[0].union(*branches[1:]))
 
     @staticmethod
-    def order_list_filter(request: HttpRequest) -> QuerySet[Order]:
+    def apply(queryset: QuerySet[ModelT], spec: FilterSpec, request: HttpRequest) -> QuerySet[ModelT]:
         q = (request.GET.get("q") or "").strip()
-        status = (request.GET.get("status") or "").strip()
-
-        orders_qs = Order.objects.select_related("user").prefetch_related("items").order_by("-created_at")
+        queryset = queryset.order_by(*spec.ordering)
 
         if q:
-            orders_qs = orders_qs.filter(
-                Q(order_id__icontains=q)
-                | Q(user__email__icontains=q)
-                | Q(user__username__icontains=q)
-                | Q(product_name__icontains=q)
-            )
-        if status:
-            orders_qs = orders_qs.filter(status=status)
-        else:
-            orders_qs = orders_qs.filter(status="PAID")
-
-        return orders_qs
-    
+            queryset = FilterEngine.search(queryset, spec, q)
+
+        if spec.choice_param and spec.choice_field:
+            choice = (request.GET.get(spec.choice_param) or "").strip() or spec.default_choice
+            if choice:
+                queryset = queryset.filter(**{spec.choice_field: choice})
+
+        return queryset
+
+
+ORDER_EXACT_MATCHES = (
+    ExactMatch(ORDER_ID_PATTERN, 'order_id', normalize=str.upper),
+    # unique 컬럼에 함께 생성되는 varchar_pattern_ops(_like) 인덱스로 prefix 조회
+    ExactMatch(ORDER_ID_PREFIX_PATTERN, 'order_id__startswith', normalize=str.upper),
+    # UPPER(email) btree 인덱스 (users_email_upper_idx)
+    ExactMatch(EMAIL_PATTERN, 'user__email__iexact'),
+)
+ORDER_SEARCH = (
+    SearchGroup(fields=('order_id', 'product_name')),
+    SearchGroup(fields=('email', 'username'), via='user'),
+)
+
+USER_LIST_SPEC = FilterSpec(
+    search=(SearchGroup(fields=('email', 'username', 'first_name', 'last_name', 'phone_number')),),
+    exact_matches=(ExactMatch(EMAIL_PATTERN, 'email__iexact'),),
+    choice_param='role',
+    choice_field='role',
+    ordering=('-date_joined',),
+)
+ORDER_LIST_SPEC = FilterSpec(
+    search=ORDER_SEARCH,
+    exact_matches=ORDER_EXACT_MATCHES,
+    choice_param='status',
+    choice_field='status',
+    default_choice='PAID',
+)
+SHIPPING_LIST_SPEC = FilterSpec(
+    search=(*ORDER_SEARCH, SearchGroup(fields=('product_name',), via='items')),
+    exact_matches=ORDER_EXACT_MATCHES,
+    choice_param='shipping_status',
+    choice_field='shipping_status',
+)
+CANCELLATION_LIST_SPEC = FilterSpec(
+    search=ORDER_SEARCH,
+    exact_matches=ORDER_EXACT_MATCHES,
+    choice_param='status',
+    choice_field='cancellation_request_status',
+    ordering=('-cancellation_requested_at',),
+)
+EXCHANGE_REFUND_LIST_SPEC = FilterSpec(
+    search=ORDER_SEARCH,
+    exact_matches=ORDER_EXACT_MATCHES,
+    choice_param='status',
+    choice_field='exchange_refund_request_status',
+    ordering=('-exchange_refund_requested_at',),
+)
+
+
+class Filtering:
     @staticmethod
-    def cancellation_list_filter(request: HttpRequest) -> QuerySet[Order]:
-        q = (request.GET.get("q") or "").strip()
-        status = (request.GET.get("status") or "").strip()
+    def user_list_filter(request: HttpRequest) -> QuerySet[User]:
+        return FilterEngine.apply(User.objects.all(), USER_LIST_SPEC, request)
 
-        orders_qs = Order.objects.filter(cancellation_request_status__in=["PENDING", "APPROVED", "REJECTED"]).select_related("user").prefetch_related("items").order_by("-cancellation_requested_at")
+    @staticmethod
+    def order_list_filter(request: HttpRequest) -> QuerySet[Order]:
+        orders_qs = Order.objects.select_related("user").prefetch_related("items")
+        return FilterEngine.apply(orders_qs, ORDER_LIST_SPEC, request)
 
-        if q:
-            orders_qs = orders_qs.filter(
-                Q(order_id__icontains=q)
-                | Q(user__email__icontains=q)
-                | Q(user__username__icontains=q)
-                | Q(product_name__icontains=q)
-            )
-        if status:
-            orders_qs = orders_qs.filter(cancellation_request_status=status)
-
-        return orders_qs
-    
     @staticmethod
-    def exchange_refund_list_filter(request: HttpRequest) -> QuerySet[Order]:
-        q = (request.GET.get("q") or "").strip()
-        status = (request.GET.get("status") or "").strip()
+    def shipping_list_filter(request: HttpRequest) -> QuerySet[Order]:
+        orders_qs = Order.objects.filter(status="PAID").select_related("user").prefetch_related("items")
+        return FilterEngine.apply(orders_qs, SHIPPING_LIST_SPEC, request)
 
-        orders_qs = Order.objects.filter(exchange_refund_request_status__in=["PENDING", "APPROVED", "REJECTED"]).select_related("user").prefetch_related("items").order_by("-exchange_refund_requested_at")
+    @staticmethod
+    def cancellation_list_filter(request: HttpRequest) -> QuerySet[Order]:
+        orders_qs = Order.objects.filter(
+            cancellation_request_status__in=["PENDING", "APPROVED", "REJECTED"],
+            cancellation_requested_at__isnull=False,
+        ).select_related("user").prefetch_related("items")
+        return FilterEngine.apply(orders_qs, CANCELLATION_LIST_SPEC, request)
 
-        if q:
-            orders_qs = orders_qs.filter(
-                Q(order_id__icontains=q)
-                | Q(user__email__icontains=q)
-                | Q(user__username__icontains=q)
-                | Q(product_name__icontains=q)
-            )
-        if status:
-            orders_qs = orders_qs.filter(exchange_refund_request_status=status)
-
-        return orders_qs
\ No newline at end of file
+    @staticmethod
+    def exchange_refund_list_filter(request: HttpRequest) -> QuerySet[Order]:
+        orders_qs = Order.objects.filter(
+            exchange_refund_request_status__in=["PENDING", "APPROVED", "REJECTED"],
+            exchange_refund_requested_at__isnull=False,
+        ).select_related("user").prefetch_related("items")
+        return FilterEngine.apply(orders_qs, EXCHANGE_REFUND_LIST_SPEC, request)
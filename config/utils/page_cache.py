@@ -0,0 +1,113 @@
+import hashlib
+import time
+from typing import Dict, Iterable, List, Optional, Tuple, cast
+
+from django.core.cache import cache as django_cache
+from django.db import transaction
+from django.http import HttpRequest, HttpResponse
+from django.middleware.csrf import get_token
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+from config.utils.cache_helper import CacheHelper
+
+PAGE_VERSION_PREFIX = 'page:version'
+# 버전 키 자체는 만료되지 않도록 길게 유지 (만료되면 새 버전으로 다시 시작할 뿐이다)
+PAGE_VERSION_TIMEOUT = 60 * 60 * 24 * 30
+# 버전이 키에 포함되므로 무효화는 버전 변경으로 처리하고 TTL 은 메모리 회수용
+FRAGMENT_CACHE_TIMEOUT = 60 * 60
+
+CATALOG_SCOPE = 'catalog'
+
+
+def product_scope(product_id: int) -> str:
+    return f'product:{product_id}'
+
+
+def product_reviews_scope(product_id: int) -> str:
+    return f'reviews:product:{product_id}'
+
+
+class PageCacheVersion:
+    """
+    페이지/프래그먼트 캐시 키에 들어가는 scope 별 버전.
+    버전 값은 마지막으로 변경된 시각(epoch 초)이라 ETag 와 Last-Modified 를 함께 만들 수 있다.
+    """
+
+    @staticmethod
+    def _key(scope: str) -> str:
+        return django_cache.make_key(f'{PAGE_VERSION_PREFIX}:{scope}')
+
+    @staticmethod
+    def get_many(scopes: Iterable[str]) -> Dict[str, float]:
+        scopes = list(scopes)
+        redis_client = CacheHelper.get_redis_client()
+        values = cast(List[Optional[bytes]], redis_client.mget([PageCacheVersion._key(scope) for scope in scopes]))
+
+        versions: Dict[str, float] = {}
+        missing: List[str] = []
+        for scope, value in zip(scopes, values):
+            if value is None:
+                missing.append(scope)
+            else:
+                versions[scope] = float(value)
+
+        if missing:
+            # 처음 조회되는 scope 는 현재 시각으로 시작 (동시에 들어온 요청과 같은 값을 쓰도록 NX)
+            now = time.time()
+            pipeline = redis_client.pipeline(transaction=False)
+            for scope in missing:
+                pipeline.set(PageCacheVersion._key(scope), repr(now), nx=True, ex=PAGE_VERSION_TIMEOUT)
+            pipeline.mget([PageCacheVersion._key(scope) for scope in missing])
+            for scope, value in zip(missing, pipeline.execute()[-1]):
+                versions[scope] = float(value) if value is not None else now
+
+        return versions
+
+    @staticmethod
+    def _bump_now(scopes: List[str]) -> None:
+        now = repr(time.time())
+        pipeline = CacheHelper.get_redis_client().pipeline(transaction=False)
+        for scope in scopes:
+            pipeline.set(PageCacheVersion._key(scope), now, ex=PAGE_VERSION_TIMEOUT)
+        pipeline.execute()
+
+    @staticmethod
+    def bump(*scopes: str) -> None:
+        scope_list = list(scopes)
+        if not scope_list:
+            return
+        PageCacheVersion._bump_now(scope_list)
+        # 트랜잭션 안이라면 커밋 전에 이전 데이터로 다시 캐시될 수 있으므로 커밋 후 한 번 더 올린다
+        if transaction.get_connection().in_atomic_block:
+            transaction.on_commit(lambda: PageCacheVersion._bump_now(scope_list))
+
+
+def build_page_validators(request: HttpRequest, versions: Dict[str, float], *parts: object) -> Tuple[str, float]:
+    """요청 경로 + scope 버전 + CSRF 토큰 + 추가 값으로 (ETag, Last-Modified epoch) 를 만든다"""
+    # 페이지에 {% csrf_token %} 이 렌더링되므로 로그인/로그아웃으로 토큰이 바뀌면 304 로 이전 페이지를 재사용하면 안 된다.
+    # 쿠키가 없는 첫 요청도 이번 응답에서 발급할 토큰으로 ETag 를 만들도록 먼저 토큰을 확정한다
+    get_token(request)
+    payload = '|'.join([
+        request.get_full_path(),
+        *[f'{scope}={versions[scope]!r}' for scope in sorted(versions)],
+        *[str(part) for part in parts],
+        request.META.get('CSRF_COOKIE') or '',
+    ])
+    etag = quote_etag(hashlib.sha1(payload.encode('utf-8')).hexdigest())
+    last_modified = max(versions.values()) if versions else time.time()
+    return etag, last_modified
+
+
+def get_not_modified_response(request: HttpRequest, etag: str, last_modified: float) -> Optional[HttpResponse]:
+    """If-None-Match / If-Modified-Since 가 일치하면 304 응답, 아니면 None"""
+    return get_conditional_response(request, etag=etag, last_modified=int(last_modified))
+
+
+def patch_page_validators(response: HttpResponse, etag: str, last_modified: float) -> HttpResponse:
+    # 페이지에 방문자별 CSRF 토큰이 있으므로 공유 캐시에는 저장하지 않고 브라우저가 매번 재검증하게 한다
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(int(last_modified))
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
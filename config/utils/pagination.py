@@ -0,0 +1,175 @@
+import base64
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
+from django.db.models import Field, Model, Q, QuerySet
+
+from config.utils.cache_helper import CacheHelper
+
+DEFAULT_ORDERING = ('-created_at', '-id')
+# 필터된 목록의 전체 건수는 짧게 캐시해서 페이지를 넘길 때마다 COUNT(*) 하지 않는다
+TOTAL_CACHE_TIMEOUT = 60
+# 통계가 이 이상인 테이블만 pg_class.reltuples 추정치를 쓴다 (작은 테이블은 COUNT 도 충분히 빠르다)
+APPROXIMATE_TOTAL_THRESHOLD = 10000
+
+ModelT = TypeVar('ModelT', bound=Model)
+
+
+@dataclass
+class KeysetPage(Generic[ModelT]):
+    object_list: List[ModelT]
+    next_cursor: Optional[str]
+    previous_cursor: Optional[str]
+    total: Optional[int] = None
+    total_is_approximate: bool = False
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+    def __iter__(self) -> Iterator[ModelT]:
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+
+class KeysetPaginator(Generic[ModelT]):
+    """
+    정렬 키 튜플(기본 (created_at, id)) 기준 seek 페이지네이션.
+    OFFSET 없이 커서 다음 행부터 인덱스를 타고 읽으므로 N 번째 페이지도 첫 페이지와 비용이 같다.
+    커서는 방향과 정렬 키 값을 담은 불투명한 문자열이며, 잘못된 커서는 ValueError.
+    정렬 키는 모델의 NULL 이 아닌 컬럼이어야 하고, 유일성을 위해 id 가 없으면 마지막에 붙인다.
+    """
+
+    def __init__(
+        self,
+        queryset: QuerySet[ModelT],
+        ordering: Sequence[str] = DEFAULT_ORDERING,
+        per_page: int = 20,
+        with_total: bool = False,
+        approximate_total: bool = False,
+        total_cache_key: Optional[str] = None,
+    ) -> None:
+        self.queryset = queryset
+        self.per_page = per_page
+        self.with_total = with_total or approximate_total or total_cache_key is not None
+        self.approximate_total = approximate_total
+        self.total_cache_key = total_cache_key
+
+        ordering = list(ordering)
+        if not any(name.lstrip('-') in ('id', 'pk') for name in ordering):
+            ordering.append('-id' if ordering and ordering[-1].startswith('-') else 'id')
+        self.ordering: List[Tuple[str, bool]] = [(name.lstrip('-'), name.startswith('-')) for name in ordering]
+        self.fields: List["Field[Any, Any]"] = [self._get_field(name) for name, _ in self.ordering]
+
+    def _get_field(self, name: str) -> "Field[Any, Any]":
+        opts = self.queryset.model._meta
+        field = opts.pk if name == 'pk' else opts.get_field(name)
+        # 역참조/GenericForeignKey 는 컬럼 값이 없으므로 정렬 키로 쓸 수 없다
+        if not isinstance(field, Field):
+            raise ValueError(f"'{name}' 은(는) 정렬 키로 사용할 수 없는 필드입니다.")
+        return field
+
+    def _encode_cursor(self, direction: str, obj: ModelT) -> str:
+        values = [getattr(obj, field.attname) for field in self.fields]
+        payload = json.dumps([direction, values], cls=DjangoJSONEncoder, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+    def _decode_cursor(self, cursor: str) -> Tuple[bool, List[Any]]:
+        try:
+            direction, raw_values = cast(
+                Tuple[str, List[Any]], json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+            )
+            if direction not in ('n', 'p') or len(raw_values) != len(self.fields):
+                raise ValueError(cursor)
+            values = [field.to_python(value) for field, value in zip(self.fields, raw_values)]
+        except Exception as e:
+            raise ValueError("잘못된 커서입니다.") from e
+        return direction == 'n', values
+
+    def cursor_after(self, obj: ModelT) -> str:
+        """obj 다음 행부터 시작하는 커서"""
+        return self._encode_cursor('n', obj)
+
+    def _seek_filter(self, values: List[Any], forward: bool) -> Q:
+        # (a, b, c) > (x, y, z) 를 a > x OR (a = x AND b > y) OR ... 로 풀어서 컬럼별 정렬 방향을 반영
+        condition = Q()
+        for index, (name, descending) in enumerate(self.ordering):
+            lookup = 'lt' if descending == forward else 'gt'
+            equals = {self.ordering[i][0]: values[i] for i in range(index)}
+            condition |= Q(**equals, **{f'{name}__{lookup}': values[index]})
+        return condition
+
+    def _estimate_rows(self) -> int:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [self.queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        # 한 번도 ANALYZE 되지 않은 테이블은 -1
+        return int(row[0]) if row else -1
+
+    def get_total(self) -> Tuple[int, bool]:
+        """(전체 건수, 추정치 여부)"""
+        if self.approximate_total and not self.queryset.query.has_filters():
+            estimate = self._estimate_rows()
+            if estimate >= APPROXIMATE_TOTAL_THRESHOLD:
+                return estimate, True
+
+        if self.total_cache_key is None:
+            return self.queryset.count(), False
+
+        digest = hashlib.md5(self.total_cache_key.encode('utf-8')).hexdigest()
+        total: int = CacheHelper.get_or_compute(
+            f'pagination:total:{digest}',
+            self.queryset.count,
+            ttl=TOTAL_CACHE_TIMEOUT,
+        )
+        return total, False
+
+    def get_page(self, cursor: Optional[str] = None) -> KeysetPage[ModelT]:
+        forward = True
+        queryset = self.queryset
+        if cursor:
+            forward, values = self._decode_cursor(cursor)
+            queryset = queryset.filter(self._seek_filter(values, forward))
+
+        # 이전 페이지는 정렬을 뒤집어 읽은 뒤 다시 뒤집는다
+        ordering = [f'-{name}' if descending == forward else name for name, descending in self.ordering]
+        # 한 건 더 읽어서 다음(이전) 페이지 존재 여부를 판단
+        items = list(queryset.order_by(*ordering)[:self.per_page + 1])
+        has_more = len(items) > self.per_page
+        items = items[:self.per_page]
+
+        if forward:
+            next_cursor = self._encode_cursor('n', items[-1]) if has_more else None
+            previous_cursor = self._encode_cursor('p', items[0]) if cursor and items else None
+        else:
+            items.reverse()
+            previous_cursor = self._encode_cursor('p', items[0]) if has_more else None
+            next_cursor = self._encode_cursor('n', items[-1]) if items else None
+
+        page: KeysetPage[ModelT] = KeysetPage(object_list=items, next_cursor=next_cursor, previous_cursor=previous_cursor)
+        if self.with_total:
+            page.total, page.total_is_approximate = self.get_total()
+        return page
@@ -0,0 +1,148 @@
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+from django.db import transaction
+
+from config.utils.cache_helper import CacheHelper
+
+logger = logging.getLogger(__name__)
+
+LOCAL_CACHE_MAX_ENTRIES = 256
+# pub/sub 메시지를 놓치더라도 로컬 값이 이 시간 이상 남지 않도록 한다
+LOCAL_CACHE_TTL = 60
+INVALIDATION_CHANNEL = 'cache:invalidate'
+INVALIDATE_ALL = '*'
+
+
+class LocalLRUCache:
+    """프로세스 내부의 크기 제한 LRU 캐시 (항목별 TTL)"""
+
+    def __init__(self, max_entries: int = LOCAL_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return False, None
+
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return False, None
+
+            self._data.move_to_end(key)
+            return True, value
+
+    def set(self, key: str, value: Any, timeout: int) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + timeout, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class TieredCache:
+    """
+    로컬 LRU -> Redis(CacheHelper) -> compute 순서로 조회하는 2단 캐시.
+    무효화는 Redis pub/sub 으로 모든 워커에 전파된다.
+    구독은 enable_subscriber() 를 호출한 웹 워커에서만 하며, 그 밖의 프로세스(관리 명령, 테스트)의
+    로컬 값은 LOCAL_CACHE_TTL 이 지나면 만료된다.
+    거의 바뀌지 않는 작은 참조 데이터(색상, 카테고리 메뉴 등) 전용.
+    """
+
+    _local = LocalLRUCache()
+    _subscribe = False
+    _subscriber_pid: Optional[int] = None
+    _subscriber_lock = threading.Lock()
+
+    @staticmethod
+    def _listen() -> None:
+        try:
+            # redis-py 의 pubsub() 는 타입 주석이 없다
+            pubsub = CacheHelper.get_redis_client().pubsub(ignore_subscribe_messages=True)  # type: ignore[no-untyped-call]
+            pubsub.subscribe(INVALIDATION_CHANNEL)
+            for message in pubsub.listen():
+                key = message.get('data')
+                if isinstance(key, bytes):
+                    key = key.decode('utf-8')
+                if key == INVALIDATE_ALL:
+                    TieredCache._local.clear()
+                elif key:
+                    TieredCache._local.delete(key)
+        except Exception:
+            logger.exception("캐시 무효화 구독이 중단되었습니다.")
+            TieredCache._subscriber_pid = None
+
+    @staticmethod
+    def enable_subscriber() -> None:
+        """WSGI/ASGI 진입점에서 호출. 스레드는 fork 이후 첫 조회 때 워커마다 띄운다."""
+        TieredCache._subscribe = True
+
+    @staticmethod
+    def _ensure_subscriber() -> None:
+        # gunicorn fork 이후 워커마다 한 번씩 구독 스레드를 띄운다
+        pid = os.getpid()
+        if not TieredCache._subscribe or TieredCache._subscriber_pid == pid:
+            return
+
+        with TieredCache._subscriber_lock:
+            if TieredCache._subscriber_pid == pid:
+                return
+            TieredCache._local.clear()
+            thread = threading.Thread(target=TieredCache._listen, name='cache-invalidation', daemon=True)
+            thread.start()
+            TieredCache._subscriber_pid = pid
+
+    @staticmethod
+    def get_or_compute(
+        key: str,
+        compute: Callable[[], Any],
+        ttl: int,
+        stale_ttl: int = 0,
+        beta: float = 1.0,
+        build: Optional[Callable[[Any], Any]] = None,
+        local_ttl: int = LOCAL_CACHE_TTL,
+    ) -> Any:
+        """
+        compute 는 Redis 에 저장할 JSON 직렬화 가능한 값을 반환하고,
+        build 가 주어지면 그 값을 로컬에 보관할 객체로 변환한다.
+        stale_ttl/beta 는 CacheHelper.get_or_compute 에 그대로 전달된다.
+        """
+        TieredCache._ensure_subscriber()
+
+        found, value = TieredCache._local.get(key)
+        if found:
+            return value
+
+        data = CacheHelper.get_or_compute(key, compute, ttl=ttl, stale_ttl=stale_ttl, beta=beta)
+        value = build(data) if build is not None else data
+        TieredCache._local.set(key, value, local_ttl)
+        return value
+
+    @staticmethod
+    def _invalidate_now(key: str) -> None:
+        TieredCache._local.delete(key)
+        CacheHelper.delete(key)
+        CacheHelper.get_redis_client().publish(INVALIDATION_CHANNEL, key)
+
+    @staticmethod
+    def invalidate(key: str) -> None:
+        TieredCache._invalidate_now(key)
+        # 트랜잭션 안이라면 커밋 전에 다른 워커가 이전 데이터로 캐시를 다시 채웠을 수 있으므로 커밋 후 한 번 더 무효화
+        if transaction.get_connection().in_atomic_block:
+            transaction.on_commit(lambda: TieredCache._invalidate_now(key))
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class FavoriteConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'favorites'
+
+    def ready(self) -> None:
+        import favorites.signals  # noqa: F401
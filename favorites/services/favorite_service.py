@@ -1,9 +1,12 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 
+from config.utils.cache_helper import CacheHelper
 from favorites.models import Favorite
 from products.models import Product
 from users.models import User
 
+FAVORITE_PRODUCTS_CACHE_TIMEOUT = 60 * 10
+
 
 class FavoriteService:
     @staticmethod
@@ -151,10 +154,24 @@ class FavoriteService:
     def get_user_favorites(user: User) -> Any:
         return Favorite.objects.filter(user=user, is_active=True).select_related('product')
     
+    @staticmethod
+    def _favorite_products_cache_key(user_id: int) -> str:
+        return f"favorites:user:{user_id}:products"
+
+    @staticmethod
+    def get_favorite_product_ids(user: User) -> List[int]:
+        # 상품 페이지의 찜 상태는 사용자별 찜 목록 ID 를 캐시해서 확인 (찜 변경 시 시그널로 무효화)
+        product_ids: List[int] = CacheHelper.get_or_compute(
+            FavoriteService._favorite_products_cache_key(user.id),
+            lambda: list(Favorite.objects.filter(user=user, is_active=True).values_list('product_id', flat=True)),
+            ttl=FAVORITE_PRODUCTS_CACHE_TIMEOUT,
+        )
+        return product_ids
+
+    @staticmethod
+    def invalidate_favorite_products(user_id: int) -> None:
+        CacheHelper.delete(FavoriteService._favorite_products_cache_key(user_id))
+
     @staticmethod
     def is_product_favorited(user: User, product_id: int) -> bool:
-        return Favorite.objects.filter(
-            user=user, 
-            product_id=product_id, 
-            is_active=True
-        ).exists()
+        return product_id in FavoriteService.get_favorite_product_ids(user)
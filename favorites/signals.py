@@ -0,0 +1,17 @@
+from typing import Any
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from favorites.models import Favorite
+from favorites.services.favorite_service import FavoriteService
+
+
+@receiver(post_save, sender=Favorite)
+@receiver(post_delete, sender=Favorite)
+def invalidate_favorite_products(sender: type[Favorite], instance: Favorite, **kwargs: Any) -> None:
+    user_id = instance.user_id
+    FavoriteService.invalidate_favorite_products(user_id)
+    # 커밋 전에 다른 요청이 이전 찜 목록으로 다시 캐시했을 수 있으므로 커밋 후 한 번 더 삭제
+    transaction.on_commit(lambda: FavoriteService.invalidate_favorite_products(user_id))
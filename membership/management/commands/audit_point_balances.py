@@ -0,0 +1,35 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from membership.services.point_service import PointService
+
+
+class Command(BaseCommand):
+    help = 'Compare UserPointBalance rows with the sum of the UserPoint history'
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            '--user-id',
+            type=int,
+            action='append',
+            dest='user_ids',
+            help='Only audit the given user (repeatable)',
+        )
+        parser.add_argument(
+            '--fix',
+            action='store_true',
+            help='Overwrite mismatched balances with the history total',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        mismatches = PointService.audit(options['user_ids'], fix=options['fix'])
+        for user_id, stored, actual in mismatches:
+            self.stdout.write(f'user {user_id}: balance {stored}, history {actual}')
+
+        if not mismatches:
+            self.stdout.write(self.style.SUCCESS('All point balances match the history'))
+        elif options['fix']:
+            self.stdout.write(self.style.SUCCESS(f'Fixed {len(mismatches)} point balances'))
+        else:
+            self.stdout.write(self.style.WARNING(f'Found {len(mismatches)} mismatched point balances'))
@@ -0,0 +1,35 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Sum
+
+
+def backfill_point_balances(apps, schema_editor):  # type: ignore[no-untyped-def]
+    UserPoint = apps.get_model('membership', 'UserPoint')
+    UserPointBalance = apps.get_model('membership', 'UserPointBalance')
+
+    rows = UserPoint.objects.values('user_id').annotate(balance=Sum('amount')).order_by('user_id')
+    UserPointBalance.objects.bulk_create([UserPointBalance(**row) for row in rows], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('membership', '0003_change_used_at_to_nullable'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserPointBalance',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='point_balance', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('balance', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'user_point_balance',
+            },
+        ),
+        migrations.RunPython(backfill_point_balances, migrations.RunPython.noop),
+    ]
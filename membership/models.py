@@ -1,7 +1,6 @@
-from typing import TYPE_CHECKING, Any, Optional, cast
+from typing import TYPE_CHECKING, Any
 
 from django.db import models
-from django.db.models import Sum
 from django.utils import timezone
 
 from config.basemodel import BaseModel
@@ -61,8 +60,18 @@ class UserPoint(BaseModel):
 
     @staticmethod
     def get_user_balance(user: "User") -> int:
-        total = cast(
-            Optional[int],
-            UserPoint.objects.filter(user=user).aggregate(total=Sum("amount"))["total"],
-        )
-        return total or 0
\ No newline at end of file
+        balance = UserPointBalance.objects.filter(user=user).values_list("balance", flat=True).first()
+        return balance or 0
+
+
+class UserPointBalance(models.Model):
+    """
+    사용자별 현재 포인트 잔액.
+    PointService 가 UserPoint 내역 추가와 같은 트랜잭션에서 행을 잠그고 갱신한다. (audit_point_balances 명령으로 검증)
+    """
+    user = models.OneToOneField("users.User", on_delete=models.CASCADE, primary_key=True, related_name="point_balance")
+    balance = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "user_point_balance"
@@ -0,0 +1,83 @@
+from typing import List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Sum
+
+from membership.models import UserPoint, UserPointBalance
+from orders.models import Order
+from users.models import User
+
+
+class PointService:
+    @staticmethod
+    def _lock_balance(user_id: int) -> UserPointBalance:
+        # 첫 내역이면 잔액 행을 먼저 만들고, 같은 사용자의 동시 적립/사용은 행 잠금으로 직렬화한다
+        UserPointBalance.objects.bulk_create([UserPointBalance(user_id=user_id)], ignore_conflicts=True)
+        return UserPointBalance.objects.select_for_update().get(user_id=user_id)
+
+    @staticmethod
+    def record(
+        user: User,
+        point_type: str,
+        amount: int,
+        description: Optional[str] = None,
+        related_order: Optional[Order] = None,
+    ) -> UserPoint:
+        """포인트 내역 추가와 잔액 갱신을 한 트랜잭션에서 처리 (사용은 음수 amount)"""
+        with transaction.atomic():
+            balance = PointService._lock_balance(user.id)
+            if balance.balance + amount < 0:
+                raise ValueError("보유 포인트가 부족합니다.")
+
+            balance.balance += amount
+            balance.save(update_fields=["balance", "updated_at"])
+            return UserPoint.objects.create(
+                user=user,
+                point_type=point_type,
+                amount=amount,
+                description=description,
+                balance_after=balance.balance,
+                related_order=related_order,
+            )
+
+    @staticmethod
+    def earn(user: User, amount: int, description: Optional[str] = None, related_order: Optional[Order] = None) -> UserPoint:
+        return PointService.record(user, UserPoint.PointType.EARN, amount, description, related_order)
+
+    @staticmethod
+    def use(user: User, amount: int, description: Optional[str] = None, related_order: Optional[Order] = None) -> UserPoint:
+        return PointService.record(user, UserPoint.PointType.USE, -amount, description, related_order)
+
+    @staticmethod
+    def audit(user_ids: Optional[List[int]] = None, fix: bool = False) -> List[Tuple[int, int, int]]:
+        """
+        잔액 행과 내역 합계를 비교해 (user_id, 저장된 잔액, 내역 합계) 목록을 반환한다.
+        잔액 행을 먼저 잠그므로 검사 중에는 같은 사용자의 적립/사용이 대기한다.
+        """
+        with transaction.atomic():
+            balances = UserPointBalance.objects.select_for_update().order_by("user_id")
+            points = UserPoint.objects.all()
+            if user_ids is not None:
+                balances = balances.filter(user_id__in=user_ids)
+                points = points.filter(user_id__in=user_ids)
+
+            stored = {balance.user_id: balance.balance for balance in balances}
+            actual = {
+                row["user_id"]: row["total"]
+                for row in points.values("user_id").annotate(total=Sum("amount")).order_by("user_id")
+            }
+
+            mismatches = [
+                (user_id, stored.get(user_id, 0), actual.get(user_id, 0))
+                for user_id in sorted(set(stored) | set(actual))
+                if stored.get(user_id, 0) != actual.get(user_id, 0)
+            ]
+            if fix and mismatches:
+                UserPointBalance.objects.bulk_create(
+                    [UserPointBalance(user_id=user_id, balance=total) for user_id, _, total in mismatches],
+                    update_conflicts=True,
+                    unique_fields=["user"],
+                    update_fields=["balance", "updated_at"],
+                    batch_size=1000,
+                )
+        return mismatches
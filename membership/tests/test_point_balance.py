@@ -0,0 +1,55 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from config.utils.setup_test_method import TestSetupMixin
+from membership.models import UserPoint, UserPointBalance
+from membership.services.point_service import PointService
+
+
+@pytest.mark.django_db
+class TestPointBalance(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+
+    def test_earn_and_use_update_balance(self) -> None:
+        PointService.earn(self.customer_user, 1000, description="적립")
+        point = PointService.use(self.customer_user, 300, description="사용")
+
+        assert point.amount == -300
+        assert point.balance_after == 700
+        assert UserPoint.get_user_balance(self.customer_user) == 700
+
+    def test_balance_without_history(self) -> None:
+        assert UserPoint.get_user_balance(self.customer_user) == 0
+
+    def test_insufficient_balance(self) -> None:
+        PointService.earn(self.customer_user, 100)
+
+        with pytest.raises(ValueError):
+            PointService.use(self.customer_user, 500)
+
+        assert UserPoint.objects.filter(user=self.customer_user).count() == 1
+        assert UserPoint.get_user_balance(self.customer_user) == 100
+
+    def test_balance_read_single_query(self, django_assert_num_queries) -> None:  # type: ignore[no-untyped-def]
+        PointService.earn(self.customer_user, 1000)
+
+        with django_assert_num_queries(1):
+            assert UserPoint.get_user_balance(self.customer_user) == 1000
+
+    def test_audit_command_fixes_drift(self) -> None:
+        PointService.earn(self.customer_user, 1000)
+        UserPointBalance.objects.filter(user=self.customer_user).update(balance=5000)
+
+        out = StringIO()
+        call_command('audit_point_balances', stdout=out)
+
+        assert f'user {self.customer_user.id}: balance 5000, history 1000' in out.getvalue()
+        assert UserPoint.get_user_balance(self.customer_user) == 5000
+
+        call_command('audit_point_balances', '--fix', stdout=StringIO())
+
+        assert UserPoint.get_user_balance(self.customer_user) == 1000
+        assert PointService.audit() == []
@@ -0,0 +1,34 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from orders.services.order_stats import OrderStatsService
+
+
+class Command(BaseCommand):
+    help = 'Reconcile OrderStats counters with the orders table'
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            '--user-id',
+            type=int,
+            action='append',
+            dest='user_ids',
+            help='Only reconcile the given user (repeatable)',
+        )
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Report drift without updating the counters',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        drifts = OrderStatsService.reconcile(options['user_ids'], fix=not options['check'])
+        for scope, diff in drifts:
+            changes = ', '.join(f'{name} {stored} -> {actual}' for name, (stored, actual) in diff.items())
+            self.stdout.write(f'{scope}: {changes}')
+
+        if options['check']:
+            self.stdout.write(self.style.WARNING(f'Found drift in {len(drifts)} order stats rows'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Reconciled {len(drifts)} order stats rows'))
@@ -0,0 +1,27 @@
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0005_add_exchange_refund_fields'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='order',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('order_id'), name='gin_trgm_ops'), name='orders_order_id_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('product_name'), name='gin_trgm_ops'), name='orders_product_name_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='orderitem',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('product_name'), name='gin_trgm_ops'), name='order_items_name_trgm_idx'),
+        ),
+    ]
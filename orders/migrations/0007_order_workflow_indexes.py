@@ -0,0 +1,35 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0006_order_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['status', '-created_at', '-id'], name='orders_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(condition=models.Q(('status', 'PAID')), fields=['shipping_status', '-created_at', '-id'], name='orders_paid_shipping_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(condition=models.Q(('cancellation_request_status__in', ['PENDING', 'APPROVED', 'REJECTED']), ('cancellation_requested_at__isnull', False)), fields=['-cancellation_requested_at', '-id'], name='orders_cancel_requested_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(condition=models.Q(('cancellation_request_status__in', ['PENDING', 'APPROVED', 'REJECTED']), ('cancellation_requested_at__isnull', False)), fields=['cancellation_request_status', '-cancellation_requested_at', '-id'], name='orders_cancel_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(condition=models.Q(('exchange_refund_request_status__in', ['PENDING', 'APPROVED', 'REJECTED']), ('exchange_refund_requested_at__isnull', False)), fields=['-exchange_refund_requested_at', '-id'], name='orders_exchange_requested_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(condition=models.Q(('exchange_refund_request_status__in', ['PENDING', 'APPROVED', 'REJECTED']), ('exchange_refund_requested_at__isnull', False)), fields=['exchange_refund_request_status', '-exchange_refund_requested_at', '-id'], name='orders_exchange_status_idx'),
+        ),
+    ]
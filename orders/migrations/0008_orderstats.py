@@ -0,0 +1,52 @@
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+ACTIVE_REQUEST_STATUSES = ['PENDING', 'APPROVED']
+
+
+def backfill_order_stats(apps, schema_editor):  # type: ignore[no-untyped-def]
+    Order = apps.get_model('orders', 'Order')
+    OrderStats = apps.get_model('orders', 'OrderStats')
+
+    aggregates = {
+        'preparing_count': Count('id', filter=Q(status='PAID', shipping_status='PENDING')),
+        'shipping_count': Count('id', filter=Q(status='PAID', shipping_status='SHIPPING')),
+        'delivered_count': Count('id', filter=Q(status='PAID', shipping_status='DELIVERED')),
+        'cancellation_count': Count('id', filter=Q(cancellation_request_status__in=ACTIVE_REQUEST_STATUSES)),
+        'exchange_count': Count('id', filter=Q(
+            exchange_refund_request_status__in=ACTIVE_REQUEST_STATUSES, exchange_refund_type='EXCHANGE'
+        )),
+        'refund_count': Count('id', filter=Q(
+            exchange_refund_request_status__in=ACTIVE_REQUEST_STATUSES, exchange_refund_type='REFUND'
+        )),
+    }
+    rows = Order.objects.values('user_id').annotate(**aggregates).order_by('user_id')
+    stats = [OrderStats(scope=f"user:{row.pop('user_id')}", **row) for row in rows]
+    OrderStats.objects.bulk_create(stats, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0007_order_workflow_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderStats',
+            fields=[
+                ('scope', models.CharField(max_length=32, primary_key=True, serialize=False)),
+                ('preparing_count', models.PositiveIntegerField(default=0)),
+                ('shipping_count', models.PositiveIntegerField(default=0)),
+                ('delivered_count', models.PositiveIntegerField(default=0)),
+                ('cancellation_count', models.PositiveIntegerField(default=0)),
+                ('exchange_count', models.PositiveIntegerField(default=0)),
+                ('refund_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'order_stats',
+            },
+        ),
+        migrations.RunPython(backfill_order_stats, migrations.RunPython.noop),
+    ]
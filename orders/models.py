@@ -1,7 +1,9 @@
-from typing import Any
+from typing import Any, Dict
 
 from django.conf import settings
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import models, transaction
+from django.db.models.functions import Upper
 
 from products.models import Color
 
@@ -77,10 +79,101 @@ class Order(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # 관리자 검색(icontains -> UPPER(col) LIKE)용 trigram 인덱스
+            GinIndex(OpClass(Upper('order_id'), name='gin_trgm_ops'), name='orders_order_id_trgm_idx'),
+            GinIndex(OpClass(Upper('product_name'), name='gin_trgm_ops'), name='orders_product_name_trgm_idx'),
+            # 관리자 주문 목록: WHERE status = ? ORDER BY created_at DESC, id DESC
+            models.Index(fields=['status', '-created_at', '-id'], name='orders_status_created_idx'),
+            # 배송 관리: WHERE status = 'PAID' AND shipping_status = ? ORDER BY created_at DESC, id DESC
+            models.Index(
+                fields=['shipping_status', '-created_at', '-id'],
+                condition=models.Q(status='PAID'),
+                name='orders_paid_shipping_idx',
+            ),
+            # 취소/교환·환불 요청 목록은 요청이 있는 주문만 담는 부분 인덱스
+            models.Index(
+                fields=['-cancellation_requested_at', '-id'],
+                condition=models.Q(
+                    cancellation_request_status__in=['PENDING', 'APPROVED', 'REJECTED'],
+                    cancellation_requested_at__isnull=False,
+                ),
+                name='orders_cancel_requested_idx',
+            ),
+            models.Index(
+                fields=['cancellation_request_status', '-cancellation_requested_at', '-id'],
+                condition=models.Q(
+                    cancellation_request_status__in=['PENDING', 'APPROVED', 'REJECTED'],
+                    cancellation_requested_at__isnull=False,
+                ),
+                name='orders_cancel_status_idx',
+            ),
+            models.Index(
+                fields=['-exchange_refund_requested_at', '-id'],
+                condition=models.Q(
+                    exchange_refund_request_status__in=['PENDING', 'APPROVED', 'REJECTED'],
+                    exchange_refund_requested_at__isnull=False,
+                ),
+                name='orders_exchange_requested_idx',
+            ),
+            models.Index(
+                fields=['exchange_refund_request_status', '-exchange_refund_requested_at', '-id'],
+                condition=models.Q(
+                    exchange_refund_request_status__in=['PENDING', 'APPROVED', 'REJECTED'],
+                    exchange_refund_requested_at__isnull=False,
+                ),
+                name='orders_exchange_status_idx',
+            ),
+        ]
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        # pre_save 에서 잠근 통계 스냅샷 행을 post_save 의 카운터 갱신까지 유지
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
     def __str__(self) -> str:
         return f"[{self.order_id}] {self.user} ({self.status})"
 
 
+class OrderStats(models.Model):
+    """
+    사용자별(user:{id}) 주문 현황 카운터. 시그널이 상태 변경마다 증감한다.
+    (rebuild_order_stats 명령으로 재집계)
+    """
+    USER_SCOPE_PREFIX = 'user:'
+
+    scope = models.CharField(max_length=32, primary_key=True)
+    preparing_count = models.PositiveIntegerField(default=0)
+    shipping_count = models.PositiveIntegerField(default=0)
+    delivered_count = models.PositiveIntegerField(default=0)
+    cancellation_count = models.PositiveIntegerField(default=0)
+    exchange_count = models.PositiveIntegerField(default=0)
+    refund_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'order_stats'
+
+    @staticmethod
+    def user_scope(user_id: int) -> str:
+        return f'{OrderStats.USER_SCOPE_PREFIX}{user_id}'
+
+    def get_order_stats(self) -> Dict[str, int]:
+        return {
+            'preparing': self.preparing_count,
+            'shipping': self.shipping_count,
+            'delivered': self.delivered_count,
+        }
+
+    def get_cancellation_exchange_refund_stats(self) -> Dict[str, int]:
+        return {
+            'cancellation': self.cancellation_count,
+            'exchange': self.exchange_count,
+            'refund': self.refund_count,
+        }
+
+
 class OrderItem(models.Model):
     """주문 상세 항목"""
     order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name="items")
@@ -93,6 +186,11 @@ class OrderItem(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            GinIndex(OpClass(Upper('product_name'), name='gin_trgm_ops'), name='order_items_name_trgm_idx'),
+        ]
+
     def save(self, *args: Any, **kwargs: Any) -> None:
         # 자동으로 subtotal 계산
         self.subtotal = self.quantity * self.unit_price
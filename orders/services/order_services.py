@@ -1,13 +1,40 @@
 import uuid
+from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from django.db.models import Count, Q, QuerySet
 from django.utils import timezone
 
 from config.utils.cache_helper import CacheHelper
 from orders.models import Order
 from products.models import Color, Product
+from products.services.stock_reservation import (
+    RESERVATION_TIMEOUT,
+    StockReservationService,
+)
+
+PRODUCT_NOT_FOUND_MESSAGE = "존재하지 않는 상품이 포함되어 있습니다."
+INVALID_QUANTITY_MESSAGE = "주문 수량은 1 이상의 정수여야 합니다."
+
+
+@dataclass(frozen=True)
+class OrderItemError:
+    """주문 항목 검증 오류 (line 은 items 배열의 인덱스)"""
+    line: int
+    message: str
+    product_id: Optional[int] = None
+    color_id: Optional[int] = None
+
+
+@dataclass
+class OrderItemsValidation:
+    items: List[Dict[str, Any]] = field(default_factory=list)
+    errors: List[OrderItemError] = field(default_factory=list)
+    total_amount: Decimal = Decimal("0.0")
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
 
 
 class OrderService:
@@ -16,24 +43,36 @@ class OrderService:
         return f"order:preorder:{uuid.uuid4().hex[:10]}"
 
     @staticmethod
-    def validate_products(product_ids: List[int]) -> Tuple[bool, str, Dict[int, Product]]:
-        products = Product.objects.filter(id__in=product_ids).prefetch_related('colors')
-        product_map = {p.id: p for p in products}
-
-        if len(product_ids) != len(product_map):
-            return False, "존재하지 않는 상품이 포함되어 있습니다.", {}
-
-        return True, "", product_map
-
-    @staticmethod
-    def validate_color(color_id: int, product: Product) -> Tuple[bool, str]:
-        if not Color.objects.filter(id=color_id).exists():
-            return False, "존재하지 않는 색상입니다."
+    def validate_colors(pairs: Iterable[Tuple[int, int]], product_map: Dict[int, Product]) -> Dict[Tuple[int, int], str]:
+        """
+        (상품 id, 색상 id) 쌍을 product_color_cdt 한 번의 조회로 검증하고 잘못된 쌍의 오류 메시지를 반환한다.
+        연결되지 않은 쌍이 있을 때만 색상 존재 여부를 한 번 더 조회한다.
+        """
+        requested = set(pairs)
+        if not requested:
+            return {}
+
+        linked = set(
+            Product.colors.through.objects.filter(
+                product_id__in={product_id for product_id, _ in requested},
+                color_id__in={color_id for _, color_id in requested},
+            ).values_list("product_id", "color_id")
+        )
 
-        if not product.colors.filter(id=color_id).exists():
-            return False, f"'{product.name}' 상품에 선택하신 색상이 존재하지 않습니다."
+        unlinked = requested - linked
+        if not unlinked:
+            return {}
 
-        return True, ""
+        existing_colors = set(
+            Color.objects.filter(id__in={color_id for _, color_id in unlinked}).values_list("id", flat=True)
+        )
+        return {
+            (product_id, color_id): (
+                f"'{product_map[product_id].name}' 상품에 선택하신 색상이 존재하지 않습니다."
+                if color_id in existing_colors else "존재하지 않는 색상입니다."
+            )
+            for product_id, color_id in unlinked
+        }
 
     @staticmethod
     def calculate_item_price(product: Product) -> Decimal:
@@ -42,37 +81,54 @@ class OrderService:
         return Decimal(str(product.price))
 
     @staticmethod
-    def validate_and_prepare_order_items(
-        items_data: List[Dict[str, Any]]
-    ) -> Tuple[bool, str, List[Dict[str, Any]], Decimal]:
-        if not items_data:
-            return False, "주문 항목이 비어있습니다.", [], Decimal("0.0")
+    def _parse_int(value: Any) -> Optional[int]:
+        try:
+            return int(value) if value is not None else None
+        except (TypeError, ValueError):
+            return None
 
-        product_ids = list(set([item["product_id"] for item in items_data if "product_id" in item]))
+    @staticmethod
+    def prepare_order_items(items_data: List[Dict[str, Any]]) -> OrderItemsValidation:
+        """주문 항목 전체를 상품 1회 + 상품-색상 1회 조회로 검증하고 항목별 오류를 모은다"""
+        if not items_data:
+            return OrderItemsValidation(errors=[OrderItemError(line=0, message="주문 항목이 비어있습니다.")])
+
+        # JSON 요청의 id 는 문자열일 수 있으므로 in_bulk 결과(int 키)와 비교하기 전에 정수로 맞춘다
+        parsed_ids = [
+            (OrderService._parse_int(item.get("product_id")), OrderService._parse_int(item.get("color_id")))
+            for item in items_data
+        ]
+        product_ids = {product_id for product_id, _ in parsed_ids if product_id is not None}
+        product_map = Product.objects.in_bulk(product_ids)
+
+        color_pairs = {
+            (product_id, color_id)
+            for product_id, color_id in parsed_ids
+            if product_id is not None and product_id in product_map and color_id
+        }
+        color_errors = OrderService.validate_colors(color_pairs, product_map)
 
-        is_valid, error_message, product_map = OrderService.validate_products(product_ids)
-        if not is_valid:
-            return False, error_message, [], Decimal("0.0")
+        result = OrderItemsValidation()
+        for line, (item, (product_id, color_id)) in enumerate(zip(items_data, parsed_ids)):
+            product = product_map.get(product_id) if product_id is not None else None
 
-        validated_items: List[Dict[str, Any]] = []
-        total_amount = Decimal("0.0")
+            if product is None:
+                result.errors.append(OrderItemError(line, PRODUCT_NOT_FOUND_MESSAGE, product_id, color_id))
+                continue
 
-        for item in items_data:
-            product_id = item["product_id"]
-            product = product_map[product_id]
-            color_id = item.get("color_id")
+            if color_id and (product.id, color_id) in color_errors:
+                result.errors.append(OrderItemError(line, color_errors[(product.id, color_id)], product_id, color_id))
+                continue
 
-            if color_id:
-                is_valid, error_message = OrderService.validate_color(color_id, product)
-                if not is_valid:
-                    return False, error_message, [], Decimal("0.0")
+            quantity = OrderService._parse_int(item.get("quantity", 1))
+            if quantity is None or quantity <= 0:
+                result.errors.append(OrderItemError(line, INVALID_QUANTITY_MESSAGE, product_id, color_id))
+                continue
 
-            quantity = int(item.get("quantity", 1))
             price = OrderService.calculate_item_price(product)
-            item_total = price * quantity
-            total_amount += item_total
+            result.total_amount += price * quantity
 
-            validated_items.append({
+            result.items.append({
                 "product_id": product.id,
                 "product_name": product.name,
                 "quantity": quantity,
@@ -80,13 +136,17 @@ class OrderService:
                 "color_id": color_id,
             })
 
-        return True, "", validated_items, total_amount
+        if result.errors:
+            result.items, result.total_amount = [], Decimal("0.0")
+        return result
 
     @staticmethod
     def create_preorder_cache(
         user_id: int, validated_items: List[Dict[str, Any]], total_amount: Decimal
     ) -> str:
         preorder_key = OrderService.generate_preorder_key()
+        # 주문서 유효 시간 동안 재고를 보류 (부족하면 InsufficientStockError)
+        StockReservationService.reserve(preorder_key, validated_items)
         cache_data = {
             "user_id": user_id,
             "items": validated_items,
@@ -94,36 +154,12 @@ class OrderService:
             "created_at": timezone.now().isoformat(),
         }
 
-        CacheHelper.set(preorder_key, cache_data, timeout=60 * 15)
+        CacheHelper.set(preorder_key, cache_data, timeout=RESERVATION_TIMEOUT)
 
         return preorder_key
 
 
 class OrderStatisticsService:
-    @staticmethod
-    def calculate_order_stats(orders: QuerySet[Order]) -> Dict[str, int]:
-        return orders.filter(status=Order.Status.PAID).aggregate(
-            preparing=Count('id', filter=Q(shipping_status=Order.ShippingStatus.PENDING)),
-            shipping=Count('id', filter=Q(shipping_status=Order.ShippingStatus.SHIPPING)),
-            delivered=Count('id', filter=Q(shipping_status=Order.ShippingStatus.DELIVERED)),
-        )
-
-    @staticmethod
-    def calculate_cancellation_exchange_refund_stats(orders: QuerySet[Order]) -> Dict[str, int]:
-        return orders.aggregate(
-            cancellation=Count('id', filter=Q(
-                cancellation_request_status__in=[Order.CancellationRequestStatus.PENDING, Order.CancellationRequestStatus.APPROVED]
-            )),
-            exchange=Count('id', filter=Q(
-                exchange_refund_request_status__in=[Order.ExchangeRefundRequestStatus.PENDING, Order.ExchangeRefundRequestStatus.APPROVED],
-                exchange_refund_type=Order.ExchangeRefundType.EXCHANGE
-            )),
-            refund=Count('id', filter=Q(
-                exchange_refund_request_status__in=[Order.ExchangeRefundRequestStatus.PENDING, Order.ExchangeRefundRequestStatus.APPROVED],
-                exchange_refund_type=Order.ExchangeRefundType.REFUND
-            )),
-        )
-
     @staticmethod
     def attach_products_to_orders(orders_list: List[Order]) -> None:
         all_product_ids: set[int] = set()
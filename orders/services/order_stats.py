@@ -0,0 +1,188 @@
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.db.models.functions import Greatest
+
+from orders.models import Order, OrderStats
+
+STATS_FIELDS = [
+    'preparing_count',
+    'shipping_count',
+    'delivered_count',
+    'cancellation_count',
+    'exchange_count',
+    'refund_count',
+]
+
+ACTIVE_CANCELLATION_STATUSES = [Order.CancellationRequestStatus.PENDING, Order.CancellationRequestStatus.APPROVED]
+ACTIVE_EXCHANGE_REFUND_STATUSES = [Order.ExchangeRefundRequestStatus.PENDING, Order.ExchangeRefundRequestStatus.APPROVED]
+
+# 재집계용 조건 (_contribution_fields 와 같은 기준)
+STATS_CONDITIONS = {
+    'preparing_count': Q(status=Order.Status.PAID, shipping_status=Order.ShippingStatus.PENDING),
+    'shipping_count': Q(status=Order.Status.PAID, shipping_status=Order.ShippingStatus.SHIPPING),
+    'delivered_count': Q(status=Order.Status.PAID, shipping_status=Order.ShippingStatus.DELIVERED),
+    'cancellation_count': Q(cancellation_request_status__in=ACTIVE_CANCELLATION_STATUSES),
+    'exchange_count': Q(
+        exchange_refund_request_status__in=ACTIVE_EXCHANGE_REFUND_STATUSES,
+        exchange_refund_type=Order.ExchangeRefundType.EXCHANGE,
+    ),
+    'refund_count': Q(
+        exchange_refund_request_status__in=ACTIVE_EXCHANGE_REFUND_STATUSES,
+        exchange_refund_type=Order.ExchangeRefundType.REFUND,
+    ),
+}
+
+
+class OrderContribution(NamedTuple):
+    user_id: int
+    status: str
+    shipping_status: str
+    cancellation_request_status: str
+    exchange_refund_request_status: str
+    exchange_refund_type: Optional[str]
+
+
+class OrderStatsService:
+    @staticmethod
+    def snapshot(order_ids: Iterable[int]) -> Dict[int, OrderContribution]:
+        """주문별로 카운터에 반영되는 상태 값을 한 번의 쿼리로 조회"""
+        ids = [order_id for order_id in order_ids if order_id is not None]
+        if not ids:
+            return {}
+
+        orders = Order.objects.filter(pk__in=ids).order_by('pk')
+        # 변경 전/후 스냅샷 사이에 다른 트랜잭션이 같은 주문을 바꿔 차이가 이중 반영되지 않도록 행을 잠근다
+        if transaction.get_connection().in_atomic_block:
+            orders = orders.select_for_update()
+        rows = orders.values_list('pk', *OrderContribution._fields)
+        return {pk: OrderContribution(*values) for pk, *values in rows}
+
+    @staticmethod
+    def _contribution_fields(contribution: Optional[OrderContribution]) -> Counter[str]:
+        fields: Counter[str] = Counter()
+        if contribution is None:
+            return fields
+
+        if contribution.status == Order.Status.PAID:
+            shipping_fields: Dict[str, str] = {
+                Order.ShippingStatus.PENDING: 'preparing_count',
+                Order.ShippingStatus.SHIPPING: 'shipping_count',
+                Order.ShippingStatus.DELIVERED: 'delivered_count',
+            }
+            shipping_field = shipping_fields.get(contribution.shipping_status)
+            if shipping_field:
+                fields[shipping_field] += 1
+
+        if contribution.cancellation_request_status in ACTIVE_CANCELLATION_STATUSES:
+            fields['cancellation_count'] += 1
+
+        if contribution.exchange_refund_request_status in ACTIVE_EXCHANGE_REFUND_STATUSES:
+            if contribution.exchange_refund_type == Order.ExchangeRefundType.EXCHANGE:
+                fields['exchange_count'] += 1
+            elif contribution.exchange_refund_type == Order.ExchangeRefundType.REFUND:
+                fields['refund_count'] += 1
+        return fields
+
+    @staticmethod
+    def apply_changes(before: Dict[int, OrderContribution], after: Dict[int, OrderContribution]) -> None:
+        """
+        변경 전/후 스냅샷의 차이만큼 사용자별 카운터를 F-expression 으로 증감한다.
+        모든 주문이 갱신하는 전체 행은 잠금 경합이 생기므로 두지 않는다.
+        """
+        deltas: Dict[str, Counter[str]] = defaultdict(Counter)
+        for order_id in set(before) | set(after):
+            old, new = before.get(order_id), after.get(order_id)
+            if old is not None:
+                old_fields = OrderStatsService._contribution_fields(old)
+                deltas[OrderStats.user_scope(old.user_id)].subtract(old_fields)
+            if new is not None:
+                new_fields = OrderStatsService._contribution_fields(new)
+                deltas[OrderStats.user_scope(new.user_id)].update(new_fields)
+
+        changes = {
+            scope: {name: value for name, value in delta.items() if value}
+            for scope, delta in deltas.items()
+        }
+        changes = {scope: fields for scope, fields in changes.items() if fields}
+        if not changes:
+            return
+
+        with transaction.atomic():
+            # 행이 없는데 감소만 있으면 카운터가 이미 어긋난 상태이므로 새로 만들지 않는다 (재집계로 보정)
+            new_scopes = [scope for scope, fields in changes.items() if any(value > 0 for value in fields.values())]
+            if new_scopes:
+                OrderStats.objects.bulk_create(
+                    [OrderStats(scope=scope) for scope in new_scopes],
+                    ignore_conflicts=True,
+                )
+            # 동시에 여러 주문이 바뀌어도 데드락이 나지 않도록 항상 같은 순서로 갱신
+            # 카운터가 어긋나 음수가 되더라도 주문 저장이 실패하지 않도록 0 에서 멈춘다 (재집계로 보정)
+            for scope, fields in sorted(changes.items()):
+                OrderStats.objects.filter(scope=scope).update(
+                    **{name: Greatest(F(name) + value, 0) for name, value in fields.items()}
+                )
+
+    @staticmethod
+    def _get_stats(scope: str) -> OrderStats:
+        stats = OrderStats.objects.filter(scope=scope).first()
+        return stats or OrderStats(scope=scope)
+
+    @staticmethod
+    def get_user_stats(user_id: int) -> OrderStats:
+        return OrderStatsService._get_stats(OrderStats.user_scope(user_id))
+
+    @staticmethod
+    def compute(user_ids: Optional[List[int]] = None) -> Dict[str, Dict[str, int]]:
+        """주문 테이블에서 직접 집계한 사용자 scope 별 카운터 (user_ids 가 없으면 주문이 있는 전체 사용자)"""
+        aggregates = {name: Count('id', filter=condition) for name, condition in STATS_CONDITIONS.items()}
+        orders = Order.objects.all()
+        if user_ids is not None:
+            orders = orders.filter(user_id__in=user_ids)
+
+        computed: Dict[str, Dict[str, int]] = {}
+        for row in orders.values('user_id').annotate(**aggregates).order_by('user_id'):
+            user_id = row.pop('user_id')
+            computed[OrderStats.user_scope(user_id)] = row
+        if user_ids is not None:
+            # 주문이 없는 사용자도 0 으로 맞춘다
+            for user_id in user_ids:
+                computed.setdefault(OrderStats.user_scope(user_id), {name: 0 for name in STATS_FIELDS})
+        return computed
+
+    @staticmethod
+    def reconcile(user_ids: Optional[List[int]] = None, fix: bool = True) -> List[Tuple[str, Dict[str, Tuple[int, int]]]]:
+        """
+        저장된 카운터와 재집계 결과를 비교해 (scope, {필드: (저장값, 실제값)}) 목록을 반환한다.
+        fix 이면 차이가 있는 scope 를 실제값으로 덮어쓴다.
+        """
+        with transaction.atomic():
+            computed = OrderStatsService.compute(user_ids)
+            scopes = OrderStats.objects.select_for_update().filter(scope__startswith=OrderStats.USER_SCOPE_PREFIX)
+            if user_ids is not None:
+                scopes = scopes.filter(scope__in=list(computed))
+            stored = {stats.scope: stats for stats in scopes}
+
+            drifts: List[Tuple[str, Dict[str, Tuple[int, int]]]] = []
+            for scope in sorted(set(computed) | set(stored)):
+                expected = computed.get(scope, {name: 0 for name in STATS_FIELDS})
+                current = stored.get(scope)
+                diff = {
+                    name: (getattr(current, name) if current else 0, expected[name])
+                    for name in STATS_FIELDS
+                    if (getattr(current, name) if current else 0) != expected[name]
+                }
+                if diff:
+                    drifts.append((scope, diff))
+
+            if fix and drifts:
+                OrderStats.objects.bulk_create(
+                    [OrderStats(scope=scope, **computed.get(scope, {name: 0 for name in STATS_FIELDS})) for scope, _ in drifts],
+                    update_conflicts=True,
+                    unique_fields=['scope'],
+                    update_fields=STATS_FIELDS,
+                    batch_size=1000,
+                )
+        return drifts
@@ -0,0 +1,31 @@
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from orders.models import Order
+from orders.services.order_stats import OrderStatsService
+
+# 변경 전 스냅샷을 pre_* 시그널에서 인스턴스에 보관해 두었다가 post_* 에서 차이만 반영한다
+SNAPSHOT_ATTR = '_order_stats_snapshot'
+
+
+@receiver(pre_save, sender=Order)
+def snapshot_order_before_save(sender: type[Order], instance: Order, **kwargs: Any) -> None:
+    setattr(instance, SNAPSHOT_ATTR, OrderStatsService.snapshot([instance.pk]) if instance.pk else {})
+
+
+@receiver(post_save, sender=Order)
+def update_stats_after_save(sender: type[Order], instance: Order, **kwargs: Any) -> None:
+    before = getattr(instance, SNAPSHOT_ATTR, {})
+    OrderStatsService.apply_changes(before, OrderStatsService.snapshot([instance.pk]))
+
+
+@receiver(pre_delete, sender=Order)
+def snapshot_order_before_delete(sender: type[Order], instance: Order, **kwargs: Any) -> None:
+    setattr(instance, SNAPSHOT_ATTR, OrderStatsService.snapshot([instance.pk]))
+
+
+@receiver(post_delete, sender=Order)
+def update_stats_after_delete(sender: type[Order], instance: Order, **kwargs: Any) -> None:
+    OrderStatsService.apply_changes(getattr(instance, SNAPSHOT_ATTR, {}), {})
@@ -0,0 +1,66 @@
+from typing import Any, Callable, Dict, Sequence
+
+import pytest
+from django.db import connection
+from django.db.models import QuerySet
+from django.http import HttpRequest
+from django.test import RequestFactory
+
+from config.utils.filtering import Filtering
+from config.utils.setup_test_method import TestSetupMixin
+from orders.models import Order
+from users.models import User
+
+ORDER_TABLE = Order._meta.db_table
+USER_TABLE = User._meta.db_table
+
+# (Filtering 메서드, GET 파라미터, 뷰의 keyset 정렬)
+WORKFLOW_QUERIES = [
+    (Filtering.order_list_filter, {}, ('-created_at', '-id')),
+    (Filtering.order_list_filter, {'status': 'CANCELLED'}, ('-created_at', '-id')),
+    (Filtering.shipping_list_filter, {}, ('-created_at', '-id')),
+    (Filtering.shipping_list_filter, {'shipping_status': 'SHIPPING'}, ('-created_at', '-id')),
+    (Filtering.cancellation_list_filter, {}, ('-cancellation_requested_at', '-id')),
+    (Filtering.cancellation_list_filter, {'status': 'PENDING'}, ('-cancellation_requested_at', '-id')),
+    (Filtering.exchange_refund_list_filter, {}, ('-exchange_refund_requested_at', '-id')),
+    (Filtering.exchange_refund_list_filter, {'status': 'PENDING'}, ('-exchange_refund_requested_at', '-id')),
+    (Filtering.order_list_filter, {'q': 'ORD-20260101120000-ABC123'}, ('-created_at', '-id')),
+    (Filtering.order_list_filter, {'q': 'ORD-2026'}, ('-created_at', '-id')),
+    (Filtering.order_list_filter, {'q': 'customer@customer.com'}, ('-created_at', '-id')),
+    (Filtering.order_list_filter, {'q': 'customer'}, ('-created_at', '-id')),
+    (Filtering.shipping_list_filter, {'q': '캐시미어 니트'}, ('-created_at', '-id')),
+    (Filtering.user_list_filter, {}, ('-date_joined', '-id')),
+    (Filtering.user_list_filter, {'q': 'customer'}, ('-date_joined', '-id')),
+]
+
+
+@pytest.mark.django_db
+class TestOrderQueryPlans(TestSetupMixin):
+    """
+    테스트 DB 는 작아서 플래너가 항상 seq scan 을 고르므로 enable_seqscan 을 끄고 확인한다.
+    사용할 수 있는 인덱스가 없을 때만 Seq Scan 이 남는다.
+    """
+
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.setup_test_products_data()
+        self.setup_test_order_data()
+        self.factory = RequestFactory()
+
+    def _explain(self, queryset: QuerySet[Any], ordering: Sequence[str]) -> str:
+        with connection.cursor() as cursor:
+            # 테스트 트랜잭션 안에서만 적용
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        return queryset.order_by(*ordering)[:21].explain()
+
+    @pytest.mark.parametrize('filter_method, params, ordering', WORKFLOW_QUERIES)
+    def test_workflow_query_uses_index(
+        self,
+        filter_method: Callable[[HttpRequest], QuerySet[Any]],
+        params: Dict[str, str],
+        ordering: Sequence[str],
+    ) -> None:
+        plan = self._explain(filter_method(self.factory.get('/', params)), ordering)
+
+        assert f'Seq Scan on {ORDER_TABLE}' not in plan, plan
+        assert f'Seq Scan on {USER_TABLE}' not in plan, plan
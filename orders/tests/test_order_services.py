@@ -1,3 +1,5 @@
+from typing import Any, Dict, List
+
 import pytest
 
 from config.utils.setup_test_method import TestSetupMixin
@@ -11,25 +13,26 @@ class TestOrderService(TestSetupMixin):
         self.setup_test_user_data()
         self.setup_test_products_data()
 
-    def test_validate_products_invalid_product_id(self) -> None:
-        is_valid, error_message, product_map = OrderService.validate_products([99999])
-        
-        assert is_valid is False
-        assert "존재하지 않는 상품이 포함되어 있습니다" in error_message
-        assert product_map == {}
+    def test_prepare_order_items_invalid_product_id(self) -> None:
+        result = OrderService.prepare_order_items([{"product_id": 99999, "quantity": 1}])
 
-    def test_validate_color_color_not_exists(self) -> None:
-        is_valid, error_message = OrderService.validate_color(99999, self.product)
-        
-        assert is_valid is False
-        assert "존재하지 않는 색상입니다" in error_message
+        assert result.is_valid is False
+        assert "존재하지 않는 상품이 포함되어 있습니다" in result.errors[0].message
+
+    def test_prepare_order_items_color_not_exists(self) -> None:
+        result = OrderService.prepare_order_items([{"product_id": self.product.id, "color_id": 99999, "quantity": 1}])
 
-    def test_validate_color_color_not_in_product(self) -> None:
+        assert result.is_valid is False
+        assert "존재하지 않는 색상입니다" in result.errors[0].message
+
+    def test_prepare_order_items_color_not_in_product(self) -> None:
         other_color = Color.objects.create(name="다른색상", hex_code="#000000")
-        is_valid, error_message = OrderService.validate_color(other_color.id, self.product)
-        
-        assert is_valid is False
-        assert f"'{self.product.name}' 상품에 선택하신 색상이 존재하지 않습니다" in error_message
+        result = OrderService.prepare_order_items(
+            [{"product_id": self.product.id, "color_id": other_color.id, "quantity": 1}]
+        )
+
+        assert result.is_valid is False
+        assert f"'{self.product.name}' 상품에 선택하신 색상이 존재하지 않습니다" in result.errors[0].message
 
     def test_calculate_item_price_with_sale_price(self) -> None:
         self.product.price = 10000
@@ -40,29 +43,75 @@ class TestOrderService(TestSetupMixin):
         
         assert price == 8000
 
-    def test_validate_and_prepare_order_items_empty_items(self) -> None:
-        is_valid, error_message, validated_items, total_amount = OrderService.validate_and_prepare_order_items([])
-        
-        assert is_valid is False
-        assert "주문 항목이 비어있습니다" in error_message
-        assert validated_items == []
-        assert total_amount == 0
-
-    def test_validate_and_prepare_order_items_invalid_product(self) -> None:
-        items_data = [{"product_id": 99999, "quantity": 1}]
-        is_valid, error_message, validated_items, total_amount = OrderService.validate_and_prepare_order_items(items_data)
-        
-        assert is_valid is False
-        assert "존재하지 않는 상품이 포함되어 있습니다" in error_message
-        assert validated_items == []
-        assert total_amount == 0
+    def test_prepare_order_items_empty_items(self) -> None:
+        result = OrderService.prepare_order_items([])
 
-    def test_validate_and_prepare_order_items_invalid_color(self) -> None:
-        other_color = Color.objects.create(name="다른색상", hex_code="#000000")
-        items_data = [{"product_id": self.product.id, "color_id": other_color.id, "quantity": 1}]
-        is_valid, error_message, validated_items, total_amount = OrderService.validate_and_prepare_order_items(items_data)
-        
-        assert is_valid is False
-        assert "존재하지 않는 색상" in error_message or "선택하신 색상이 존재하지 않습니다" in error_message
-        assert validated_items == []
-        assert total_amount == 0
+        assert result.is_valid is False
+        assert "주문 항목이 비어있습니다" in result.errors[0].message
+        assert result.items == []
+        assert result.total_amount == 0
+
+    def test_prepare_order_items_invalid_quantity(self) -> None:
+        items_data: List[Dict[str, Any]] = [
+            {"product_id": self.product.id, "quantity": 2},
+            {"product_id": self.product.id, "quantity": -5},
+            {"product_id": self.product.id, "quantity": 0},
+            {"product_id": self.product.id, "quantity": "many"},
+        ]
+
+        result = OrderService.prepare_order_items(items_data)
+
+        assert [(error.line, error.message) for error in result.errors] == [
+            (line, "주문 수량은 1 이상의 정수여야 합니다.") for line in (1, 2, 3)
+        ]
+        assert result.items == []
+        assert result.total_amount == 0
+
+    def test_prepare_order_items_reports_each_line(self) -> None:
+        color = Color.objects.create(name="블랙", hex_code="#000000")
+        other_color = Color.objects.create(name="화이트", hex_code="#FFFFFF")
+        self.product.colors.add(color)
+        items_data = [
+            {"product_id": self.product.id, "color_id": color.id, "quantity": 1},
+            {"product_id": self.product.id, "color_id": other_color.id, "quantity": 1},
+            {"product_id": 99999, "quantity": 1},
+        ]
+
+        result = OrderService.prepare_order_items(items_data)
+
+        assert not result.is_valid
+        assert [(error.line, error.product_id) for error in result.errors] == [(1, self.product.id), (2, 99999)]
+        assert "선택하신 색상이 존재하지 않습니다" in result.errors[0].message
+        assert "존재하지 않는 상품" in result.errors[1].message
+        assert result.items == []
+
+    def test_prepare_order_items_constant_queries(self, django_assert_num_queries) -> None:  # type: ignore[no-untyped-def]
+        colors = [Color.objects.create(name=f"색상{i}", hex_code=f"#0000{i:02d}") for i in range(30)]
+        self.product.colors.add(*colors)
+        items_data = [{"product_id": self.product.id, "color_id": color.id, "quantity": 2} for color in colors]
+
+        # 상품 1회 + product_color_cdt 1회
+        with django_assert_num_queries(2):
+            result = OrderService.prepare_order_items(items_data)
+
+        assert result.is_valid
+        assert len(result.items) == 30
+        assert result.total_amount == OrderService.calculate_item_price(self.product) * 60
+
+    def test_prepare_order_items_accepts_string_ids(self) -> None:
+        color = Color.objects.create(name="블랙", hex_code="#000000")
+        self.product.colors.add(color)
+        items_data = [
+            {"product_id": str(self.product.id), "color_id": str(color.id), "quantity": 1},
+            {"product_id": "abc", "quantity": 1},
+        ]
+
+        result = OrderService.prepare_order_items(items_data)
+
+        assert [(error.line, error.message) for error in result.errors] == [(1, "존재하지 않는 상품이 포함되어 있습니다.")]
+
+        result = OrderService.prepare_order_items(items_data[:1])
+
+        assert result.is_valid
+        assert result.items[0]["product_id"] == self.product.id
+        assert result.items[0]["color_id"] == color.id
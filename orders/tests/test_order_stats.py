@@ -0,0 +1,73 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from config.utils.setup_test_method import TestSetupMixin
+from orders.models import Order, OrderStats
+from orders.services.order_stats import OrderStatsService
+
+
+@pytest.mark.django_db
+class TestOrderStats(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.setup_test_products_data()
+        self.setup_test_order_data()
+
+    def test_created_order_counted(self) -> None:
+        user_stats = OrderStatsService.get_user_stats(self.admin_user.id)
+
+        assert user_stats.get_order_stats() == {'preparing': 1, 'shipping': 0, 'delivered': 0}
+
+    def test_shipping_transition_moves_bucket(self) -> None:
+        self.order.shipping_status = Order.ShippingStatus.SHIPPING
+        self.order.save()
+
+        stats = OrderStatsService.get_user_stats(self.admin_user.id)
+        assert stats.get_order_stats() == {'preparing': 0, 'shipping': 1, 'delivered': 0}
+
+    def test_request_statuses(self) -> None:
+        self.order.cancellation_request_status = Order.CancellationRequestStatus.PENDING
+        self.order.save()
+
+        assert OrderStatsService.get_user_stats(self.admin_user.id).cancellation_count == 1
+
+        self.order.cancellation_request_status = Order.CancellationRequestStatus.REJECTED
+        self.order.exchange_refund_request_status = Order.ExchangeRefundRequestStatus.PENDING
+        self.order.exchange_refund_type = Order.ExchangeRefundType.REFUND
+        self.order.save()
+
+        stats = OrderStatsService.get_user_stats(self.admin_user.id)
+        assert stats.get_cancellation_exchange_refund_stats() == {'cancellation': 0, 'exchange': 0, 'refund': 1}
+
+    def test_delete_and_user_without_orders(self) -> None:
+        self.order.delete()
+
+        assert OrderStatsService.get_user_stats(self.admin_user.id).preparing_count == 0
+        assert OrderStatsService.get_user_stats(self.customer_user.id).get_order_stats() == {
+            'preparing': 0, 'shipping': 0, 'delivered': 0,
+        }
+
+    def test_drifted_counter_does_not_go_negative(self) -> None:
+        OrderStats.objects.filter(scope=OrderStats.user_scope(self.admin_user.id)).update(preparing_count=0)
+
+        self.order.shipping_status = Order.ShippingStatus.SHIPPING
+        self.order.save()
+
+        stats = OrderStatsService.get_user_stats(self.admin_user.id)
+        assert stats.get_order_stats() == {'preparing': 0, 'shipping': 1, 'delivered': 0}
+
+    def test_rebuild_command_fixes_drift(self) -> None:
+        OrderStats.objects.filter(scope=OrderStats.user_scope(self.admin_user.id)).update(preparing_count=5)
+
+        out = StringIO()
+        call_command('rebuild_order_stats', '--check', stdout=out)
+
+        assert f'user:{self.admin_user.id}: preparing_count 5 -> 1' in out.getvalue()
+        assert OrderStatsService.get_user_stats(self.admin_user.id).preparing_count == 5
+
+        call_command('rebuild_order_stats', stdout=StringIO())
+
+        assert OrderStatsService.get_user_stats(self.admin_user.id).preparing_count == 1
+        assert OrderStatsService.reconcile(fix=False) == []
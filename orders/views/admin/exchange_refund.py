@@ -1,10 +1,10 @@
 from django.contrib import messages
-from django.core.paginator import Paginator
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.views import View
 
 from config.utils.filtering import Filtering
+from config.utils.pagination import KeysetPaginator
 from orders.models import Order
 from orders.services.order_exchange_refund_services import OrderExchangeRefundService
 from users.utils.permission import AdminPermission
@@ -17,8 +17,17 @@ class AdminExchangeRefundListView(AdminPermission, View):
 
         orders_qs = Filtering.exchange_refund_list_filter(request)
 
-        paginator = Paginator(orders_qs, 20)
-        page_obj = paginator.get_page(request.GET.get("page") or "1")
+        paginator = KeysetPaginator(
+            orders_qs,
+            ('-exchange_refund_requested_at', '-id'),
+            per_page=20,
+            total_cache_key=f"admin:exchange-refunds:{q}:{status}",
+        )
+        try:
+            page_obj = paginator.get_page(request.GET.get("cursor"))
+        except ValueError:
+            # 잘못되었거나 오래된 커서는 첫 페이지로
+            page_obj = paginator.get_page()
 
         context = {
             "q": q,
@@ -1,11 +1,11 @@
 from django.contrib import messages
-from django.core.paginator import Paginator
-from django.db.models import Q, QuerySet
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 from django.views import View
 
+from config.utils.filtering import Filtering
+from config.utils.pagination import KeysetPaginator
 from orders.models import Order
 from users.utils.permission import AdminPermission
 
@@ -15,22 +15,19 @@ class ShippingManagementView(AdminPermission, View):
         q = (request.GET.get("q") or "").strip()
         shipping_status = (request.GET.get("shipping_status") or "").strip()
 
-        orders_qs: QuerySet[Order] = Order.objects.filter(status="PAID").select_related("user").prefetch_related("items").order_by("-created_at")
+        orders_qs = Filtering.shipping_list_filter(request)
 
-        if q:
-            orders_qs = orders_qs.filter(
-                Q(order_id__icontains=q)
-                | Q(user__email__icontains=q)
-                | Q(user__username__icontains=q)
-                | Q(product_name__icontains=q)
-                | Q(items__product_name__icontains=q)
-            ).distinct()
-
-        if shipping_status:
-            orders_qs = orders_qs.filter(shipping_status=shipping_status)
-
-        paginator = Paginator(orders_qs, 20)
-        page_obj = paginator.get_page(request.GET.get("page") or "1")
+        paginator = KeysetPaginator(
+            orders_qs,
+            ('-created_at', '-id'),
+            per_page=20,
+            total_cache_key=f"admin:shipping:{q}:{shipping_status}",
+        )
+        try:
+            page_obj = paginator.get_page(request.GET.get("cursor"))
+        except ValueError:
+            # 잘못되었거나 오래된 커서는 첫 페이지로
+            page_obj = paginator.get_page()
 
         context = {
             "q": q,
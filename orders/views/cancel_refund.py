@@ -1,13 +1,14 @@
 from typing import cast
 
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db.models import Q
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import render
-from django.db.models import Q
 from django.views import View
 
 from orders.models import Order
 from orders.services.order_services import OrderStatisticsService
+from orders.services.order_stats import OrderStatsService
 from users.models import User
 
 
@@ -17,8 +18,9 @@ class CancelRefundView(LoginRequiredMixin, View):
 
         orders = Order.objects.filter(user=user)
 
-        order_stats = OrderStatisticsService.calculate_order_stats(orders)
-        cancellation_exchange_refund_stats = OrderStatisticsService.calculate_cancellation_exchange_refund_stats(orders)
+        stats = OrderStatsService.get_user_stats(user.id)
+        order_stats = stats.get_order_stats()
+        cancellation_exchange_refund_stats = stats.get_cancellation_exchange_refund_stats()
 
         cancellation_exchange_refund_orders = orders.filter(
             Q(cancellation_request_status__in=[Order.CancellationRequestStatus.PENDING, Order.CancellationRequestStatus.APPROVED, Order.CancellationRequestStatus.REJECTED]) |
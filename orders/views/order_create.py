@@ -1,4 +1,5 @@
 import json
+from dataclasses import asdict
 from typing import Any, Dict, cast
 
 from django.contrib.auth.mixins import LoginRequiredMixin
@@ -8,6 +9,7 @@ from django.views import View
 from django.views.decorators.csrf import csrf_protect
 
 from orders.services.order_services import OrderService
+from products.services.stock_reservation import InsufficientStockError
 from users.models import User
 
 
@@ -21,19 +23,24 @@ class OrderCreateView(LoginRequiredMixin, View):
 
         items_data = data.get("items", [])
 
-        is_valid, error_message, validated_items, total_amount = (
-            OrderService.validate_and_prepare_order_items(items_data)
-        )
+        validation = OrderService.prepare_order_items(items_data)
+        if not validation.is_valid:
+            return JsonResponse({
+                "error": validation.errors[0].message,
+                "errors": [asdict(error) for error in validation.errors],
+            }, status=400)
 
-        if not is_valid:
-            return JsonResponse({"error": error_message}, status=400)
+        validated_items, total_amount = validation.items, validation.total_amount
 
         user = cast(User, request.user)
-        preorder_key = OrderService.create_preorder_cache(
-            user_id=user.id,
-            validated_items=validated_items,
-            total_amount=total_amount,
-        )
+        try:
+            preorder_key = OrderService.create_preorder_cache(
+                user_id=user.id,
+                validated_items=validated_items,
+                total_amount=total_amount,
+            )
+        except InsufficientStockError as e:
+            return JsonResponse({"error": str(e), "product_id": e.product_id}, status=409)
 
         return JsonResponse({
             "success": True,
@@ -9,6 +9,7 @@ from orders.forms.cancellation import OrderCancellationForm
 from orders.forms.exchange_refund import OrderExchangeRefundForm
 from orders.models import Order
 from orders.services.order_services import OrderStatisticsService
+from orders.services.order_stats import OrderStatsService
 from users.models import User
 
 
@@ -17,8 +18,9 @@ class OrderView(LoginRequiredMixin, View):
         user = cast(User, request.user)
 
         orders = Order.objects.filter(user=user)
-        order_stats = OrderStatisticsService.calculate_order_stats(orders)
-        cancellation_exchange_refund_stats = OrderStatisticsService.calculate_cancellation_exchange_refund_stats(orders)
+        stats = OrderStatsService.get_user_stats(user.id)
+        order_stats = stats.get_order_stats()
+        cancellation_exchange_refund_stats = stats.get_cancellation_exchange_refund_stats()
 
         shipping_orders = orders.filter(
             status=Order.Status.PAID,
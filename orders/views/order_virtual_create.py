@@ -1,4 +1,5 @@
 import json
+from dataclasses import asdict
 from typing import Any, Dict, cast
 
 from django.contrib.auth.mixins import LoginRequiredMixin
@@ -28,12 +29,14 @@ class OrderCreateVirtualView(LoginRequiredMixin, View):
             return JsonResponse({"error": "잘못된 JSON 형식입니다."}, status=400)
 
         items_data = data.get("items", [])
-        is_valid, error_message, validated_items, total_amount = (
-            OrderService.validate_and_prepare_order_items(items_data)
-        )
+        validation = OrderService.prepare_order_items(items_data)
+        if not validation.is_valid:
+            return JsonResponse({
+                "error": validation.errors[0].message,
+                "errors": [asdict(error) for error in validation.errors],
+            }, status=400)
 
-        if not is_valid:
-            return JsonResponse({"error": error_message}, status=400)
+        validated_items, total_amount = validation.items, validation.total_amount
 
         user = cast(User, request.user)
         order_id = TossPaymentService.generate_order_id()
@@ -0,0 +1,61 @@
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from payments.services.payment_log_sink import FLUSH_BATCH_SIZE, PaymentLogSink
+
+
+class Command(BaseCommand):
+    help = 'Bulk insert buffered PaymentLog entries from the Redis stream'
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=FLUSH_BATCH_SIZE,
+            help='Number of log entries inserted per bulk_create',
+        )
+        parser.add_argument(
+            '--block',
+            type=int,
+            default=2000,
+            help='Milliseconds to block waiting for new entries',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Drain the stream once and exit',
+        )
+        parser.add_argument(
+            '--recover',
+            action='store_true',
+            help='Recreate CONFIRM logs missing for recently approved payments and exit',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        batch_size = options['batch_size']
+        consumer = PaymentLogSink.default_consumer_name()
+
+        if options['recover']:
+            recovered = PaymentLogSink.recover_confirm_logs()
+            self.stdout.write(self.style.SUCCESS(f'Recovered {recovered} confirm logs'))
+            return
+
+        if options['once']:
+            total = 0
+            while count := PaymentLogSink.flush(consumer, batch_size):
+                total += count
+            self.stdout.write(self.style.SUCCESS(f'Flushed {total} payment logs'))
+            return
+
+        while True:
+            try:
+                count = PaymentLogSink.flush(consumer, batch_size, block_ms=options['block'])
+            except Exception as e:
+                # DB/Redis 장애: ack 하지 않은 항목은 다음 회수 때 다시 처리된다
+                self.stdout.write(self.style.ERROR(f'Flushing payment logs failed: {e}'))
+                time.sleep(options['block'] / 1000)
+                continue
+            if count:
+                self.stdout.write(f'Flushed {count} payment logs')
@@ -0,0 +1,22 @@
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0005_payment_earned_point_payment_is_used_point_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='paymentlog',
+            name='event_id',
+            field=models.CharField(blank=True, editable=False, max_length=32, null=True, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='paymentlog',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -1,7 +1,7 @@
 from django.db import models
 from django.utils import timezone
 
-from membership.models import UserPoint
+from membership.services.point_service import PointService
 from orders.models import Order
 
 
@@ -94,19 +94,12 @@ class Payment(models.Model):
 
         user = self.order.user
 
-        current_balance = UserPoint.get_user_balance(user)
-
         if self.used_point > 0:
-            if current_balance < self.used_point:
-                raise ValueError("보유 포인트가 부족합니다.")
-
-            current_balance -= self.used_point
-            UserPoint.objects.create(
-                user=user,
-                point_type=UserPoint.PointType.USE,
-                amount=-self.used_point,
+            # 잔액 행을 잠근 뒤 차감하므로 동시 결제에서도 잔액 이상 사용할 수 없다
+            PointService.use(
+                user,
+                self.used_point,
                 description=f"주문 {self.order.order_id} 결제 사용",
-                balance_after=current_balance,
                 related_order=self.order,
             )
             self.is_used_point = True
@@ -116,13 +109,10 @@ class Payment(models.Model):
 
         earn_amount = int(self.order.total_amount * 0.05)  # 예: 5% 적립
         if earn_amount > 0:
-            new_balance = current_balance + earn_amount
-            UserPoint.objects.create(
-                user=user,
-                point_type=UserPoint.PointType.EARN,
-                amount=earn_amount,
+            PointService.earn(
+                user,
+                earn_amount,
                 description=f"주문 {self.order.order_id} 결제 적립",
-                balance_after=new_balance,
                 related_order=self.order,
             )
             self.earned_point = earn_amount
@@ -157,7 +147,10 @@ class PaymentLog(models.Model):
     status_code = models.PositiveIntegerField(null=True, blank=True)
     response_time_ms = models.PositiveIntegerField(null=True, blank=True)
     error_message = models.TextField(null=True, blank=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    # 버퍼링된 로그가 다시 전달되어도 한 번만 저장되도록 하는 키
+    event_id = models.CharField(max_length=32, unique=True, null=True, blank=True, editable=False)
+    # 버퍼를 거쳐 나중에 저장되어도 이벤트 발생 시각을 유지
+    created_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
         ordering = ["-created_at"]
@@ -0,0 +1,229 @@
+import json
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+from django.conf import settings
+from django.core.cache import cache as django_cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DataError, IntegrityError, transaction
+from django.utils import timezone
+
+from config.utils.cache_helper import CacheHelper
+from payments.models import Payment, PaymentLog
+
+logger = logging.getLogger(__name__)
+
+STREAM_KEY = 'payment:logs'
+CONSUMER_GROUP = 'payment-log-writers'
+DEAD_LETTER_KEY = 'payment:logs:dead'
+FLUSH_BATCH_SIZE = 200
+# 이 시간 동안 ack 되지 않은 항목은 처리하던 워커가 죽은 것으로 보고 다른 워커가 가져간다
+RECLAIM_IDLE_MS = 60_000
+CONFIRM_EVENT = 'CONFIRM'
+# 승인 후 이 시간이 지나도 CONFIRM 로그가 없는 결제만 복구한다 (stream 에서 아직 저장 전인 항목과 겹치지 않도록)
+RECOVERY_GRACE = timedelta(minutes=10)
+RECOVERY_WINDOW = timedelta(days=1)
+
+
+class PaymentLogSink:
+    """
+    PaymentLog 를 요청 경로 밖에서 저장하는 append-only 싱크.
+    - 정상 이벤트: 트랜잭션 커밋 후 Redis stream 에 넣고 flush_payment_logs 워커가 bulk_create
+    - 실패 이벤트(_FAIL, 4xx/5xx, 오류 메시지)나 stream 기록 실패: 즉시 동기 저장
+    consumer group 으로 ack 전까지 다시 전달되고(at-least-once), event_id 로 중복 저장을 막는다.
+    커밋과 stream 기록 사이에 프로세스가 죽으면 정상 이벤트가 빠질 수 있다. 승인(CONFIRM) 로그는
+    같은 트랜잭션에 저장된 결제 행을 outbox 로 삼아 recover_confirm_logs 가 다시 만든다.
+    """
+
+    @staticmethod
+    def _key(key: str) -> str:
+        return django_cache.make_key(key)
+
+    @staticmethod
+    def is_failure(event_type: str, status_code: Optional[int], error_message: Optional[str]) -> bool:
+        return event_type.endswith('_FAIL') or bool(error_message) or status_code is None or status_code >= 400
+
+    @staticmethod
+    def confirm_event_id(payment_key: str) -> str:
+        # 결제마다 승인 로그는 하나이므로 stream 과 복구 경로가 같은 키를 써서 한 번만 저장된다
+        return uuid.uuid5(uuid.NAMESPACE_URL, f'toss-confirm:{payment_key}').hex
+
+    @staticmethod
+    def emit(
+        provider: str,
+        event_type: str,
+        request_payload: Dict[str, Any],
+        payment: Optional[Payment] = None,
+        request_url: Optional[str] = None,
+        response_payload: Optional[Dict[str, Any]] = None,
+        status_code: Optional[int] = None,
+        response_time_ms: Optional[int] = None,
+        error_message: Optional[str] = None,
+    ) -> None:
+        event_id = uuid.uuid4().hex
+        if payment is not None and event_type == CONFIRM_EVENT and not error_message:
+            event_id = PaymentLogSink.confirm_event_id(payment.payment_key)
+        fields: Dict[str, Any] = {
+            'event_id': event_id,
+            'payment_id': payment.pk if payment else None,
+            'provider': provider,
+            'event_type': event_type,
+            'request_url': request_url,
+            'request_payload': request_payload,
+            'response_payload': response_payload,
+            'status_code': status_code,
+            'response_time_ms': response_time_ms,
+            'error_message': error_message,
+            'created_at': timezone.now(),
+        }
+
+        if PaymentLogSink.is_failure(event_type, status_code, error_message):
+            PaymentLog.objects.create(**fields)
+            return
+
+        # 롤백된 결제의 로그는 남기지 않고, 결제 트랜잭션에는 비즈니스 행만 들어가도록 커밋 이후에 기록
+        transaction.on_commit(lambda: PaymentLogSink._append(fields))
+
+    @staticmethod
+    def _append(fields: Dict[str, Any]) -> None:
+        try:
+            CacheHelper.get_redis_client().xadd(
+                PaymentLogSink._key(STREAM_KEY),
+                {'data': json.dumps(fields, cls=DjangoJSONEncoder, ensure_ascii=False)},
+            )
+        except Exception:
+            logger.exception("Failed to buffer payment log %s, writing synchronously", fields['event_id'])
+            PaymentLog.objects.bulk_create([PaymentLog(**fields)], ignore_conflicts=True)
+
+    @staticmethod
+    def _decode(raw: Dict[Any, Any]) -> PaymentLog:
+        data = raw.get(b'data', raw.get('data'))
+        if data is None:
+            raise ValueError('missing data field')
+        fields = json.loads(data)
+        fields['created_at'] = datetime.fromisoformat(fields['created_at'])
+        return PaymentLog(**fields)
+
+    @staticmethod
+    def ensure_group() -> None:
+        try:
+            CacheHelper.get_redis_client().xgroup_create(
+                PaymentLogSink._key(STREAM_KEY), CONSUMER_GROUP, id='0', mkstream=True
+            )
+        except Exception as e:
+            if 'BUSYGROUP' not in str(e):
+                raise
+
+    @staticmethod
+    def default_consumer_name() -> str:
+        return f'{socket.gethostname()}-{os.getpid()}'
+
+    @staticmethod
+    def _read(consumer: str, batch_size: int, block_ms: Optional[int]) -> List[Tuple[Any, Dict[Any, Any]]]:
+        redis_client = CacheHelper.get_redis_client()
+        stream_key = PaymentLogSink._key(STREAM_KEY)
+
+        # 죽은 워커가 ack 하지 못한 항목을 먼저 회수
+        reclaimed = cast(List[Any], redis_client.xautoclaim(
+            stream_key, CONSUMER_GROUP, consumer, min_idle_time=RECLAIM_IDLE_MS, start_id='0-0', count=batch_size
+        ))
+        messages = [message for message in reclaimed[1] if message[1]]
+        if messages:
+            return messages
+
+        response = cast(Optional[List[Any]], redis_client.xreadgroup(
+            CONSUMER_GROUP, consumer, {stream_key: '>'}, count=batch_size, block=block_ms
+        ))
+        return [message for _, stream_messages in response or [] for message in stream_messages]
+
+    @staticmethod
+    def _dead_letter(message_id: Any, raw: Dict[Any, Any], reason: str) -> None:
+        data = raw.get(b'data', raw.get('data'))
+        CacheHelper.get_redis_client().lpush(PaymentLogSink._key(DEAD_LETTER_KEY), json.dumps({
+            'message_id': message_id.decode('utf-8') if isinstance(message_id, bytes) else message_id,
+            'data': data.decode('utf-8') if isinstance(data, bytes) else data,
+            'reason': reason,
+            'failed_at': timezone.now().isoformat(),
+        }, ensure_ascii=False))
+
+    @staticmethod
+    def flush(consumer: Optional[str] = None, batch_size: int = FLUSH_BATCH_SIZE, block_ms: Optional[int] = None) -> int:
+        """stream 에서 한 배치를 읽어 저장하고 처리한 항목 수를 반환"""
+        PaymentLogSink.ensure_group()
+        messages = PaymentLogSink._read(consumer or PaymentLogSink.default_consumer_name(), batch_size, block_ms)
+        if not messages:
+            return 0
+
+        decoded: List[Tuple[Any, Dict[Any, Any], PaymentLog]] = []
+        for message_id, raw in messages:
+            try:
+                decoded.append((message_id, raw, PaymentLogSink._decode(raw)))
+            except (TypeError, ValueError) as e:
+                PaymentLogSink._dead_letter(message_id, raw, f'decode error: {e}')
+
+        try:
+            PaymentLog.objects.bulk_create(
+                [log for _, _, log in decoded], ignore_conflicts=True, batch_size=batch_size
+            )
+        except (IntegrityError, DataError) as e:
+            # 결제가 삭제되어 FK 가 깨진 항목 등: 한 건씩 저장하고 실패한 항목만 dead-letter
+            # (DB 연결 오류는 ack 하지 않고 그대로 던져 다음 회수 때 다시 저장한다)
+            logger.warning("Bulk insert of payment logs failed, retrying one by one: %s", e)
+            for message_id, raw, log in decoded:
+                try:
+                    with transaction.atomic():
+                        PaymentLog.objects.bulk_create([log], ignore_conflicts=True)
+                except (IntegrityError, DataError) as row_error:
+                    PaymentLogSink._dead_letter(message_id, raw, str(row_error))
+
+        # 저장이 끝난 뒤에만 ack (그 전에 죽으면 다른 워커가 회수해 다시 저장)
+        message_ids = [message_id for message_id, _ in messages]
+        pipeline = CacheHelper.get_redis_client().pipeline(transaction=False)
+        pipeline.xack(PaymentLogSink._key(STREAM_KEY), CONSUMER_GROUP, *message_ids)
+        pipeline.xdel(PaymentLogSink._key(STREAM_KEY), *message_ids)
+        pipeline.execute()
+        return len(messages)
+
+    @staticmethod
+    def pending_count() -> int:
+        return cast(int, CacheHelper.get_redis_client().xlen(PaymentLogSink._key(STREAM_KEY)))
+
+    @staticmethod
+    def recover_confirm_logs(now: Optional[datetime] = None) -> int:
+        """승인된 결제 중 CONFIRM 로그가 빠진 결제의 로그를 결제 행(raw_response)으로 다시 만들고 개수를 반환"""
+        now = now or timezone.now()
+        payments = (
+            Payment.objects.filter(
+                provider='toss',
+                status='APPROVED',
+                approved_at__range=(now - RECOVERY_WINDOW, now - RECOVERY_GRACE),
+            )
+            .exclude(method='VIRTUAL_ACCOUNT')
+            .exclude(logs__event_type=CONFIRM_EVENT)
+            .select_related('order')
+        )
+        logs = [
+            PaymentLog(
+                event_id=PaymentLogSink.confirm_event_id(payment.payment_key),
+                payment=payment,
+                provider=payment.provider,
+                event_type=CONFIRM_EVENT,
+                request_url=f"{settings.TOSS_API_BASE}/payments/confirm",
+                request_payload={
+                    'paymentKey': payment.payment_key,
+                    'orderId': payment.order.order_id,
+                    'amount': payment.amount,
+                },
+                response_payload=payment.raw_response,
+                status_code=200,
+                created_at=payment.approved_at or now,
+            )
+            for payment in payments
+        ]
+        if logs:
+            PaymentLog.objects.bulk_create(logs, ignore_conflicts=True)
+        return len(logs)
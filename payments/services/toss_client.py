@@ -0,0 +1,216 @@
+import base64
+import logging
+import os
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple, cast
+
+import requests
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache as django_cache
+from requests.adapters import HTTPAdapter
+
+from config.utils.cache_helper import CacheHelper
+
+logger = logging.getLogger(__name__)
+
+# (connect, read) 초. 연결은 빨리 포기하고 승인 응답은 충분히 기다린다
+TOSS_TIMEOUT: Tuple[float, float] = (3.05, 10.0)
+# 재시도를 포함한 호출 전체의 시한 (초). 시도마다 남은 시간만큼만 기다린다
+TOSS_DEADLINE = 10.0
+TOSS_POOL_SIZE = 20
+TOSS_MAX_RETRIES = 2
+TOSS_BACKOFF_BASE = 0.2
+TOSS_BACKOFF_MAX = 2.0
+RETRY_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+METRICS_KEY_PREFIX = 'metrics:toss'
+# 지연 시간 히스토그램 버킷 상한 (ms)
+LATENCY_BUCKETS_MS = (100, 250, 500, 1000, 2500, 5000)
+
+
+@dataclass
+class TossResponse:
+    status_code: int
+    data: Dict[str, Any] = field(default_factory=dict)
+    text: str = ''
+    is_json: bool = True
+    elapsed_ms: int = 0
+    attempts: int = 1
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code == 200
+
+
+class TossMetrics:
+    """엔드포인트별 호출 수/실패 수/지연 시간 합계와 히스토그램을 Redis hash 에 누적"""
+
+    @staticmethod
+    def _key(endpoint: str) -> str:
+        return django_cache.make_key(f'{METRICS_KEY_PREFIX}:{endpoint}')
+
+    @staticmethod
+    def _bucket(elapsed_ms: int) -> str:
+        for upper in LATENCY_BUCKETS_MS:
+            if elapsed_ms <= upper:
+                return f'le_{upper}'
+        return 'le_inf'
+
+    @staticmethod
+    def record(endpoint: str, elapsed_ms: int, status_code: Optional[int], attempts: int) -> None:
+        failed = status_code is None or status_code >= 500
+        logger.info(
+            "toss %s status=%s elapsed_ms=%d attempts=%d", endpoint, status_code, elapsed_ms, attempts
+        )
+        try:
+            pipeline = CacheHelper.get_redis_client().pipeline(transaction=False)
+            key = TossMetrics._key(endpoint)
+            pipeline.hincrby(key, 'calls', 1)
+            pipeline.hincrby(key, 'retries', attempts - 1)
+            pipeline.hincrby(key, 'errors', int(failed))
+            pipeline.hincrby(key, 'total_ms', elapsed_ms)
+            pipeline.hincrby(key, TossMetrics._bucket(elapsed_ms), 1)
+            pipeline.execute()
+        except Exception:
+            # 지표 저장 실패가 결제 흐름을 막지 않도록 한다
+            logger.exception("Failed to record toss metrics for %s", endpoint)
+
+    @staticmethod
+    def snapshot(endpoint: str) -> Dict[str, int]:
+        raw = cast(Dict[bytes, bytes], CacheHelper.get_redis_client().hgetall(TossMetrics._key(endpoint)))
+        return {
+            (name.decode('utf-8') if isinstance(name, bytes) else name): int(value)
+            for name, value in raw.items()
+        }
+
+
+class TossClient:
+    """
+    Toss Payments API 클라이언트.
+    - 프로세스(스레드)마다 keep-alive 커넥션 풀을 가진 requests.Session 을 재사용
+    - 모든 POST 에 Idempotency-Key 를 붙이고, 연결 오류/5xx 만 전체 시한 안에서 지터를 둔 지수 백오프로 재시도
+    - 응답 대기 중 타임아웃(ReadTimeout)은 Toss 가 이미 처리했을 수 있으므로 재시도하지 않는다
+    - 호출별 지연 시간을 TossMetrics 에 기록
+    """
+
+    def __init__(
+        self,
+        pool_size: int = TOSS_POOL_SIZE,
+        timeout: Tuple[float, float] = TOSS_TIMEOUT,
+        max_retries: int = TOSS_MAX_RETRIES,
+        deadline: float = TOSS_DEADLINE,
+    ) -> None:
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.deadline = deadline
+        self._local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        # Session 은 스레드 안전하지 않으므로 스레드마다 하나씩 둔다 (gunicorn sync 워커는 1개)
+        session: Optional[requests.Session] = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            # 재시도는 post() 에서 직접 처리
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=0)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._local.session = session
+        return session
+
+    @staticmethod
+    def auth_headers() -> Dict[str, str]:
+        secret_key = os.getenv("TOSS_SECRET_KEY", "")
+        if not secret_key:
+            raise ValueError("TOSS_SECRET_KEY not found in environment")
+
+        encoded_key = base64.b64encode(f"{secret_key}:".encode("utf-8")).decode("utf-8")
+
+        return {
+            "Authorization": f"Basic {encoded_key}",
+            "Content-Type": "application/json",
+        }
+
+    @staticmethod
+    def url(path: str) -> str:
+        return f"{settings.TOSS_API_BASE}/{path.lstrip('/')}"
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        # full jitter: 0 ~ min(max, base * 2^attempt)
+        return random.uniform(0, min(TOSS_BACKOFF_MAX, TOSS_BACKOFF_BASE * (2 ** attempt)))
+
+    def _send(
+        self, url: str, headers: Dict[str, str], payload: Dict[str, Any], timeout: Tuple[float, float]
+    ) -> requests.Response:
+        return self.session.post(url, headers=headers, json=payload, timeout=timeout)
+
+    def _attempt_timeout(self, remaining: float) -> Tuple[float, float]:
+        connect_timeout, read_timeout = self.timeout
+        return min(connect_timeout, remaining), min(read_timeout, remaining)
+
+    @staticmethod
+    def _to_response(res: requests.Response, elapsed_ms: int, attempts: int) -> TossResponse:
+        try:
+            data = res.json()
+            is_json = isinstance(data, dict)
+        except ValueError:
+            data, is_json = {}, False
+        return TossResponse(
+            status_code=res.status_code,
+            data=data if is_json else {},
+            text=res.text if not is_json else '',
+            is_json=is_json,
+            elapsed_ms=elapsed_ms,
+            attempts=attempts,
+        )
+
+    def post(self, path: str, payload: Dict[str, Any], idempotency_key: Optional[str] = None) -> TossResponse:
+        """
+        연결 오류가 시한 안에 해소되지 않거나 응답 대기 중 타임아웃이면 requests.RequestException 을 그대로 던진다.
+        같은 Idempotency-Key 로 재시도하므로 Toss 에서 중복 승인/발급되지 않는다.
+        """
+        headers = {**TossClient.auth_headers(), "Idempotency-Key": idempotency_key or uuid.uuid4().hex}
+        url = TossClient.url(path)
+        endpoint = path.strip('/').split('/')[-1]
+
+        started = time.perf_counter()
+        deadline = started + self.deadline
+        attempt = 0
+        while True:
+            attempt += 1
+            res: Optional[requests.Response] = None
+            try:
+                res = self._send(url, headers, payload, self._attempt_timeout(deadline - time.perf_counter()))
+            except requests.exceptions.ConnectionError as e:
+                # 연결 오류(ConnectTimeout 포함)만 다시 보낸다. 도달했더라도 같은 Idempotency-Key 라 중복 처리되지 않는다
+                error = e
+            except requests.exceptions.RequestException:
+                TossMetrics.record(endpoint, int((time.perf_counter() - started) * 1000), None, attempt)
+                raise
+
+            delay = TossClient._backoff(attempt)
+            retryable = res is None or res.status_code in RETRY_STATUS_CODES
+            # 백오프 후에도 연결 타임아웃만큼의 시간이 남아 있을 때만 재시도한다
+            if retryable and attempt <= self.max_retries and time.perf_counter() + delay + self.timeout[0] <= deadline:
+                time.sleep(delay)
+                continue
+
+            elapsed_ms = int((time.perf_counter() - started) * 1000)
+            TossMetrics.record(endpoint, elapsed_ms, res.status_code if res is not None else None, attempt)
+            if res is None:
+                raise error
+            return TossClient._to_response(res, elapsed_ms, attempt)
+
+    async def apost(self, path: str, payload: Dict[str, Any], idempotency_key: Optional[str] = None) -> TossResponse:
+        # ASGI 뷰용. 이벤트 루프를 막지 않도록 스레드 풀에서 같은 커넥션 풀/재시도 로직으로 호출한다
+        return await sync_to_async(self.post, thread_sensitive=False)(path, payload, idempotency_key)
+
+
+toss_client = TossClient()
@@ -1,7 +1,5 @@
-import base64
-import os
 import uuid
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 from django.contrib.auth import get_user_model
@@ -10,25 +8,17 @@ from django.utils import timezone
 
 from carts.models import Cart
 from orders.models import Order, OrderItem
-from payments.models import Payment, PaymentLog
+from payments.models import Payment
+from payments.services.payment_log_sink import PaymentLogSink
+from payments.services.toss_client import TossClient, toss_client
 from products.models import Color
-
-TOSS_API_BASE = os.getenv("TOSS_API_BASE")
+from products.services.stock_reservation import StockReservationService
 
 
 class TossPaymentService:
     @staticmethod
     def get_toss_headers() -> Dict[str, str]:
-        secret_key = os.getenv("TOSS_SECRET_KEY", "")
-        if not secret_key:
-            raise ValueError("TOSS_SECRET_KEY not found in environment")
-
-        encoded_key = base64.b64encode(f"{secret_key}:".encode("utf-8")).decode("utf-8")
-
-        return {
-            "Authorization": f"Basic {encoded_key}",
-            "Content-Type": "application/json",
-        }
+        return TossClient.auth_headers()
 
     @staticmethod
     def generate_order_id() -> str:
@@ -77,43 +67,79 @@ class TossPaymentService:
         order_id: str,
         amount: int
     ) -> Tuple[bool, str, Dict[str, Any], int]:
-        url = f"{TOSS_API_BASE}/payments/confirm"
+        url = TossClient.url("payments/confirm")
         payload = {"paymentKey": payment_key, "orderId": order_id, "amount": amount}
 
         try:
-            res = requests.post(
-                url,
-                headers=TossPaymentService.get_toss_headers(),
-                json=payload,
-                timeout=10
-            )
-            data: Dict[str, Any] = res.json()
-
-            if res.status_code == 200:
-                return True, "", data, res.status_code
-            else:
-                PaymentLog.objects.create(
-                    provider="toss",
-                    event_type="CONFIRM_FAIL",
-                    request_url=url,
-                    request_payload=payload,
-                    response_payload=data,
-                    status_code=res.status_code,
-                )
-                error_message = data.get("message", "결제 승인 실패")
-                return False, error_message, data, res.status_code
-
+            # 같은 결제에 대한 중복 승인 요청(새로고침, 재시도)은 Toss 가 첫 응답을 돌려준다
+            res = toss_client.post("payments/confirm", payload, idempotency_key=f"confirm-{order_id}-{payment_key}")
         except requests.exceptions.RequestException as e:
-            PaymentLog.objects.create(
+            PaymentLogSink.emit(
                 provider="toss",
                 event_type="CONFIRM",
                 request_url=url,
                 request_payload=payload,
                 response_payload={"error": str(e)},
                 status_code=503,
+                error_message=str(e),
             )
+            if isinstance(e, requests.exceptions.ReadTimeout):
+                # 승인 요청은 재시도하지 않으므로, 처리됐을지 모르는 결제를 취소해 주문 없는 결제가 남지 않게 한다
+                TossPaymentService.cancel_payment(payment_key, order_id, "승인 응답 시간 초과로 인한 자동 취소")
             return False, "결제 승인 요청 중 오류 발생", {}, 503
 
+        if res.ok:
+            return True, "", res.data, res.status_code
+
+        PaymentLogSink.emit(
+            provider="toss",
+            event_type="CONFIRM_FAIL",
+            request_url=url,
+            request_payload=payload,
+            response_payload=res.data if res.is_json else {"text": res.text[:1000]},
+            status_code=res.status_code,
+            response_time_ms=res.elapsed_ms,
+        )
+        error_message = res.data.get("message", "결제 승인 실패")
+        return False, error_message, res.data, res.status_code
+
+    @staticmethod
+    def cancel_payment(payment_key: str, order_id: str, reason: str) -> bool:
+        """
+        승인 후 주문 생성에 실패한 결제를 취소한다.
+        같은 Idempotency-Key 를 쓰므로 여러 번 호출해도 한 번만 취소된다.
+        """
+        path = f"payments/{payment_key}/cancel"
+        url = TossClient.url(path)
+        payload = {"cancelReason": reason}
+
+        try:
+            res = toss_client.post(path, payload, idempotency_key=f"cancel-{order_id}-{payment_key}")
+        except requests.exceptions.RequestException as e:
+            PaymentLogSink.emit(
+                provider="toss",
+                event_type="CANCEL_FAIL",
+                request_url=url,
+                request_payload=payload,
+                response_payload={"error": str(e)},
+                status_code=503,
+                error_message=str(e),
+            )
+            return False
+
+        PaymentLogSink.emit(
+            provider="toss",
+            event_type="CANCEL" if res.ok else "CANCEL_FAIL",
+            request_url=url,
+            request_payload=payload,
+            response_payload=res.data if res.is_json else {"text": res.text[:1000]},
+            status_code=res.status_code,
+            response_time_ms=res.elapsed_ms,
+            # 취소 사유를 함께 남겨 성공한 취소도 즉시 저장한다
+            error_message=reason,
+        )
+        return res.ok
+
     @staticmethod
     def validate_payment_amount(cache_data: Dict[str, Any], amount: int) -> Tuple[bool, str]:
         expected_amount = int(cache_data.get("amount", 0))
@@ -136,6 +162,7 @@ class TossPaymentService:
         request_payload: Dict[str, Any],
         response_status_code: int,
         used_point: int = 0,
+        reservation_id: Optional[str] = None,
     ) -> None:
         user = get_user_model().objects.get(id=user_id)
         order_name = TossPaymentService.generate_order_name(items_data)
@@ -149,6 +176,9 @@ class TossPaymentService:
         used_point_value = max(0, used_point_value)
 
         with transaction.atomic():
+            # 보류해 둔 재고를 DB 에 조건부로 차감 (부족하면 주문 생성 전체를 되돌린다)
+            StockReservationService.commit(reservation_id, items_data)
+
             order = Order.objects.create(
                 order_id=order_id,
                 user=user,
@@ -194,7 +224,8 @@ class TossPaymentService:
 
             payment.approve()
 
-            PaymentLog.objects.create(
+            # 결제 트랜잭션에는 넣지 않고 커밋 이후 버퍼(stream)로 보낸다
+            PaymentLogSink.emit(
                 provider="toss",
                 event_type="CONFIRM",
                 request_url=request_url,
@@ -0,0 +1,120 @@
+import json
+from datetime import timedelta
+from typing import Any, List, cast
+
+import pytest
+from django.core.cache import cache as django_cache
+from django.db import transaction
+from django.utils import timezone
+
+from config.utils.cache_helper import CacheHelper
+from config.utils.setup_test_method import TestSetupMixin
+from orders.models import Order
+from payments.models import Payment, PaymentLog
+from payments.services.payment_log_sink import (
+    DEAD_LETTER_KEY,
+    STREAM_KEY,
+    PaymentLogSink,
+)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestPaymentLogSink(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.clear_stream()
+        order = Order.objects.create(
+            user=self.customer_user, order_id="ORD-LOG", product_name="테스트", total_amount=10000, status="PAID"
+        )
+        self.payment = Payment.objects.create(
+            order=order, provider="toss", method="CARD", payment_key="log_payment_key", amount=10000
+        )
+
+    def teardown_method(self) -> None:
+        self.clear_stream()
+
+    def clear_stream(self) -> None:
+        CacheHelper.get_redis_client().delete(
+            django_cache.make_key(STREAM_KEY), django_cache.make_key(DEAD_LETTER_KEY)
+        )
+
+    def emit_confirm(self) -> None:
+        PaymentLogSink.emit(
+            provider="toss",
+            event_type="CONFIRM",
+            request_payload={"orderId": "ORD-LOG"},
+            response_payload={"status": "DONE"},
+            status_code=200,
+            payment=self.payment,
+        )
+
+    def test_failure_written_synchronously(self) -> None:
+        PaymentLogSink.emit(
+            provider="toss", event_type="CONFIRM_FAIL", request_payload={}, status_code=400
+        )
+
+        assert PaymentLog.objects.filter(event_type="CONFIRM_FAIL").count() == 1
+        assert PaymentLogSink.pending_count() == 0
+
+    def test_success_buffered_until_flush(self) -> None:
+        with transaction.atomic():
+            self.emit_confirm()
+            assert PaymentLogSink.pending_count() == 0
+
+        assert PaymentLogSink.pending_count() == 1
+        assert not PaymentLog.objects.exists()
+
+        assert PaymentLogSink.flush("test") == 1
+
+        log = PaymentLog.objects.get()
+        assert log.payment == self.payment
+        assert log.response_payload == {"status": "DONE"}
+        assert PaymentLogSink.pending_count() == 0
+
+    def test_rolled_back_event_not_buffered(self) -> None:
+        with pytest.raises(RuntimeError):
+            with transaction.atomic():
+                self.emit_confirm()
+                raise RuntimeError
+
+        assert PaymentLogSink.pending_count() == 0
+
+    def test_redelivery_does_not_duplicate(self) -> None:
+        self.emit_confirm()
+        redis_client = CacheHelper.get_redis_client()
+        [(_, raw)] = cast(List[Any], redis_client.xrange(django_cache.make_key(STREAM_KEY)))
+        redis_client.xadd(django_cache.make_key(STREAM_KEY), raw)
+
+        assert PaymentLogSink.flush("test") == 2
+        assert PaymentLog.objects.count() == 1
+
+    def test_broken_entry_dead_lettered(self) -> None:
+        self.emit_confirm()
+        self.payment.delete()
+
+        assert PaymentLogSink.flush("test") == 1
+
+        dead = cast(List[bytes], CacheHelper.get_redis_client().lrange(django_cache.make_key(DEAD_LETTER_KEY), 0, -1))
+        assert len(dead) == 1
+        assert json.loads(dead[0])["data"]
+        assert not PaymentLog.objects.exists()
+
+    def test_missing_confirm_log_recovered_once(self) -> None:
+        self.payment.raw_response = {"status": "DONE"}
+        self.payment.status = "APPROVED"
+        self.payment.approved_at = timezone.now() - timedelta(hours=1)
+        self.payment.save()
+        # 커밋 후 stream 에 넣기 전에 죽은 경우: 승인 로그가 없다
+        assert PaymentLogSink.recover_confirm_logs() == 1
+
+        log = PaymentLog.objects.get()
+        assert log.event_type == "CONFIRM"
+        assert log.request_payload == {"paymentKey": "log_payment_key", "orderId": "ORD-LOG", "amount": 10000}
+        assert log.response_payload == {"status": "DONE"}
+        assert PaymentLogSink.recover_confirm_logs() == 0
+
+        # 늦게 도착한 stream 항목은 같은 event_id 라 중복 저장되지 않는다
+        self.emit_confirm()
+        assert PaymentLogSink.flush("test") == 1
+        assert PaymentLog.objects.count() == 1
+
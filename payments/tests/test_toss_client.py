@@ -0,0 +1,97 @@
+import asyncio
+import os
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from django.core.cache import cache as django_cache
+
+from config.utils.cache_helper import CacheHelper
+from payments.services.toss_client import TossClient, TossMetrics
+
+
+def make_response(status_code: int, data: Any) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = data
+    return response
+
+
+@patch.dict(os.environ, {"TOSS_SECRET_KEY": "test_secret"})
+@patch("payments.services.toss_client.time.sleep")
+class TestTossClient:
+    def setup_method(self) -> None:
+        self.client = TossClient(max_retries=2)
+        CacheHelper.get_redis_client().delete(django_cache.make_key("metrics:toss:confirm"))
+
+    @patch("payments.services.toss_client.TossClient._send")
+    def test_retries_server_errors_with_same_idempotency_key(self, mock_send: Any, mock_sleep: Any) -> None:
+        mock_send.side_effect = [make_response(503, {}), make_response(200, {"status": "DONE"})]
+
+        res = self.client.post("payments/confirm", {"orderId": "ORD-1"}, idempotency_key="confirm-ORD-1")
+
+        assert res.ok
+        assert res.attempts == 2
+        assert res.data == {"status": "DONE"}
+        keys = {call.args[1]["Idempotency-Key"] for call in mock_send.call_args_list}
+        assert keys == {"confirm-ORD-1"}
+        assert mock_sleep.call_count == 1
+
+    @patch("payments.services.toss_client.TossClient._send")
+    def test_client_errors_not_retried(self, mock_send: Any, mock_sleep: Any) -> None:
+        mock_send.return_value = make_response(400, {"message": "잘못된 요청"})
+
+        res = self.client.post("payments/confirm", {})
+
+        assert res.status_code == 400
+        assert mock_send.call_count == 1
+        assert mock_sleep.call_count == 0
+
+    @patch("payments.services.toss_client.TossClient._send")
+    def test_connect_errors_raise_after_retries(self, mock_send: Any, mock_sleep: Any) -> None:
+        mock_send.side_effect = requests.exceptions.ConnectTimeout("timeout")
+
+        with pytest.raises(requests.exceptions.ConnectTimeout):
+            self.client.post("payments/confirm", {})
+
+        assert mock_send.call_count == 3
+        metrics = TossMetrics.snapshot("confirm")
+        assert metrics["calls"] == 1
+        assert metrics["errors"] == 1
+        assert metrics["retries"] == 2
+
+    @patch("payments.services.toss_client.TossClient._send")
+    def test_read_timeouts_not_retried(self, mock_send: Any, mock_sleep: Any) -> None:
+        mock_send.side_effect = requests.exceptions.ReadTimeout("timeout")
+
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            self.client.post("payments/confirm", {})
+
+        assert mock_send.call_count == 1
+        assert mock_sleep.call_count == 0
+
+    @patch("payments.services.toss_client.TossClient._send")
+    def test_retries_stop_at_deadline(self, mock_send: Any, mock_sleep: Any) -> None:
+        mock_send.return_value = make_response(503, {})
+        # 연결 타임아웃(3.05초)만큼도 남지 않으면 재시도하지 않는다
+        client = TossClient(max_retries=5, deadline=3.0)
+
+        res = client.post("payments/confirm", {})
+
+        assert res.status_code == 503
+        assert mock_send.call_count == 1
+        timeout = mock_send.call_args.args[3]
+        assert timeout[0] <= 3.0 and timeout[1] <= 3.0
+
+    @patch("payments.services.toss_client.TossClient._send")
+    def test_async_post(self, mock_send: Any, mock_sleep: Any) -> None:
+        mock_send.return_value = make_response(200, {"status": "DONE"})
+
+        res = asyncio.run(self.client.apost("payments/confirm", {}))
+
+        assert res.ok
+        assert TossMetrics.snapshot("confirm")["calls"] == 1
+
+    def test_session_reused(self, mock_sleep: Any) -> None:
+        assert self.client.session is self.client.session
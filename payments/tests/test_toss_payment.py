@@ -11,6 +11,11 @@ from config.utils.cache_helper import CacheHelper
 from config.utils.setup_test_method import TestSetupMixin
 from orders.models import Order
 from payments.models import Payment, PaymentLog
+from payments.services.payment_log_sink import PaymentLogSink
+from products.services.stock_reservation import (
+    InsufficientStockError,
+    StockReservationService,
+)
 
 
 @pytest.mark.django_db(transaction=True)
@@ -47,7 +52,7 @@ class TestTossPaymentCacheFlow(TestSetupMixin):
         assert cached["amount"] == int(self.product.price) * 2
         assert cached["user_id"] == self.customer_user.id
 
-    @patch("payments.services.toss_payment_service.requests.post")
+    @patch("payments.services.toss_client.TossClient._send")
     def test_toss_confirm_creates_order_payment(self, mock_post: Any) -> None:
         self.client.force_login(self.customer_user)
 
@@ -112,13 +117,17 @@ class TestTossPaymentCacheFlow(TestSetupMixin):
         assert payment.payment_key == mock_payment_key
         assert int(payment.amount) == final_amount
 
+        # 승인 로그는 커밋 이후 stream 에 쌓였다가 워커가 저장한다
+        assert not PaymentLog.objects.filter(provider="toss").exists()
+        PaymentLogSink.flush()
+
         log = PaymentLog.objects.filter(provider="toss").first()
         assert log is not None
         assert log.status_code == 200
 
         assert CacheHelper.get(pre_order_key) is None
 
-    @patch("payments.services.toss_payment_service.requests.post")
+    @patch("payments.services.toss_client.TossClient._send")
     def test_toss_confirm_invalid_preorder_key_returns_400(self, mock_post: Any) -> None:
         mock_post.return_value.status_code = 200
         mock_post.return_value.json.return_value = {"status": "ok"}
@@ -141,7 +150,7 @@ class TestTossPaymentCacheFlow(TestSetupMixin):
         assert data["success"] is False
         assert "preOrderKey" in data["error"] or "만료" in data["error"]
 
-    @patch("payments.services.toss_payment_service.requests.post")
+    @patch("payments.services.toss_client.TossClient._send")
     def test_toss_confirm_amount_mismatch(self, mock_post: Any) -> None:
         mock_post.return_value.status_code = 200
         mock_post.return_value.json.return_value = {"status": "ok"}
@@ -182,7 +191,7 @@ class TestTossPaymentCacheFlow(TestSetupMixin):
         assert data["success"] is False
         assert "금액" in data["error"]
 
-    @patch("payments.services.toss_payment_service.requests.post")
+    @patch("payments.services.toss_client.TossClient._send")
     def test_toss_confirm_duplicate_payment(self, mock_post: Any) -> None:
         mock_post.return_value.status_code = 200
         mock_post.return_value.json.return_value = {"status": "ok"}
@@ -240,4 +249,66 @@ class TestTossPaymentCacheFlow(TestSetupMixin):
 
         assert response.status_code == 200
         assert data["success"] is True
-        assert "이미 승인된 결제" in data["message"]
\ No newline at end of file
+        assert "이미 승인된 결제" in data["message"]
+    def set_preorder(self, pre_order_key: str, quantity: int = 1) -> int:
+        product_amount = int(self.product.price) * quantity
+        CacheHelper.set(
+            pre_order_key,
+            {
+                "user_id": self.customer_user.id,
+                "items": [
+                    {
+                        "product_id": self.product.id,
+                        "product_name": self.product.name,
+                        "quantity": quantity,
+                        "unit_price": int(self.product.price),
+                    }
+                ],
+                "amount": product_amount,
+            },
+            timeout=60 * 15,
+        )
+        return product_amount + (0 if product_amount >= 50000 else 3000)
+
+    @patch("payments.services.toss_client.TossClient._send")
+    def test_toss_confirm_out_of_stock_skips_charge(self, mock_post: Any) -> None:
+        self.client.force_login(self.customer_user)
+        pre_order_key = "order:preorder:nostock"
+        final_amount = self.set_preorder(pre_order_key, quantity=self.product.stock + 1)
+
+        response = self.client.get(reverse("payments:toss-confirm"), {
+            "paymentKey": f"mock_{uuid.uuid4().hex}",
+            "orderId": f"ORD-{uuid.uuid4().hex[:6].upper()}",
+            "amount": str(final_amount),
+            "preOrderKey": pre_order_key,
+        })
+
+        assert response.status_code == 409
+        mock_post.assert_not_called()
+
+    @patch("payments.services.toss_client.TossClient._send")
+    def test_toss_confirm_cancels_payment_when_order_fails(self, mock_post: Any) -> None:
+        self.client.force_login(self.customer_user)
+        pre_order_key = "order:preorder:orderfail"
+        final_amount = self.set_preorder(pre_order_key)
+        payment_key = f"mock_{uuid.uuid4().hex}"
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.json.return_value = {"method": "CARD", "paymentKey": payment_key}
+
+        with patch(
+            "payments.services.toss_payment_service.StockReservationService.commit",
+            side_effect=InsufficientStockError(self.product.id, self.product.name),
+        ):
+            response = self.client.get(reverse("payments:toss-confirm"), {
+                "paymentKey": payment_key,
+                "orderId": f"ORD-{uuid.uuid4().hex[:6].upper()}",
+                "amount": str(final_amount),
+                "preOrderKey": pre_order_key,
+            })
+
+        assert response.status_code == 409
+        assert mock_post.call_count == 2
+        assert mock_post.call_args_list[1].args[0].endswith(f"/payments/{payment_key}/cancel")
+        assert not Order.objects.filter(payments__payment_key=payment_key).exists()
+        assert set(PaymentLog.objects.values_list("event_type", flat=True)) == {"ORDER_FAIL", "CANCEL"}
+        assert StockReservationService.get_reserved_quantities(pre_order_key) == {}
@@ -1,6 +1,6 @@
 import os
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -75,7 +75,7 @@ class TestTossPaymentService(TestSetupMixin):
         assert response_data["orderId"] == order_id
         assert response_data["amount"] == final_amount
 
-    @patch("payments.services.toss_payment_service.requests.post")
+    @patch("payments.services.toss_client.TossClient._send")
     def test_confirm_payment_with_api_success(self, mock_post: Any) -> None:
         mock_post.return_value.status_code = 200
         mock_post.return_value.json.return_value = {"method": "CARD", "status": "ok"}
@@ -91,7 +91,7 @@ class TestTossPaymentService(TestSetupMixin):
             assert error_message == ""
             assert status_code == 200
 
-    @patch("payments.services.toss_payment_service.requests.post")
+    @patch("payments.services.toss_client.TossClient._send")
     def test_confirm_payment_with_api_failure(self, mock_post: Any) -> None:
         mock_post.return_value.status_code = 400
         mock_post.return_value.json.return_value = {"message": "결제 실패"}
@@ -107,7 +107,7 @@ class TestTossPaymentService(TestSetupMixin):
             assert "결제 실패" in error_message
             assert status_code == 400
 
-    @patch("payments.services.toss_payment_service.requests.post")
+    @patch("payments.services.toss_client.TossClient._send")
     def test_confirm_payment_with_api_exception(self, mock_post: Any) -> None:
         import requests
         mock_post.side_effect = requests.exceptions.RequestException("Connection error")
@@ -123,6 +123,25 @@ class TestTossPaymentService(TestSetupMixin):
             assert "오류 발생" in error_message
             assert status_code == 503
 
+    @patch("payments.services.toss_client.TossClient._send")
+    def test_confirm_payment_with_api_read_timeout_cancels(self, mock_post: Any) -> None:
+        import requests
+        cancel_response = MagicMock(status_code=200)
+        cancel_response.json.return_value = {"status": "CANCELED"}
+        mock_post.side_effect = [requests.exceptions.ReadTimeout("timeout"), cancel_response]
+
+        with patch.dict(os.environ, {"TOSS_SECRET_KEY": "test_secret"}):
+            is_success, _, _, status_code = TossPaymentService.confirm_payment_with_api(
+                payment_key="test_key",
+                order_id="ORD-123",
+                amount=10000
+            )
+
+        assert is_success is False
+        assert status_code == 503
+        assert mock_post.call_count == 2
+        assert mock_post.call_args_list[1].args[0].endswith("/payments/test_key/cancel")
+
     def test_validate_payment_amount_success(self) -> None:
         cache_data = {"amount": 30000}
         shipping_fee = TossPaymentService.calculate_shipping_fee(30000)
@@ -25,7 +25,7 @@ class TestTossVirtualAccountFlow(TestSetupMixin):
             status="PENDING",
         )
 
-    @patch("payments.views.virtual_bank_view.requests.post")
+    @patch("payments.services.toss_client.TossClient._send")
     def test_virtual_account_request_creates_payment(self, mock_post: Any, client: Any) -> None:
         mock_post.return_value.status_code = 200
         mock_post.return_value.json.return_value = {
@@ -1,4 +1,5 @@
 import json
+import logging
 from typing import Any, Dict, cast
 
 from django.conf import settings
@@ -11,7 +12,14 @@ from django.views import View
 from django.views.decorators.csrf import csrf_exempt, csrf_protect
 
 from config.utils.cache_helper import CacheHelper
+from payments.services.payment_log_sink import PaymentLogSink
 from payments.services.toss_payment_service import TossPaymentService
+from products.services.stock_reservation import (
+    InsufficientStockError,
+    StockReservationService,
+)
+
+logger = logging.getLogger(__name__)
 
 
 @method_decorator(csrf_protect, name='dispatch')
@@ -73,6 +81,7 @@ class TossFailView(View):
         pre_order_key = request.GET.get("preOrderKey")
         if pre_order_key:
             CacheHelper.delete(pre_order_key)
+            StockReservationService.release(pre_order_key)
 
         return JsonResponse({
             "success": False,
@@ -102,18 +111,7 @@ class TossConfirmView(View):
         except (ValueError, TypeError):
             return JsonResponse({"success": False, "error": "잘못된 금액 형식"}, status=400)
 
-        is_success, error_message, payment_data, status_code = (
-            TossPaymentService.confirm_payment_with_api(
-                payment_key=payment_key,
-                order_id=order_id,
-                amount=amount
-            )
-        )
-
-        if not is_success:
-            return JsonResponse({"success": False, "error": error_message}, status=400)
-
-        # 캐시 데이터 확인
+        # 카드 승인 전에 주문 정보/금액/재고를 모두 확인해 승인 후 취소할 일을 줄인다
         cache_data = CacheHelper.get(pre_order_key)
         if cache_data is None:
             return JsonResponse(
@@ -131,8 +129,26 @@ class TossConfirmView(View):
         if not is_valid:
             return JsonResponse({"success": False, "error": error_message}, status=400)
 
-        # 주문 및 결제 정보 생성
+        # 주문서 예약이 만료되어 풀렸다면 다시 보류하고, 재고가 없으면 승인하지 않는다
         items_data = cache_data.get("items", [])
+        try:
+            StockReservationService.ensure_reserved(pre_order_key, items_data)
+        except InsufficientStockError as e:
+            CacheHelper.delete(pre_order_key)
+            return JsonResponse({"success": False, "error": str(e)}, status=409)
+
+        is_success, error_message, payment_data, status_code = (
+            TossPaymentService.confirm_payment_with_api(
+                payment_key=payment_key,
+                order_id=order_id,
+                amount=amount
+            )
+        )
+
+        if not is_success:
+            return JsonResponse({"success": False, "error": error_message}, status=400)
+
+        # 주문 및 결제 정보 생성
         request_url = f"{settings.TOSS_API_BASE}/payments/confirm"
         request_payload = {"paymentKey": payment_key, "orderId": order_id, "amount": amount}
 
@@ -150,9 +166,32 @@ class TossConfirmView(View):
                 request_payload=request_payload,
                 response_status_code=status_code,
                 used_point=used_point,
+                reservation_id=pre_order_key,
             )
         except IntegrityError:
             return JsonResponse({"success": True, "message": "이미 승인된 결제입니다."}, status=200)
+        except Exception as e:
+            # 승인은 됐지만 주문을 만들지 못했으므로 결제를 취소하고 실패 로그를 남긴다
+            if not isinstance(e, InsufficientStockError):
+                logger.exception("Failed to create order %s after toss confirm", order_id)
+            PaymentLogSink.emit(
+                provider="toss",
+                event_type="ORDER_FAIL",
+                request_url=request_url,
+                request_payload=request_payload,
+                response_payload=payment_data,
+                status_code=status_code,
+                error_message=str(e),
+            )
+            TossPaymentService.cancel_payment(payment_key, order_id, "주문 처리 실패로 인한 자동 취소")
+            StockReservationService.release(pre_order_key)
+            CacheHelper.delete(pre_order_key)
+            if isinstance(e, InsufficientStockError):
+                return JsonResponse({"success": False, "error": str(e)}, status=409)
+            return JsonResponse(
+                {"success": False, "error": "주문 처리 중 오류가 발생해 결제를 취소했습니다."},
+                status=500,
+            )
 
         # 캐시 삭제
         CacheHelper.delete(pre_order_key)
@@ -162,6 +201,3 @@ class TossConfirmView(View):
         request.session['order_id'] = order_id
 
         return redirect('orders:status')
-
-
-
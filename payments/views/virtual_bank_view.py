@@ -13,9 +13,7 @@ from django.views.decorators.csrf import csrf_exempt, csrf_protect
 
 from orders.models import Order
 from payments.models import BankChoices, Payment
-from payments.services.toss_payment_service import TossPaymentService
-
-TOSS_API_BASE = settings.TOSS_API_BASE
+from payments.services.toss_client import toss_client
 
 
 @method_decorator(csrf_protect, name="dispatch")
@@ -59,22 +57,20 @@ class TossVirtualRequestView(View):
             "failUrl": fail_url,
         }
 
-        res = requests.post(
-            f"{TOSS_API_BASE}/virtual-accounts",
-            headers=TossPaymentService.get_toss_headers(),
-            json=payload,
-            timeout=10,
-        )
-
         try:
-            data = res.json()
-        except ValueError:
+            # 같은 요청 안의 재시도만 같은 키를 쓴다 (은행을 바꿔 다시 요청하면 새로 발급)
+            res = toss_client.post("virtual-accounts", payload)
+        except requests.exceptions.RequestException:
+            return JsonResponse({"success": False, "error": "가상계좌 발급 요청 중 오류 발생"}, status=503)
+
+        if not res.is_json:
             return JsonResponse({
                 "success": False,
                 "error": f"Toss 응답이 JSON 형식이 아닙니다: {res.text[:200]}"
             }, status=500)
 
-        if res.status_code != 200:
+        data = res.data
+        if not res.ok:
             return JsonResponse({
                 "success": False,
                 "error": data.get("message", "결제 요청 실패"),
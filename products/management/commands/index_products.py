@@ -1,9 +1,21 @@
+import resource
+import time
 from typing import Any
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
 
 from products.models import Product
-from products.utils.elasticsearch.elastic_search import bulk_index_products
+from products.utils.elasticsearch.elastic_search import (
+    PRODUCT_INDEX_NAME,
+    IndexRebuildError,
+    bulk_index_products,
+    create_product_index,
+    indexable_products,
+    is_concrete_product_index,
+    rebuild_product_index,
+)
+from products.utils.elasticsearch.index_queue import ProductIndexQueue
 
 
 class Command(BaseCommand):
@@ -13,15 +25,57 @@ class Command(BaseCommand):
         parser.add_argument(
             '--force',
             action='store_true',
-            help='Force re-indexing of all products',
+            help='Rebuild into a new versioned index and swap the alias when done',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Number of products read from the DB and sent per bulk request',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Number of parallel bulk threads',
         )
 
     def handle(self, *args: Any, **options: Any) -> None:
-        products = Product.objects.filter(is_live=True).prefetch_related('categories', 'colors')
+        chunk_size = options['chunk_size']
+        workers = options['workers']
+        products = indexable_products().order_by('id')
         
         self.stdout.write(f'Indexing {products.count()} products...')
-        
-        success_count, failed_count = bulk_index_products(products, reset_index=options['force'])
+
+        started = time.monotonic()
+        rebuild_started_at = timezone.now()
+
+        rebuild = options['force']
+        if not rebuild and is_concrete_product_index():
+            # 단일 인덱스에 그대로 색인하면 alias 로 옮겨 가지 못하므로 버전 인덱스로 재색인하며 교체한다
+            self.stdout.write(f'{PRODUCT_INDEX_NAME} is a concrete index; migrating it behind an alias')
+            rebuild = True
+
+        if rebuild:
+            try:
+                index_name, success_count, failed_count = rebuild_product_index(products, chunk_size, workers)
+            except IndexRebuildError as e:
+                raise CommandError(f'{e} ({e.success_count} succeeded)')
+            self.stdout.write(f'Alias {PRODUCT_INDEX_NAME} now points to {index_name}')
+            # 재색인 중 수정/삭제된 상품은 이전 인덱스에만 반영되었으므로 다시 동기화 큐에 넣는다
+            changed_ids = Product.objects.filter(updated_at__gte=rebuild_started_at).values_list('id', flat=True)
+            ProductIndexQueue.enqueue(changed_ids)
+            ProductIndexQueue.enqueue(ProductIndexQueue.deleted_since(rebuild_started_at.timestamp()))
+        else:
+            create_product_index()
+            success_count, failed_count = bulk_index_products(
+                products, chunk_size=chunk_size, workers=workers
+            )
+
+        elapsed = time.monotonic() - started
+        throughput = success_count / elapsed if elapsed > 0 else 0
+        # Linux 에서 ru_maxrss 단위는 KB
+        peak_memory_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
         
         if success_count > 0:
             self.stdout.write(
@@ -32,6 +86,8 @@ class Command(BaseCommand):
             self.stdout.write(
                 self.style.WARNING(f'Failed to index {failed_count} products')
             )
-        
-        self.stdout.write(self.style.SUCCESS('Indexing complete!'))
 
+        self.stdout.write(
+            f'Elapsed {elapsed:.1f}s, {throughput:.0f} docs/s, peak memory {peak_memory_mb:.1f} MB'
+        )
+        self.stdout.write(self.style.SUCCESS('Indexing complete!'))
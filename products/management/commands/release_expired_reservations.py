@@ -0,0 +1,51 @@
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from products.services.stock_reservation import (
+    SWEEP_BATCH_SIZE,
+    StockReservationService,
+)
+
+
+class Command(BaseCommand):
+    help = 'Release stock reservations whose preorder window has expired'
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=SWEEP_BATCH_SIZE,
+            help='Number of reservations released per pass',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=10.0,
+            help='Seconds to wait when no reservation has expired',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Release the expired reservations once and exit',
+        )
+
+    def sweep(self, batch_size: int) -> int:
+        count = StockReservationService.release_expired(batch_size)
+        if count:
+            self.stdout.write(f'Released {count} expired reservations')
+        return count
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        batch_size = options['batch_size']
+
+        if options['once']:
+            while self.sweep(batch_size) >= batch_size:
+                pass
+            self.stdout.write(self.style.SUCCESS('Sweep complete!'))
+            return
+
+        while True:
+            if self.sweep(batch_size) < batch_size:
+                time.sleep(options['interval'])
@@ -0,0 +1,78 @@
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from products.utils.elasticsearch.elastic_search import index_products_by_ids
+from products.utils.elasticsearch.index_queue import ProductIndexQueue
+
+
+class Command(BaseCommand):
+    help = 'Drain the pending product queue into Elasticsearch'
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='Number of product ids indexed per bulk request',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=2.0,
+            help='Seconds to wait when the queue is empty',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Drain the queue once and exit',
+        )
+        parser.add_argument(
+            '--redrive',
+            action='store_true',
+            help='Move dead-lettered product ids back to the pending queue and exit',
+        )
+
+    def flush(self, batch_size: int) -> int:
+        product_ids = ProductIndexQueue.pop_batch(batch_size)
+        if not product_ids:
+            return 0
+
+        try:
+            success_count, failed_ids = index_products_by_ids(product_ids)
+        except Exception as e:
+            # ES 연결 실패 등 배치 전체 실패 -> 전체를 백오프 후 재시도
+            dead = ProductIndexQueue.retry(product_ids, reason=str(e))
+            self.stdout.write(self.style.ERROR(f'Bulk indexing failed: {e} (dead-lettered {len(dead)})'))
+            return 0
+
+        succeeded = set(product_ids) - set(failed_ids)
+        ProductIndexQueue.ack(succeeded)
+
+        if failed_ids:
+            dead = ProductIndexQueue.retry(failed_ids, reason='bulk item error')
+            self.stdout.write(
+                self.style.WARNING(f'Failed to index {len(failed_ids)} products (dead-lettered {len(dead)})')
+            )
+
+        self.stdout.write(f'Indexed {success_count} products')
+        return len(product_ids)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        batch_size = options['batch_size']
+
+        if options['redrive']:
+            moved = ProductIndexQueue.redrive_dead_letters(ProductIndexQueue.dead_letter_count())
+            self.stdout.write(self.style.SUCCESS(f'Re-queued {moved} dead-lettered products'))
+            return
+
+        if options['once']:
+            while self.flush(batch_size):
+                pass
+            self.stdout.write(self.style.SUCCESS('Sync complete!'))
+            return
+
+        while True:
+            if not self.flush(batch_size):
+                time.sleep(options['interval'])
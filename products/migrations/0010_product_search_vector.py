@@ -0,0 +1,122 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+# 상품 이름/카테고리(A) > 색상(B) > 설명(C) 가중치의 tsvector 를 만든다.
+# config 는 PostgresSearchBackend.SEARCH_CONFIG 와 같아야 한다.
+CREATE_SEARCH_VECTOR_SQL = """
+CREATE OR REPLACE FUNCTION products_build_search_vector(p_id bigint, p_name text, p_description text)
+RETURNS tsvector AS $$
+    SELECT setweight(to_tsvector('simple', coalesce(p_name, '')), 'A')
+        || setweight(to_tsvector('simple', coalesce((
+            SELECT string_agg(c.name, ' ')
+            FROM product_category_cdt pc JOIN categories c ON c.id = pc.category_id
+            WHERE pc.product_id = p_id
+        ), '')), 'A')
+        || setweight(to_tsvector('simple', coalesce((
+            SELECT string_agg(co.name, ' ')
+            FROM product_color_cdt pc JOIN products_color co ON co.id = pc.color_id
+            WHERE pc.product_id = p_id
+        ), '')), 'B')
+        || setweight(to_tsvector('simple', coalesce(p_description, '')), 'C');
+$$ LANGUAGE sql STABLE;
+
+-- Django save() 는 search_vector 컬럼도 함께 쓰므로 search_vector 가 SET 목록에 있을 때도 다시 계산한다
+CREATE OR REPLACE FUNCTION products_search_vector_trigger() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := products_build_search_vector(NEW.id, NEW.name, NEW.description);
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER products_search_vector_update
+    BEFORE INSERT OR UPDATE OF name, description, search_vector ON products
+    FOR EACH ROW EXECUTE FUNCTION products_search_vector_trigger();
+
+-- 카테고리/색상 연결이 바뀐 상품은 statement 단위로 한 번에 갱신 (BEFORE 트리거가 다시 계산)
+CREATE OR REPLACE FUNCTION products_refresh_search_vector_from_rows() RETURNS trigger AS $$
+BEGIN
+    UPDATE products SET search_vector = NULL WHERE id IN (SELECT product_id FROM changed_rows);
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER product_category_search_vector_insert
+    AFTER INSERT ON product_category_cdt REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION products_refresh_search_vector_from_rows();
+CREATE TRIGGER product_category_search_vector_delete
+    AFTER DELETE ON product_category_cdt REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION products_refresh_search_vector_from_rows();
+CREATE TRIGGER product_color_search_vector_insert
+    AFTER INSERT ON product_color_cdt REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION products_refresh_search_vector_from_rows();
+CREATE TRIGGER product_color_search_vector_delete
+    AFTER DELETE ON product_color_cdt REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION products_refresh_search_vector_from_rows();
+
+-- 카테고리/색상 이름 변경 시 연결된 상품 갱신
+CREATE OR REPLACE FUNCTION categories_refresh_product_search_vector() RETURNS trigger AS $$
+BEGIN
+    UPDATE products SET search_vector = NULL
+    WHERE id IN (SELECT product_id FROM product_category_cdt WHERE category_id = NEW.id);
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER categories_search_vector_update
+    AFTER UPDATE OF name ON categories
+    FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+    EXECUTE FUNCTION categories_refresh_product_search_vector();
+
+CREATE OR REPLACE FUNCTION colors_refresh_product_search_vector() RETURNS trigger AS $$
+BEGIN
+    UPDATE products SET search_vector = NULL
+    WHERE id IN (SELECT product_id FROM product_color_cdt WHERE color_id = NEW.id);
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER colors_search_vector_update
+    AFTER UPDATE OF name ON products_color
+    FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+    EXECUTE FUNCTION colors_refresh_product_search_vector();
+
+-- 기존 상품 backfill
+UPDATE products SET search_vector = NULL;
+"""
+
+DROP_SEARCH_VECTOR_SQL = """
+DROP TRIGGER IF EXISTS colors_search_vector_update ON products_color;
+DROP TRIGGER IF EXISTS categories_search_vector_update ON categories;
+DROP TRIGGER IF EXISTS product_color_search_vector_delete ON product_color_cdt;
+DROP TRIGGER IF EXISTS product_color_search_vector_insert ON product_color_cdt;
+DROP TRIGGER IF EXISTS product_category_search_vector_delete ON product_category_cdt;
+DROP TRIGGER IF EXISTS product_category_search_vector_insert ON product_category_cdt;
+DROP TRIGGER IF EXISTS products_search_vector_update ON products;
+DROP FUNCTION IF EXISTS colors_refresh_product_search_vector();
+DROP FUNCTION IF EXISTS categories_refresh_product_search_vector();
+DROP FUNCTION IF EXISTS products_refresh_search_vector_from_rows();
+DROP FUNCTION IF EXISTS products_search_vector_trigger();
+DROP FUNCTION IF EXISTS products_build_search_vector(bigint, text, text);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('categories', '0002_alter_category_parent'),
+        ('products', '0009_product_trgm_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='products_search_vector_idx'),
+        ),
+        migrations.RunSQL(CREATE_SEARCH_VECTOR_SQL, DROP_SEARCH_VECTOR_SQL),
+    ]
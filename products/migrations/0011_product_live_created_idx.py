@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0010_product_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(condition=models.Q(('is_live', True), ('is_sold', False)), fields=['-created_at', '-id'], name='products_live_created_idx'),
+        ),
+    ]
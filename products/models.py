@@ -1,6 +1,9 @@
 from typing import Any
 
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models.functions import Upper
 
 from categories.models import Category
 from config.basemodel import BaseModel
@@ -24,6 +27,12 @@ class Color(models.Model):
     class Meta:
         db_table = 'products_color'
 
+class ProductManager(models.Manager['Product']):
+    def get_queryset(self) -> models.QuerySet['Product']:
+        # 검색용 tsvector 는 Postgres 검색 백엔드의 WHERE/정렬에서만 쓰므로 일반 조회에서는 읽지 않는다
+        return super().get_queryset().defer('search_vector')
+
+
 class Product(BaseModel):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     name = models.CharField(max_length=100)
@@ -37,9 +46,27 @@ class Product(BaseModel):
     is_sold = models.BooleanField(default=False)
     categories = models.ManyToManyField(Category, blank=True, db_table='product_category_cdt')
     colors = models.ManyToManyField(Color, blank=True, db_table='product_color_cdt')
-    
+    # DB 트리거(0010 마이그레이션)가 이름/카테고리/색상/설명으로 갱신하는 검색용 tsvector
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = ProductManager()
+
     class Meta:
         db_table = 'products'
+        # FK 로 상품을 읽을 때(cart.product 등)도 search_vector 를 제외
+        base_manager_name = 'objects'
+        indexes = [
+            # ES 장애 시 fallback 검색(icontains -> UPPER(col) LIKE)용 trigram 인덱스
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='products_name_trgm_idx'),
+            GinIndex(OpClass(Upper('description'), name='gin_trgm_ops'), name='products_desc_trgm_idx'),
+            GinIndex(fields=['search_vector'], name='products_search_vector_idx'),
+            # 홈 섹션/피드의 최신순 keyset 조회용 (판매 중인 상품만)
+            models.Index(
+                fields=['-created_at', '-id'],
+                condition=models.Q(is_live=True, is_sold=False),
+                name='products_live_created_idx',
+            ),
+        ]
     
     def save(self, *args: Any, **kwargs: Any) -> None:
         from products.utils.url_slug import product_name_to_slug
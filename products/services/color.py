@@ -1,12 +1,36 @@
-from typing import List
+from typing import Any, Dict, List
 
+from config.utils.tiered_cache import TieredCache
 from products.models import Color
 
+COLOR_LIST_CACHE_KEY = 'product:color:list'
+COLOR_LIST_CACHE_TIMEOUT = 60 * 60 * 24
+COLOR_LIST_CACHE_STALE_TIMEOUT = 60 * 10
+
 
 class ColorService:
+    @staticmethod
+    def _load_colors() -> List[Dict[str, Any]]:
+        return [dict(row) for row in Color.objects.order_by('name').values('id', 'name', 'hex_code')]
+
+    @staticmethod
+    def _build_colors(rows: List[Dict[str, Any]]) -> List[Color]:
+        return [Color(**row) for row in rows]
+
     @staticmethod
     def get_all_colors() -> List[Color]:
-        return list(Color.objects.all().order_by('name'))
+        colors = TieredCache.get_or_compute(
+            COLOR_LIST_CACHE_KEY,
+            ColorService._load_colors,
+            ttl=COLOR_LIST_CACHE_TIMEOUT,
+            stale_ttl=COLOR_LIST_CACHE_STALE_TIMEOUT,
+            build=ColorService._build_colors,
+        )
+        return list(colors)
+
+    @staticmethod
+    def invalidate_colors() -> None:
+        TieredCache.invalidate(COLOR_LIST_CACHE_KEY)
     
     @staticmethod
     def get_color_by_id(color_id: int) -> Color | None:
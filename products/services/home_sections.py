@@ -0,0 +1,147 @@
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.db.models import Exists, OuterRef, QuerySet
+from django.urls import reverse
+
+from categories.services.category_menu import CategoryMenuService, MenuCategory
+from config.utils.pagination import KeysetPaginator
+from config.utils.tiered_cache import TieredCache
+from products.models import Product
+from products.templatetags.product_filters import discount_amount
+from products.utils.url_slug import product_name_to_slug
+
+HOME_SECTION_SIZE = 8
+HOME_FEED_PAGE_SIZE = 24
+# 키에 카탈로그 버전이 들어가므로 상품이 바뀌면 새 키로 다시 계산된다 (TTL 은 이전 버전 정리용)
+HOME_SECTION_CACHE_TIMEOUT = 60 * 10
+
+
+@dataclass(frozen=True)
+class HomeSection:
+    key: str
+    title: str
+    products: List[Product]
+    more_url: str
+
+
+@dataclass(frozen=True)
+class HomeContent:
+    sections: List[HomeSection]
+    feed_cursor: Optional[str]
+
+
+class HomeSectionService:
+    """
+    홈 화면 섹션(신상품/세일/메인 카테고리별)은 상위 N 개 상품 ID 만 캐시하고,
+    모든 섹션의 상품을 한 번의 쿼리로 채운다. 나머지 상품은 피드 API 에서 keyset 으로 이어서 불러온다.
+    """
+
+    @staticmethod
+    def get_live_products() -> QuerySet[Product]:
+        return Product.objects.filter(is_live=True, is_sold=False)
+
+    @staticmethod
+    def _newest_ids(products: QuerySet[Product]) -> List[int]:
+        return list(products.order_by('-created_at', '-id').values_list('id', flat=True)[:HOME_SECTION_SIZE])
+
+    @staticmethod
+    def _category_products(category: MenuCategory) -> QuerySet[Product]:
+        category_ids = [category.id, *[child.id for child in category.children]]
+        category_match = Product.categories.through.objects.filter(
+            product_id=OuterRef('pk'),
+            category_id__in=category_ids,
+        )
+        return HomeSectionService.get_live_products().filter(Exists(category_match))
+
+    @staticmethod
+    def _category_newest_ids(category: MenuCategory) -> List[int]:
+        return HomeSectionService._newest_ids(HomeSectionService._category_products(category))
+
+    @staticmethod
+    def _get_section_ids(key: str, version: float, compute: Callable[[], List[int]]) -> List[int]:
+        return list(TieredCache.get_or_compute(
+            f'home:section:{key}:{version!r}',
+            compute,
+            ttl=HOME_SECTION_CACHE_TIMEOUT,
+            build=tuple,
+        ))
+
+    @staticmethod
+    def _hydrate(product_ids: List[int]) -> Dict[int, Product]:
+        if not product_ids:
+            return {}
+        products = Product.objects.filter(id__in=product_ids).select_related('review_stats').prefetch_related('colors', 'image')
+        return {product.id: product for product in products}
+
+    @staticmethod
+    def get_sections(version: float) -> List[HomeSection]:
+        product_list_url = reverse('customer-product-list')
+        live_products = HomeSectionService.get_live_products()
+
+        definitions: List[Tuple[str, str, str, Callable[[], List[int]]]] = [
+            ('new', 'NEW ARRIVALS', product_list_url, lambda: HomeSectionService._newest_ids(live_products)),
+            ('sale', 'SALE', product_list_url, lambda: HomeSectionService._newest_ids(live_products.filter(sale_price__gt=0))),
+        ]
+        for category in CategoryMenuService.get_main_categories():
+            definitions.append((
+                f'category:{category.id}',
+                category.name.upper(),
+                f'{product_list_url}?category={category.name}',
+                partial(HomeSectionService._category_newest_ids, category),
+            ))
+
+        section_ids = {
+            key: HomeSectionService._get_section_ids(key, version, compute)
+            for key, _, _, compute in definitions
+        }
+        products = HomeSectionService._hydrate(list({pid for ids in section_ids.values() for pid in ids}))
+
+        sections: List[HomeSection] = []
+        for key, title, more_url, _ in definitions:
+            # 캐시된 ID 중 그 사이 삭제된 상품은 건너뛴다
+            section_products = [products[pid] for pid in section_ids[key] if pid in products]
+            if section_products:
+                sections.append(HomeSection(key=key, title=title, products=section_products, more_url=more_url))
+        return sections
+
+    @staticmethod
+    def _get_feed_cursor(sections: List[HomeSection]) -> Optional[str]:
+        # 피드는 신상품 섹션의 마지막 상품 다음부터 이어진다
+        new_section = next((section for section in sections if section.key == 'new'), None)
+        if new_section is None or len(new_section.products) < HOME_SECTION_SIZE:
+            return None
+        return HomeSectionService._feed_paginator().cursor_after(new_section.products[-1])
+
+    @staticmethod
+    def get_home(version: float) -> HomeContent:
+        sections = HomeSectionService.get_sections(version)
+        return HomeContent(sections=sections, feed_cursor=HomeSectionService._get_feed_cursor(sections))
+
+    @staticmethod
+    def _feed_paginator(limit: int = HOME_FEED_PAGE_SIZE) -> KeysetPaginator[Product]:
+        products = HomeSectionService.get_live_products().select_related('review_stats').prefetch_related('colors', 'image')
+        return KeysetPaginator(products, ('-created_at', '-id'), per_page=limit)
+
+    @staticmethod
+    def get_feed_page(cursor: Optional[str], limit: int = HOME_FEED_PAGE_SIZE) -> Tuple[List[Product], Optional[str]]:
+        """(created_at, id) keyset. 잘못된 커서는 ValueError"""
+        page = HomeSectionService._feed_paginator(limit).get_page(cursor)
+        return page.object_list, page.next_cursor
+
+    @staticmethod
+    def serialize_product(product: Product) -> Dict[str, Any]:
+        images = [image.image.url for image in product.image.all()]
+        review_stats = getattr(product, 'review_stats', None)
+        return {
+            'id': product.id,
+            'name': product.name,
+            'url': reverse('products-detail', args=[product_name_to_slug(product.name)]),
+            'images': images[:2],
+            'colors': [color.hex_code or '#e5e7eb' for color in product.colors.all()],
+            'price': int(product.price),
+            'sale_price': discount_amount(float(product.price), float(product.sale_price)) if product.sale_price else None,
+            'avg_rating': round(review_stats.avg_rating, 1) if review_stats and review_stats.review_count else None,
+            'review_count': review_stats.review_count if review_stats else 0,
+        }
@@ -0,0 +1,259 @@
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Mapping, Optional, cast
+
+from django.core.cache import cache as django_cache
+from django.db import transaction
+from django.db.models import F
+
+from config.utils.cache_helper import CacheHelper
+from config.utils.page_cache import PageCacheVersion, product_scope
+from products.models import Product
+from products.utils.elasticsearch.index_queue import ProductIndexQueue
+
+# 주문서(preorder) 유효 시간과 같은 예약 유지 시간
+RESERVATION_TIMEOUT = 60 * 15
+# 예약 가능 수량 카운터는 이 시간이 지나면 DB 재고 - 보류 수량으로 다시 초기화된다
+AVAILABLE_TIMEOUT = 60 * 60
+EXPIRY_INDEX_KEY = 'stock:reservations'
+SWEEP_BATCH_SIZE = 100
+
+# KEYS: [예약 hash, 만료 zset, (가용 카운터, 보류 카운터) * 상품 수]
+# ARGV: [만료 시각, 예약 id, 가용 카운터 TTL, (상품 id, 수량, DB 재고) * 상품 수]
+# 모든 상품의 가용 수량을 확인한 뒤에만 차감하므로 부분 예약이 남지 않는다.
+# 반환값: 0 성공, -1 이미 예약됨, i>0 i 번째 상품 재고 부족
+_RESERVE_SCRIPT = """
+if redis.call('exists', KEYS[1]) == 1 then
+    return -1
+end
+local count = (#KEYS - 2) / 2
+for i = 1, count do
+    local available_key, held_key = KEYS[1 + i * 2], KEYS[2 + i * 2]
+    if redis.call('exists', available_key) == 0 then
+        local held = tonumber(redis.call('get', held_key) or '0')
+        redis.call('set', available_key, tonumber(ARGV[3 + i * 3]) - held, 'EX', ARGV[3])
+    end
+    if tonumber(redis.call('get', available_key)) < tonumber(ARGV[2 + i * 3]) then
+        return i
+    end
+end
+for i = 1, count do
+    local quantity = tonumber(ARGV[2 + i * 3])
+    redis.call('decrby', KEYS[1 + i * 2], quantity)
+    redis.call('incrby', KEYS[2 + i * 2], quantity)
+    redis.call('hset', KEYS[1], ARGV[1 + i * 3], quantity)
+end
+redis.call('zadd', KEYS[2], ARGV[1], ARGV[2])
+return 0
+"""
+
+# KEYS: [예약 hash, 만료 zset, (가용 카운터, 보류 카운터) * 상품 수]
+# ARGV: [예약 id, 상품 id * 상품 수]
+_RELEASE_SCRIPT = """
+if redis.call('exists', KEYS[1]) == 0 then
+    return 0
+end
+for i = 1, #ARGV - 1 do
+    local quantity = tonumber(redis.call('hget', KEYS[1], ARGV[1 + i]) or '0')
+    if redis.call('exists', KEYS[1 + i * 2]) == 1 then
+        redis.call('incrby', KEYS[1 + i * 2], quantity)
+    end
+    if redis.call('decrby', KEYS[2 + i * 2], quantity) <= 0 then
+        redis.call('del', KEYS[2 + i * 2])
+    end
+end
+redis.call('del', KEYS[1])
+redis.call('zrem', KEYS[2], ARGV[1])
+return 1
+"""
+
+# DB 재고 차감이 커밋된 뒤 보류 수량을 정리한다.
+# 예약이 이미 만료되어 풀렸다면 가용 카운터에서 커밋한 수량을 직접 차감한다.
+# ARGV: [예약 id, (상품 id, 수량) * 상품 수]
+_COMMIT_SCRIPT = """
+local reserved = redis.call('exists', KEYS[1]) == 1
+for i = 1, (#ARGV - 1) / 2 do
+    local quantity = tonumber(ARGV[1 + i * 2])
+    local held = 0
+    if reserved then
+        held = tonumber(redis.call('hget', KEYS[1], ARGV[i * 2]) or '0')
+    end
+    if redis.call('exists', KEYS[1 + i * 2]) == 1 and quantity ~= held then
+        redis.call('decrby', KEYS[1 + i * 2], quantity - held)
+    end
+    if held > 0 and redis.call('decrby', KEYS[2 + i * 2], held) <= 0 then
+        redis.call('del', KEYS[2 + i * 2])
+    end
+end
+redis.call('del', KEYS[1])
+redis.call('zrem', KEYS[2], ARGV[1])
+return 1
+"""
+
+
+class InsufficientStockError(Exception):
+    def __init__(self, product_id: int, product_name: str = '') -> None:
+        self.product_id = product_id
+        self.product_name = product_name
+        super().__init__(f"'{product_name or product_id}' 상품의 재고가 부족합니다.")
+
+
+class InvalidQuantityError(ValueError):
+    def __init__(self, product_id: int, quantity: int) -> None:
+        self.product_id = product_id
+        self.quantity = quantity
+        super().__init__(f"상품 {product_id} 의 주문 수량은 1 이상이어야 합니다. (요청: {quantity})")
+
+
+class StockReservationService:
+    """
+    주문서 작성 ~ 결제 승인 사이의 재고를 Redis 카운터로 보류한다.
+    - 가용 카운터(stock:available:{id}) = DB 재고 - 보류 중인 수량
+    - 결제 승인 시 DB 에는 조건부 UPDATE(stock >= n)로 한 번만 차감하므로 행 잠금을 오래 잡지 않는다
+    - 만료된 예약은 release_expired_reservations 명령이 풀어준다
+    """
+
+    @staticmethod
+    def _key(key: str) -> str:
+        return django_cache.make_key(key)
+
+    @staticmethod
+    def _reservation_key(reservation_id: str) -> str:
+        return StockReservationService._key(f'stock:reservation:{reservation_id}')
+
+    @staticmethod
+    def _product_keys(product_ids: Iterable[int]) -> List[str]:
+        keys: List[str] = []
+        for product_id in product_ids:
+            keys.append(StockReservationService._key(f'stock:available:{product_id}'))
+            keys.append(StockReservationService._key(f'stock:held:{product_id}'))
+        return keys
+
+    @staticmethod
+    def _quantities(items: Iterable[Mapping[str, Any]]) -> Dict[int, int]:
+        # 같은 상품의 다른 색상은 하나의 재고를 공유한다
+        quantities: Counter[int] = Counter()
+        for item in items:
+            product_id, quantity = int(item['product_id']), int(item['quantity'])
+            # 0/음수 수량은 Lua 의 decrby 와 DB 의 stock - n 에서 오히려 재고를 늘린다
+            if quantity <= 0:
+                raise InvalidQuantityError(product_id, quantity)
+            quantities[product_id] += quantity
+        return dict(sorted(quantities.items()))
+
+    @staticmethod
+    def reserve(reservation_id: str, items: Iterable[Mapping[str, Any]]) -> None:
+        quantities = StockReservationService._quantities(items)
+        if not quantities:
+            return
+
+        # 가용 카운터가 없는 상품만 이 값으로 초기화된다 (잠금 없는 PK 조회)
+        stocks = dict(Product.objects.filter(id__in=quantities).values_list('id', 'stock'))
+        args: List[Any] = [time.time() + RESERVATION_TIMEOUT, reservation_id, AVAILABLE_TIMEOUT]
+        for product_id, quantity in quantities.items():
+            args.extend([product_id, quantity, stocks.get(product_id, 0)])
+
+        keys = [
+            StockReservationService._reservation_key(reservation_id),
+            StockReservationService._key(EXPIRY_INDEX_KEY),
+            *StockReservationService._product_keys(quantities),
+        ]
+        result = cast(int, CacheHelper.get_redis_client().eval(_RESERVE_SCRIPT, len(keys), *keys, *args))
+        if result > 0:
+            product_id = list(quantities)[result - 1]
+            name = Product.objects.filter(id=product_id).values_list('name', flat=True).first()
+            raise InsufficientStockError(product_id, name or '')
+
+    @staticmethod
+    def get_reserved_quantities(reservation_id: str) -> Dict[int, int]:
+        reserved = cast(
+            Dict[bytes, bytes],
+            CacheHelper.get_redis_client().hgetall(StockReservationService._reservation_key(reservation_id)),
+        )
+        return {int(product_id): int(quantity) for product_id, quantity in reserved.items()}
+
+    @staticmethod
+    def ensure_reserved(reservation_id: str, items: Iterable[Mapping[str, Any]]) -> None:
+        """
+        결제 승인 전에 예약이 그대로 남아 있는지 확인하고, 만료되어 풀렸다면 다시 예약한다.
+        재고가 부족하면 InsufficientStockError (카드 승인 전에 실패시킨다)
+        """
+        quantities = StockReservationService._quantities(items)
+        reserved = StockReservationService.get_reserved_quantities(reservation_id)
+        if reserved == quantities:
+            return
+        if reserved:
+            StockReservationService.release(reservation_id)
+        StockReservationService.reserve(reservation_id, items)
+
+    @staticmethod
+    def release(reservation_id: str) -> bool:
+        """결제 실패/만료 시 보류 수량을 가용 카운터로 돌려준다 (여러 번 호출해도 한 번만 반영)"""
+        product_ids = sorted(StockReservationService.get_reserved_quantities(reservation_id))
+        keys = [
+            StockReservationService._reservation_key(reservation_id),
+            StockReservationService._key(EXPIRY_INDEX_KEY),
+            *StockReservationService._product_keys(product_ids),
+        ]
+        released = CacheHelper.get_redis_client().eval(
+            _RELEASE_SCRIPT, len(keys), *keys, reservation_id, *product_ids
+        )
+        return bool(released)
+
+    @staticmethod
+    def commit(reservation_id: Optional[str], items: Iterable[Mapping[str, Any]]) -> None:
+        """
+        결제 승인 트랜잭션 안에서 DB 재고를 조건부로 차감한다.
+        재고가 부족하면 InsufficientStockError 로 트랜잭션을 되돌리고, Redis 보류 수량은 커밋 이후에 정리한다.
+        """
+        quantities = StockReservationService._quantities(items)
+        if not quantities:
+            return
+
+        with transaction.atomic():
+            # 교착을 피하도록 항상 상품 id 순서로 갱신
+            for product_id, quantity in quantities.items():
+                updated = Product.objects.filter(id=product_id, stock__gte=quantity).update(
+                    stock=F('stock') - quantity
+                )
+                if not updated:
+                    name = Product.objects.filter(id=product_id).values_list('name', flat=True).first()
+                    raise InsufficientStockError(product_id, name or '')
+
+        def finalize() -> None:
+            keys = [
+                StockReservationService._reservation_key(reservation_id or ''),
+                StockReservationService._key(EXPIRY_INDEX_KEY),
+                *StockReservationService._product_keys(quantities),
+            ]
+            args: List[Any] = [reservation_id or '']
+            for product_id, quantity in quantities.items():
+                args.extend([product_id, quantity])
+            CacheHelper.get_redis_client().eval(_COMMIT_SCRIPT, len(keys), *keys, *args)
+
+        transaction.on_commit(finalize)
+        # update() 는 post_save 를 보내지 않으므로 재고를 보여주는 페이지/검색 문서를 직접 갱신
+        PageCacheVersion.bump(*[product_scope(product_id) for product_id in quantities])
+        ProductIndexQueue.enqueue(quantities)
+
+    @staticmethod
+    def reset_available(product_ids: Iterable[int]) -> None:
+        """관리자가 재고를 수정하면 가용 카운터를 지워 다음 예약 때 DB 재고 기준으로 다시 초기화한다"""
+        keys = [
+            StockReservationService._key(f'stock:available:{product_id}') for product_id in product_ids
+        ]
+        if keys:
+            CacheHelper.get_redis_client().delete(*keys)
+
+    @staticmethod
+    def release_expired(limit: int = SWEEP_BATCH_SIZE) -> int:
+        """만료 시각이 지난 예약을 풀고 처리한 예약 수를 반환"""
+        redis_client = CacheHelper.get_redis_client()
+        expiry_key = StockReservationService._key(EXPIRY_INDEX_KEY)
+        expired = cast(List[bytes], redis_client.zrangebyscore(expiry_key, '-inf', time.time(), start=0, num=limit))
+        for member in expired:
+            reservation_id = member.decode('utf-8')
+            if not StockReservationService.release(reservation_id):
+                # 예약 hash 가 이미 정리된 항목은 인덱스에서만 제거
+                redis_client.zrem(expiry_key, reservation_id)
+        return len(expired)
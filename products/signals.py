@@ -0,0 +1,96 @@
+from typing import Any, Iterable
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from categories.models import Category
+from config.utils.page_cache import CATALOG_SCOPE, PageCacheVersion, product_scope
+from products.models import Color, Product, ProductImage
+from products.services.color import ColorService
+from products.services.stock_reservation import StockReservationService
+from products.utils.context_processors import invalidate_new_products
+from products.utils.elasticsearch.index_queue import ProductIndexQueue
+
+
+@receiver(post_save, sender=Color)
+@receiver(post_delete, sender=Color)
+def invalidate_color_list(sender: type[Color], instance: Color, **kwargs: Any) -> None:
+    ColorService.invalidate_colors()
+
+
+def bump_product_pages(product_ids: Iterable[int]) -> None:
+    # 목록/홈(catalog)과 상품 상세 프래그먼트/ETag 버전을 올린다
+    PageCacheVersion.bump(CATALOG_SCOPE, *[product_scope(product_id) for product_id in product_ids])
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_delete, sender=ProductImage)
+def invalidate_product_caches(sender: Any, instance: Any, **kwargs: Any) -> None:
+    invalidate_new_products()
+    if sender is Product:
+        bump_product_pages([instance.pk])
+
+
+@receiver(pre_delete, sender=ProductImage)
+def invalidate_image_product_pages(sender: type[ProductImage], instance: ProductImage, **kwargs: Any) -> None:
+    # 삭제 후에는 연결되어 있던 상품을 알 수 없으므로 미리 버전을 올린다
+    bump_product_pages(instance.product_set.values_list('id', flat=True))
+
+
+@receiver(m2m_changed, sender=Product.image.through)
+def invalidate_product_image_caches(sender: Any, instance: Any, action: str, **kwargs: Any) -> None:
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate_new_products()
+        if isinstance(instance, Product):
+            bump_product_pages([instance.pk])
+
+
+@receiver(post_save, sender=Product)
+def enqueue_product_index(sender: type[Product], instance: Product, **kwargs: Any) -> None:
+    ProductIndexQueue.enqueue([instance.pk])
+
+
+@receiver(post_delete, sender=Product)
+def enqueue_deleted_product_index(sender: type[Product], instance: Product, **kwargs: Any) -> None:
+    ProductIndexQueue.enqueue_deleted([instance.pk])
+
+
+@receiver(post_save, sender=Product)
+def reset_available_stock(sender: type[Product], instance: Product, **kwargs: Any) -> None:
+    # 관리자가 수정한 재고를 다음 예약부터 반영 (가용 카운터를 DB 재고 - 보류 수량으로 다시 초기화)
+    product_id = instance.pk
+    transaction.on_commit(lambda: StockReservationService.reset_available([product_id]))
+
+
+@receiver(m2m_changed, sender=Product.categories.through)
+@receiver(m2m_changed, sender=Product.colors.through)
+def enqueue_product_relation_index(
+    sender: Any, instance: Any, action: str, reverse: bool, pk_set: set[int] | None, **kwargs: Any
+) -> None:
+    if action not in ('post_add', 'post_remove', 'pre_clear', 'post_clear'):
+        return
+
+    if not reverse:
+        ProductIndexQueue.enqueue([instance.pk])
+        bump_product_pages([instance.pk])
+    elif action == 'pre_clear':
+        # clear 이후에는 연결되어 있던 상품을 알 수 없으므로 미리 큐에 넣는다
+        product_ids = list(instance.product_set.values_list('id', flat=True))
+        ProductIndexQueue.enqueue(product_ids)
+        bump_product_pages(product_ids)
+    elif pk_set:
+        ProductIndexQueue.enqueue(pk_set)
+        bump_product_pages(pk_set)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Color)
+@receiver(pre_delete, sender=Category)
+@receiver(pre_delete, sender=Color)
+def enqueue_related_products_index(sender: Any, instance: Any, **kwargs: Any) -> None:
+    # 카테고리/색상 이름은 상품 문서에 비정규화되어 있으므로 연결된 상품을 다시 색인
+    product_ids = list(instance.product_set.values_list('id', flat=True))
+    ProductIndexQueue.enqueue(product_ids)
+    bump_product_pages(product_ids)
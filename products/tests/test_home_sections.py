@@ -0,0 +1,65 @@
+import time
+
+import pytest
+from django.urls import reverse
+
+from config.utils.setup_test_method import TestSetupMixin
+from products.models import Product
+from products.services.home_sections import HOME_SECTION_SIZE, HomeSectionService
+
+
+@pytest.mark.django_db
+class TestHomeSections(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.products = [
+            Product.objects.create(
+                user=self.admin_user,
+                name=f"상품 {i}",
+                description="설명",
+                price=10000,
+                sale_price=1000 if i % 2 else None,
+                stock=10,
+                is_live=True,
+            )
+            for i in range(HOME_SECTION_SIZE + 5)
+        ]
+        self.newest_first = list(reversed(self.products))
+
+    def test_sections_are_capped(self) -> None:
+        content = HomeSectionService.get_home(time.time())
+
+        sections = {section.key: section for section in content.sections}
+        assert [product.id for product in sections['new'].products] == [p.id for p in self.newest_first[:HOME_SECTION_SIZE]]
+        assert all(product.sale_price for product in sections['sale'].products)
+        assert len(sections['sale'].products) <= HOME_SECTION_SIZE
+
+    def test_sections_hydrated_in_one_query(self, django_assert_max_num_queries) -> None:  # type: ignore[no-untyped-def]
+        version = time.time()
+        HomeSectionService.get_sections(version)
+
+        # ID 목록은 캐시에서 읽고 상품 조회 1번 + colors/image/review_stats prefetch
+        with django_assert_max_num_queries(4):
+            HomeSectionService.get_sections(version)
+
+    def test_feed_continues_after_new_arrivals(self) -> None:
+        content = HomeSectionService.get_home(time.time())
+        assert content.feed_cursor is not None
+
+        response = self.client.get(reverse('product-feed'), {'cursor': content.feed_cursor})
+
+        data = response.json()
+        assert response.status_code == 200
+        assert [product['id'] for product in data['products']] == [p.id for p in self.newest_first[HOME_SECTION_SIZE:]]
+        assert data['next_cursor'] is None
+
+    def test_feed_invalid_cursor(self) -> None:
+        response = self.client.get(reverse('product-feed'), {'cursor': 'invalid'})
+
+        assert response.status_code == 400
+
+    def test_home_renders_sections(self) -> None:
+        response = self.client.get(reverse('home'))
+
+        assert response.status_code == 200
+        assert 'NEW ARRIVALS' in response.content.decode()
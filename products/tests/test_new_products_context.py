@@ -0,0 +1,34 @@
+import pytest
+from django.test import RequestFactory
+from django.utils.functional import SimpleLazyObject
+
+from config.utils.setup_test_method import TestSetupMixin
+from products.utils.context_processors import get_new_products, new_products_context
+
+
+@pytest.mark.django_db
+class TestNewProductsContext(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.setup_test_products_data()
+        self.product.is_live = True
+        self.product.save()
+
+    def test_context_is_lazy(self, django_assert_num_queries) -> None:  # type: ignore[no-untyped-def]
+        request = RequestFactory().get("/")
+
+        with django_assert_num_queries(0):
+            context = new_products_context(request)
+
+        assert isinstance(context["new_products"], SimpleLazyObject)
+
+    def test_new_products_built_and_invalidated(self) -> None:
+        new_products = get_new_products()
+
+        assert [product["name"] for product in new_products] == ["Test Product"]
+        assert new_products[0]["image_url"].endswith("test_image.jpg")
+
+        self.product.is_sold = True
+        self.product.save()
+
+        assert get_new_products() == []
@@ -0,0 +1,89 @@
+import pytest
+from django.urls import reverse
+
+from config.utils.page_cache import (
+    CATALOG_SCOPE,
+    PageCacheVersion,
+    product_reviews_scope,
+    product_scope,
+)
+from config.utils.setup_test_method import TestSetupMixin
+from favorites.models import Favorite
+from favorites.services.favorite_service import FavoriteService
+from reviews.models import Review
+
+
+@pytest.mark.django_db
+class TestProductPageCache(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.setup_test_products_data()
+        self.detail_url = reverse('products-detail', args=[self.product.slug])
+
+    def test_anonymous_detail_not_modified(self) -> None:
+        response = self.client.get(self.detail_url)
+        etag = response['ETag']
+
+        cached_response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert 'no-cache' in response['Cache-Control']
+        assert cached_response.status_code == 304
+
+    def test_product_change_bumps_version(self) -> None:
+        before = PageCacheVersion.get_many([product_scope(self.product.id), CATALOG_SCOPE])
+        etag = self.client.get(self.detail_url)['ETag']
+
+        self.product.description = '변경된 설명'
+        self.product.save()
+
+        after = PageCacheVersion.get_many([product_scope(self.product.id), CATALOG_SCOPE])
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        assert after[product_scope(self.product.id)] > before[product_scope(self.product.id)]
+        assert after[CATALOG_SCOPE] > before[CATALOG_SCOPE]
+        assert response.status_code == 200
+        assert '변경된 설명' in response.content.decode()
+
+    def test_review_change_bumps_review_version(self) -> None:
+        scope = product_reviews_scope(self.product.id)
+        before = PageCacheVersion.get_many([scope])[scope]
+
+        Review.objects.create(product=self.product, user=self.customer_user, content='리뷰', rating=5)
+
+        assert PageCacheVersion.get_many([scope])[scope] > before
+
+    def test_authenticated_detail_skips_validators(self) -> None:
+        self.client.force_login(self.customer_user)
+
+        response = self.client.get(self.detail_url)
+
+        assert response.status_code == 200
+        assert not response.has_header('ETag')
+
+    def test_favorite_change_invalidates_cached_ids(self) -> None:
+        assert FavoriteService.get_favorite_product_ids(self.customer_user) == []
+
+        Favorite.objects.create(user=self.customer_user, product=self.product, is_active=True)
+
+        assert FavoriteService.is_product_favorited(self.customer_user, self.product.id)
+
+    def test_csrf_rotation_changes_etag(self) -> None:
+        url = reverse('customer-product-list')
+        etag = self.client.get(url)['ETag']
+
+        assert self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+        # 로그인/로그아웃으로 CSRF 토큰이 바뀌면 새 토큰이 들어간 페이지를 다시 받아야 한다
+        self.client.cookies.pop('csrftoken')
+
+        assert self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+    def test_list_not_modified_until_catalog_changes(self) -> None:
+        url = reverse('customer-product-list')
+        etag = self.client.get(url)['ETag']
+
+        assert self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+        PageCacheVersion.bump(CATALOG_SCOPE)
+
+        assert self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
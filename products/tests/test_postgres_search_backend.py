@@ -0,0 +1,109 @@
+import pytest
+from django.test import override_settings
+
+from categories.models import Category
+from config.utils.setup_test_method import TestSetupMixin
+from products.models import Color, Product
+from products.utils.elasticsearch.index_queue import ProductIndexQueue
+from products.utils.search import SearchFilters, get_search_backend
+from products.utils.search.postgres_backend import PostgresSearchBackend, build_tsquery
+
+POSTGRES_BACKEND = 'products.utils.search.postgres_backend.PostgresSearchBackend'
+
+
+class TestBuildTsquery:
+    def test_tokens_expanded_with_synonyms(self) -> None:
+        tsquery = build_tsquery("검정 니트")
+
+        black, knit = tsquery.split(" & (")
+        assert "(black:*)" in black and "(블랙:*)" in black
+        assert "(sweater:*)" in knit and "(니트:*)" in knit
+
+    def test_operators_stripped(self) -> None:
+        assert build_tsquery("a&b | !c'") == "((a:* & b:*)) & ((c:*))"
+        assert build_tsquery("  ") == ""
+
+
+@pytest.mark.django_db
+class TestPostgresSearchBackend(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.backend = PostgresSearchBackend()
+        self.knit_category = Category.objects.create(name="니트")
+        self.black = Color.objects.create(name="블랙")
+        self.white = Color.objects.create(name="화이트")
+
+        self.black_knit = Product.objects.create(
+            user=self.admin_user, name="울 라운드 풀오버", description="부드러운 울", price=39000, stock=1, is_live=True
+        )
+        self.black_knit.categories.add(self.knit_category)
+        self.black_knit.colors.add(self.black)
+
+        self.white_knit = Product.objects.create(
+            user=self.admin_user, name="코튼 풀오버", description="가벼운 코튼", price=25000, stock=1, is_live=True
+        )
+        self.white_knit.categories.add(self.knit_category)
+        self.white_knit.colors.add(self.white)
+
+        Product.objects.create(
+            user=self.admin_user, name="숨김 풀오버", description="", price=10000, stock=1, is_live=False
+        )
+
+    def test_search_vector_maintained_by_trigger(self) -> None:
+        self.black_knit.refresh_from_db(fields=["search_vector"])
+
+        assert "블랙" in str(self.black_knit.search_vector)
+        assert "니트" in str(self.black_knit.search_vector)
+
+    def test_search_vector_not_selected_by_default(self) -> None:
+        product = Product.objects.get(pk=self.black_knit.pk)
+
+        assert "search_vector" in product.get_deferred_fields()
+
+    def test_synonym_matches_color_and_category(self) -> None:
+        result = self.backend.search("검정 스웨터")
+
+        assert result.product_ids == [self.black_knit.id]
+        assert result.total == 1
+
+    def test_prefix_match_excludes_hidden_products(self) -> None:
+        result = self.backend.search("풀오")
+
+        assert set(result.product_ids) == {self.black_knit.id, self.white_knit.id}
+
+    def test_filters_and_facets(self) -> None:
+        result = self.backend.search("풀오버", filters=SearchFilters(colors=["화이트"]))
+
+        assert result.product_ids == [self.white_knit.id]
+        # 색상 facet 은 자기 필터를 제외하고 집계
+        assert {bucket["key"]: bucket["count"] for bucket in result.facets["colors"]} == {"블랙": 1, "화이트": 1}
+        assert {bucket["key"]: bucket["count"] for bucket in result.facets["price"]}["~30000"] == 1
+
+    def test_price_filter_uses_effective_price(self) -> None:
+        self.black_knit.sale_price = 10000
+        self.black_knit.save()
+
+        result = self.backend.search("", filters=SearchFilters(price_range="~30000"))
+
+        assert set(result.product_ids) == {self.black_knit.id, self.white_knit.id}
+
+    def test_category_rename_refreshes_products(self) -> None:
+        self.knit_category.name = "가디건"
+        self.knit_category.save()
+
+        assert set(self.backend.search("가디건").product_ids) == {self.black_knit.id, self.white_knit.id}
+
+    def test_suggest(self) -> None:
+        assert self.backend.suggest("코튼") == ["코튼 풀오버"]
+        assert self.backend.suggest("니") == ["니트"]
+
+    def test_index_queue_skipped(self, django_capture_on_commit_callbacks) -> None:  # type: ignore[no-untyped-def]
+        get_search_backend.cache_clear()
+        try:
+            with override_settings(PRODUCT_SEARCH_BACKEND=POSTGRES_BACKEND):
+                with django_capture_on_commit_callbacks(execute=True) as callbacks:
+                    ProductIndexQueue.enqueue([self.black_knit.id])
+        finally:
+            get_search_backend.cache_clear()
+
+        assert callbacks == []
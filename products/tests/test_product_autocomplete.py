@@ -0,0 +1,32 @@
+from unittest.mock import patch
+
+from django.test import Client
+from django.urls import reverse
+
+from config.utils.cache_helper import CacheHelper
+
+
+class TestProductAutocompleteView:
+    def setup_method(self) -> None:
+        self.client = Client()
+        CacheHelper.delete("search:autocomplete:블랙 니")
+
+    def teardown_method(self) -> None:
+        CacheHelper.delete("search:autocomplete:블랙 니")
+
+    def test_empty_prefix(self) -> None:
+        with patch("products.views.customers.autocomplete.suggest_products") as mock_suggest:
+            response = self.client.get(reverse("product-autocomplete"), {"q": "   "})
+
+        assert response.json() == {"suggestions": []}
+        mock_suggest.assert_not_called()
+
+    def test_suggestions_cached_by_normalized_prefix(self) -> None:
+        with patch(
+            "products.views.customers.autocomplete.suggest_products", return_value=["블랙 니트"]
+        ) as mock_suggest:
+            first = self.client.get(reverse("product-autocomplete"), {"q": "블랙  니"})
+            second = self.client.get(reverse("product-autocomplete"), {"q": " 블랙 니 "})
+
+        assert first.json() == second.json() == {"suggestions": ["블랙 니트"]}
+        mock_suggest.assert_called_once_with("블랙 니")
@@ -0,0 +1,132 @@
+import time
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache as django_cache
+from django.core.management import call_command
+
+from config.utils.cache_helper import CacheHelper
+from config.utils.setup_test_method import TestSetupMixin
+from products.models import Color, Product
+from products.utils.elasticsearch.elastic_search import index_products_by_ids
+from products.utils.elasticsearch.index_queue import (
+    DEAD_LETTER_KEY,
+    DELETED_LOG_KEY,
+    MAX_RETRIES,
+    PENDING_QUEUE_KEY,
+    PROCESSING_QUEUE_KEY,
+    RETRY_COUNT_KEY,
+    VISIBILITY_TIMEOUT,
+    ProductIndexQueue,
+)
+
+
+@pytest.mark.django_db
+class TestProductIndexQueue(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.clear_queue()
+
+    def teardown_method(self) -> None:
+        self.clear_queue()
+
+    def clear_queue(self) -> None:
+        CacheHelper.get_redis_client().delete(*[
+            django_cache.make_key(key)
+            for key in (PENDING_QUEUE_KEY, PROCESSING_QUEUE_KEY, RETRY_COUNT_KEY, DEAD_LETTER_KEY, DELETED_LOG_KEY)
+        ])
+
+    def test_product_save_enqueued_on_commit(self, django_capture_on_commit_callbacks) -> None:  # type: ignore[no-untyped-def]
+        with django_capture_on_commit_callbacks(execute=True):
+            self.setup_test_products_data()
+
+        assert self.product.id in ProductIndexQueue.pop_batch(10)
+
+    def test_color_m2m_change_enqueued(self, django_capture_on_commit_callbacks) -> None:  # type: ignore[no-untyped-def]
+        self.setup_test_products_data()
+        color = Color.objects.create(name="Black")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            self.product.colors.add(color)
+
+        assert ProductIndexQueue.pop_batch(10) == [self.product.id]
+
+    def test_product_delete_recorded_for_rebuild_replay(self, django_capture_on_commit_callbacks) -> None:  # type: ignore[no-untyped-def]
+        self.setup_test_products_data()
+        product_id = self.product.id
+        started = time.time()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            self.product.delete()
+
+        assert ProductIndexQueue.deleted_since(started) == [product_id]
+        assert ProductIndexQueue.pop_batch(10) == [product_id]
+
+    def test_unacked_batch_is_redelivered_after_visibility_timeout(self) -> None:
+        ProductIndexQueue._add([42])
+        assert ProductIndexQueue.pop_batch(10) == [42]
+        assert ProductIndexQueue.pop_batch(10) == []
+
+        with patch("products.utils.elasticsearch.index_queue.time") as mock_time:
+            mock_time.time.return_value = time.time() + VISIBILITY_TIMEOUT + 1
+            assert ProductIndexQueue.pop_batch(10) == [42]
+
+            ProductIndexQueue.ack([42])
+            mock_time.time.return_value += VISIBILITY_TIMEOUT + 1
+            assert ProductIndexQueue.pop_batch(10) == []
+
+    def test_retry_backs_off_then_moves_to_dead_letter(self) -> None:
+        ProductIndexQueue._add([42])
+        now = time.time()
+
+        with patch("products.utils.elasticsearch.index_queue.time") as mock_time:
+            for attempt in range(1, MAX_RETRIES):
+                mock_time.time.return_value = now
+                assert ProductIndexQueue.pop_batch(10) == [42]
+                assert ProductIndexQueue.retry([42], reason="error") == []
+                # 백오프 중에는 다시 꺼내지 않는다
+                assert ProductIndexQueue.pop_batch(10) == []
+                now += ProductIndexQueue._backoff(attempt)
+
+            mock_time.time.return_value = now
+            assert ProductIndexQueue.pop_batch(10) == [42]
+            assert ProductIndexQueue.retry([42], reason="error") == [42]
+
+        assert ProductIndexQueue.pending_count() == 0
+        assert CacheHelper.get_redis_client().llen(django_cache.make_key(DEAD_LETTER_KEY)) == 1
+
+        assert ProductIndexQueue.redrive_dead_letters() == 1
+        assert ProductIndexQueue.dead_letter_count() == 0
+        assert ProductIndexQueue.pop_batch(10) == [42]
+
+
+@pytest.mark.django_db
+class TestProductIndexSync(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.live = Product.objects.create(
+            user=self.admin_user, name="블랙 니트", description="니트", price=10000, stock=1, is_live=True
+        )
+        self.hidden = Product.objects.create(
+            user=self.admin_user, name="화이트 니트", description="니트", price=20000, stock=1, is_live=False
+        )
+
+    def test_incremental_sync_deletes_products_that_are_not_live(self) -> None:
+        with patch("products.utils.elasticsearch.elastic_search.bump_index_generation"):
+            with patch("products.utils.elasticsearch.elastic_search.helpers.bulk", return_value=(2, [])) as mock_bulk:
+                assert index_products_by_ids([self.live.id, self.hidden.id]) == (2, [])
+
+        actions = {action["_id"]: action for action in mock_bulk.call_args.args[1]}
+        assert actions[self.live.id]["_source"]["is_live"] is True
+        # 전체 색인과 같은 기준으로 비공개 상품은 인덱스에서 지운다
+        assert actions[self.hidden.id]["_op_type"] == "delete"
+
+    def test_concrete_index_is_migrated_without_force(self) -> None:
+        command = "products.management.commands.index_products"
+        with patch(f"{command}.is_concrete_product_index", return_value=True):
+            with patch(f"{command}.rebuild_product_index", return_value=("products-v1", 1, 0)) as mock_rebuild:
+                with patch(f"{command}.bulk_index_products") as mock_bulk:
+                    call_command("index_products")
+
+        assert list(mock_rebuild.call_args.args[0]) == [self.live]
+        mock_bulk.assert_not_called()
@@ -0,0 +1,124 @@
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+
+from categories.models import Category
+from config.utils.setup_test_method import TestSetupMixin
+from products.models import Color, Product
+from products.utils.elasticsearch.elastic_search import build_es_filters
+from products.utils.search import SearchFilters, SearchResult
+
+
+@pytest.mark.django_db
+class TestProductSearchView(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.first = Product.objects.create(
+            user=self.admin_user, name="블랙 니트", description="니트", price=10000, stock=1, is_live=True
+        )
+        self.second = Product.objects.create(
+            user=self.admin_user, name="화이트 니트", description="니트", price=20000, stock=1, is_live=True
+        )
+
+    def test_search_keeps_es_order_and_total(self) -> None:
+        result = SearchResult(product_ids=[self.second.id, self.first.id], total=50, page=2, page_size=2)
+
+        with patch("products.views.customers.product_list.search_products", return_value=result) as mock_search:
+            response = self.client.get(reverse("customer-product-list"), {"search": "니트", "page": "2"})
+
+        assert response.status_code == 200
+        mock_search.assert_called_once_with("니트", page=2, filters=SearchFilters())
+        assert response.context["products"] == [self.second, self.first]
+        assert response.context["search_result"].total == 50
+        assert response.context["search_result"].has_next
+
+    def test_search_falls_back_to_db_when_es_unavailable(self) -> None:
+        with patch(
+            "products.views.customers.product_list.search_products", side_effect=ConnectionError("down")
+        ):
+            response = self.client.get(reverse("customer-product-list"), {"search": "블랙"})
+
+        assert response.status_code == 200
+        assert list(response.context["products"]) == [self.first]
+        assert response.context["search_result"] is None
+
+    def test_fallback_applies_color_and_price_filters(self) -> None:
+        black = Color.objects.create(name="블랙")
+        self.first.colors.add(black)
+        self.second.colors.add(black)
+
+        with patch(
+            "products.views.customers.product_list.search_products", side_effect=ConnectionError("down")
+        ):
+            response = self.client.get(
+                reverse("customer-product-list"), {"search": "니트", "color": "블랙", "price": "~30000"}
+            )
+            assert set(response.context["products"]) == {self.first, self.second}
+
+            response = self.client.get(
+                reverse("customer-product-list"), {"color": "블랙", "price": "~30000"}
+            )
+            assert set(response.context["products"]) == {self.first, self.second}
+
+            response = self.client.get(reverse("customer-product-list"), {"search": "니트", "color": "화이트"})
+            assert list(response.context["products"]) == []
+
+    def test_fallback_keeps_every_selected_category(self) -> None:
+        knit = Category.objects.create(name="니트")
+        outer = Category.objects.create(name="아우터")
+        self.first.categories.add(knit)
+        self.second.categories.add(outer)
+
+        with patch(
+            "products.views.customers.product_list.search_products", side_effect=ConnectionError("down")
+        ):
+            response = self.client.get(reverse("customer-product-list"), {"category": ["니트", "아우터"]})
+
+        assert response.status_code == 200
+        assert set(response.context["products"]) == {self.first, self.second}
+
+    def test_search_unknown_category_returns_nothing(self) -> None:
+        with patch("products.views.customers.product_list.search_products") as mock_search:
+            response = self.client.get(reverse("customer-product-list"), {"search": "니트", "category": "없음"})
+
+        assert response.status_code == 200
+        mock_search.assert_not_called()
+        assert len(response.context["products"]) == 0
+
+    def test_facet_filters_passed_to_search(self) -> None:
+        result = SearchResult(
+            product_ids=[self.first.id],
+            total=1,
+            facets={"colors": [{"key": "블랙", "count": 1}, {"key": "화이트", "count": 0}]},
+        )
+
+        with patch("products.views.customers.product_list.search_products", return_value=result) as mock_search:
+            response = self.client.get(reverse("customer-product-list"), {"color": "블랙", "price": "~30000"})
+
+        assert response.status_code == 200
+        mock_search.assert_called_once_with(
+            "", page=1, filters=SearchFilters(colors=["블랙"], price_range="~30000")
+        )
+        colors = response.context["facets"]["colors"]
+        assert [facet["key"] for facet in colors] == ["블랙"]
+        assert colors[0]["selected"] is True
+        assert "color=" not in colors[0]["query"]
+
+
+class TestSearchFilters:
+    def test_build_es_filters_excludes_own_facet(self) -> None:
+        filters = SearchFilters(categories=["니트"], colors=["블랙"], price_range="30000~50000")
+
+        assert build_es_filters(filters) == [
+            {"terms": {"categories": ["니트"]}},
+            {"terms": {"colors": ["블랙"]}},
+            {"range": {"effective_price": {"gte": 30000, "lt": 50000}}},
+        ]
+        assert build_es_filters(filters, exclude="colors") == [
+            {"terms": {"categories": ["니트"]}},
+            {"range": {"effective_price": {"gte": 30000, "lt": 50000}}},
+        ]
+
+    def test_unknown_price_range_ignored(self) -> None:
+        assert build_es_filters(SearchFilters(price_range="invalid")) == []
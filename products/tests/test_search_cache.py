@@ -0,0 +1,42 @@
+from unittest.mock import patch
+
+from products.utils.elasticsearch.elastic_search import search_products
+from products.utils.elasticsearch.search_cache import (
+    build_search_cache_key,
+    bump_index_generation,
+    normalize_query,
+)
+from products.utils.search import SearchFilters, SearchResult
+
+
+class TestNormalizeQuery:
+    def test_whitespace_and_case(self) -> None:
+        assert normalize_query("  Black   KNIT ") == normalize_query("black knit")
+
+    def test_synonyms_canonicalized(self) -> None:
+        assert normalize_query("블랙  니트") == normalize_query("검정 스웨터") == "black sweater"
+
+    def test_ambiguous_synonym_kept(self) -> None:
+        # 셔츠는 top/shirt 두 그룹에 속하므로 그대로 유지
+        assert normalize_query("셔츠") == "셔츠"
+
+
+class TestSearchResultCache:
+    def test_generation_bump_changes_cache_key(self) -> None:
+        key = build_search_cache_key("black", 1, 24, {})
+        bump_index_generation()
+
+        assert build_search_cache_key("black", 1, 24, {}) != key
+
+    def test_equivalent_queries_share_cache(self) -> None:
+        bump_index_generation()
+        result = SearchResult(product_ids=[3, 1], total=2)
+
+        with patch(
+            "products.utils.elasticsearch.elastic_search.execute_search", return_value=result
+        ) as mock_execute:
+            first = search_products("블랙 니트")
+            second = search_products("검정   스웨터")
+
+        assert first == second == result
+        mock_execute.assert_called_once_with("black sweater", 1, 24, SearchFilters())
@@ -0,0 +1,114 @@
+from typing import Optional, cast
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache as django_cache
+
+from config.utils.cache_helper import CacheHelper
+from config.utils.setup_test_method import TestSetupMixin
+from products.models import Product
+from products.services.stock_reservation import (
+    EXPIRY_INDEX_KEY,
+    InsufficientStockError,
+    InvalidQuantityError,
+    StockReservationService,
+)
+
+
+@pytest.mark.django_db
+class TestStockReservation(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.setup_test_products_data()
+        self.clear_keys()
+
+    def teardown_method(self) -> None:
+        self.clear_keys()
+
+    def clear_keys(self) -> None:
+        redis_client = CacheHelper.get_redis_client()
+        keys = list(redis_client.scan_iter(django_cache.make_key('stock:*')))
+        if keys:
+            redis_client.delete(*keys)
+
+    def items(self, quantity: int) -> list[dict[str, int]]:
+        return [{"product_id": self.product.id, "quantity": quantity}]
+
+    def available(self) -> int:
+        raw = cast(
+            Optional[bytes], CacheHelper.get_redis_client().get(django_cache.make_key(f'stock:available:{self.product.id}'))
+        )
+        assert raw is not None
+        return int(raw)
+
+    def test_reserve_holds_stock(self) -> None:
+        StockReservationService.reserve('first', self.items(3))
+
+        with pytest.raises(InsufficientStockError):
+            StockReservationService.reserve('second', self.items(3))
+
+        assert self.available() == 2
+        assert StockReservationService.get_reserved_quantities('first') == {self.product.id: 3}
+        # DB 재고는 결제 승인 전까지 그대로
+        assert Product.objects.get(id=self.product.id).stock == 5
+
+    def test_release_returns_stock_once(self) -> None:
+        StockReservationService.reserve('first', self.items(3))
+
+        assert StockReservationService.release('first') is True
+        assert StockReservationService.release('first') is False
+        assert self.available() == 5
+
+    def test_commit_decrements_db_stock(self, django_capture_on_commit_callbacks) -> None:  # type: ignore[no-untyped-def]
+        StockReservationService.reserve('first', self.items(2))
+
+        with django_capture_on_commit_callbacks(execute=True):
+            StockReservationService.commit('first', self.items(2))
+
+        assert Product.objects.get(id=self.product.id).stock == 3
+        assert self.available() == 3
+        assert StockReservationService.get_reserved_quantities('first') == {}
+
+    def test_commit_rejects_oversell(self) -> None:
+        with pytest.raises(InsufficientStockError):
+            StockReservationService.commit(None, self.items(6))
+
+        assert Product.objects.get(id=self.product.id).stock == 5
+
+    def test_ensure_reserved_restores_expired_reservation(self) -> None:
+        StockReservationService.reserve('first', self.items(2))
+        StockReservationService.release('first')
+
+        StockReservationService.ensure_reserved('first', self.items(2))
+
+        assert StockReservationService.get_reserved_quantities('first') == {self.product.id: 2}
+        assert self.available() == 3
+
+        # 이미 예약된 수량이면 다시 차감하지 않는다
+        StockReservationService.ensure_reserved('first', self.items(2))
+
+        assert self.available() == 3
+
+        StockReservationService.reserve('other', self.items(3))
+        StockReservationService.release('first')
+        with pytest.raises(InsufficientStockError):
+            StockReservationService.ensure_reserved('first', self.items(3))
+
+    def test_non_positive_quantity_rejected(self) -> None:
+        for quantity in (0, -5):
+            with pytest.raises(InvalidQuantityError):
+                StockReservationService.reserve('negative', self.items(quantity))
+            with pytest.raises(InvalidQuantityError):
+                StockReservationService.commit('negative', self.items(quantity))
+
+        assert StockReservationService.get_reserved_quantities('negative') == {}
+        assert Product.objects.get(id=self.product.id).stock == 5
+
+    def test_sweeper_releases_expired(self) -> None:
+        with patch('products.services.stock_reservation.time.time', return_value=0):
+            StockReservationService.reserve('expired', self.items(4))
+        StockReservationService.reserve('active', self.items(1))
+
+        assert StockReservationService.release_expired() == 1
+        assert self.available() == 4
+        assert CacheHelper.get_redis_client().zcard(django_cache.make_key(EXPIRY_INDEX_KEY)) == 1
@@ -8,6 +8,8 @@ from products.views.admin.product_color_views import (
     AdminColorUpdateView,
     AdminProductColorView,
 )
+from products.views.customers.autocomplete import ProductAutocompleteView
+from products.views.customers.product_feed import ProductFeedView
 from products.views.customers.product_list import ProductListView
 from products.views.products_detail import ProductsDetailView
 
@@ -22,4 +24,6 @@ urlpatterns = [
     path("admin/color/<int:pk>/update/", AdminColorUpdateView.as_view(), name="admin-color-update"),
     path("admin/color/<int:pk>/delete/", AdminColorDeleteView.as_view(), name="admin-color-delete"),
     path("list/", ProductListView.as_view(), name="customer-product-list"),
+    path("search/autocomplete/", ProductAutocompleteView.as_view(), name="product-autocomplete"),
+    path("feed/", ProductFeedView.as_view(), name="product-feed"),
 ]
\ No newline at end of file
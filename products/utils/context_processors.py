@@ -1,46 +1,58 @@
 from datetime import timedelta
-from typing import Any, Dict
+from typing import Any, Dict, List
 
+from django.db.models import Prefetch
 from django.http import HttpRequest
 from django.utils import timezone
+from django.utils.functional import SimpleLazyObject
 
-from config.utils.cache_helper import CacheHelper
-from products.models import Product
+from config.utils.tiered_cache import TieredCache
+from products.models import Product, ProductImage
 
 NEW_PRODUCT_PERIOD_DAYS = 30
 NEW_PRODUCT_LIMIT = 10
 NEW_PRODUCT_CACHE_TIMEOUT = 300
+NEW_PRODUCT_CACHE_STALE_TIMEOUT = 60
+NEW_PRODUCT_CACHE_KEY = 'product:new:carousel'
+
+
+def load_new_products() -> List[Dict[str, Any]]:
+    one_month_ago = timezone.now() - timedelta(days=NEW_PRODUCT_PERIOD_DAYS)
+
+    products = Product.objects.filter(
+        created_at__gte=one_month_ago,
+        is_live=True,
+        is_sold=False
+    ).prefetch_related(
+        Prefetch('image', queryset=ProductImage.objects.order_by('id'))
+    ).only('id', 'name').order_by('-created_at')[:NEW_PRODUCT_LIMIT]
+
+    new_products: List[Dict[str, Any]] = []
+    for product in products:
+        images = list(product.image.all())
+        new_products.append({
+            'id': product.id,
+            'name': product.name,
+            'image_url': images[0].image.url if images else None,
+        })
+    return new_products
+
+
+def get_new_products() -> List[Dict[str, Any]]:
+    return list(TieredCache.get_or_compute(
+        NEW_PRODUCT_CACHE_KEY,
+        load_new_products,
+        ttl=NEW_PRODUCT_CACHE_TIMEOUT,
+        stale_ttl=NEW_PRODUCT_CACHE_STALE_TIMEOUT,
+    ))
+
+
+def invalidate_new_products() -> None:
+    TieredCache.invalidate(NEW_PRODUCT_CACHE_KEY)
 
 
 def new_products_context(request: HttpRequest) -> Dict[str, Any]:
-    cache_key = 'product:new:list'
-    
-    product_ids = CacheHelper.get(cache_key)
-    
-    if product_ids is None:
-        one_month_ago = timezone.now() - timedelta(days=NEW_PRODUCT_PERIOD_DAYS)
-        
-        products = Product.objects.filter(
-            created_at__gte=one_month_ago,
-            is_live=True,
-            is_sold=False
-        ).order_by('-created_at')[:NEW_PRODUCT_LIMIT]
-        
-        product_ids = [product.id for product in products]
-        
-        CacheHelper.set(cache_key, product_ids, NEW_PRODUCT_CACHE_TIMEOUT)
-    
-    if product_ids:
-        products_dict = {
-            p.id: p for p in Product.objects.filter(
-                id__in=product_ids
-            ).prefetch_related('colors', 'image')
-        }
-        new_products = [products_dict[pid] for pid in product_ids if pid in products_dict]
-    else:
-        new_products = []
-    
+    # 템플릿에서 실제로 사용할 때만 캐시/DB 를 조회
     return {
-        'new_products': new_products
+        'new_products': SimpleLazyObject(get_new_products)
     }
-
@@ -1,10 +1,30 @@
-from typing import Any, Dict, List
+from dataclasses import asdict
+from typing import Any, Dict, Iterator, List, Tuple
 
+from django.db.models import QuerySet
 from elasticsearch import Elasticsearch, helpers
 from elasticsearch.exceptions import NotFoundError
 
 from config import settings
+from config.utils.cache_helper import CacheHelper
+from config.utils.circuit_breaker import CircuitBreaker
+from products.models import Product
 from products.utils.elasticsearch.elastic_services import ElasticSearchService
+from products.utils.elasticsearch.search_cache import (
+    SEARCH_RESULT_CACHE_TIMEOUT,
+    build_search_cache_key,
+    bump_index_generation,
+    normalize_query,
+)
+from products.utils.search.base import (
+    AUTOCOMPLETE_SIZE,
+    FACET_SIZE,
+    MAX_RESULT_WINDOW,
+    PRICE_RANGES,
+    SEARCH_PAGE_SIZE,
+    SearchFilters,
+    SearchResult,
+)
 
 es_client = Elasticsearch(
     settings.ES_HOST,
@@ -12,9 +32,22 @@ es_client = Elasticsearch(
 )
 
 PRODUCT_INDEX_NAME = "seoseung-soo-products"
+# 검색 요청이 동기 워커를 오래 붙잡지 않도록 호출마다 짧은 타임아웃을 건다
+SEARCH_REQUEST_TIMEOUT = 2
+AUTOCOMPLETE_REQUEST_TIMEOUT = 1
+
+es_search_breaker = CircuitBreaker("elasticsearch-search")
 
 
-def create_product_index(force_reset: bool = False) -> None:
+class IndexRebuildError(Exception):
+    def __init__(self, index_name: str, success_count: int, failed_count: int) -> None:
+        self.index_name = index_name
+        self.success_count = success_count
+        self.failed_count = failed_count
+        super().__init__(f"{failed_count} documents failed to index into {index_name}; alias was not swapped")
+
+
+def build_index_mapping() -> Dict[str, Any]:
     category_synonyms = ElasticSearchService.load_category_synonyms()
     color_synonyms = ElasticSearchService.load_color_synonyms()
     
@@ -78,6 +111,7 @@ def create_product_index(force_reset: bool = False) -> None:
                 },
                 "price": {"type": "float"},
                 "sale_price": {"type": "float"},
+                "effective_price": {"type": "float"},
                 "stock": {"type": "integer"},
                 "is_live": {"type": "boolean"},
                 "is_sold": {"type": "boolean"},
@@ -93,103 +127,393 @@ def create_product_index(force_reset: bool = False) -> None:
                         "text": {"type": "text", "analyzer": "color_analyzer"}
                     }
                 },
+                "suggest": {
+                    "type": "completion",
+                    "analyzer": "korean_analyzer",
+                    "contexts": [
+                        {"name": "status", "type": "category"}
+                    ]
+                },
                 "created_at": {"type": "date"},
                 "updated_at": {"type": "date"},
             }
         }
     }
     
+    return index_mapping
+
+
+def indexable_products() -> QuerySet[Product]:
+    # 전체 색인과 변경분 색인이 같은 기준을 쓰도록 검색 인덱스에 들어갈 상품은 여기서만 정한다
+    return Product.objects.filter(is_live=True).prefetch_related('categories', 'colors')
+
+
+def is_concrete_product_index() -> bool:
+    """alias 도입 이전에 만든 단일 인덱스가 PRODUCT_INDEX_NAME 으로 남아 있는지"""
+    return bool(es_client.indices.exists(index=PRODUCT_INDEX_NAME)) and not get_alias_indices()
+
+
+def get_alias_indices() -> List[str]:
+    try:
+        return list(es_client.indices.get_alias(name=PRODUCT_INDEX_NAME).keys())
+    except NotFoundError:
+        return []
+
+
+def create_versioned_index() -> str:
+    # seoseung-soo-products-v{N}: 기존 버전 중 가장 큰 값 + 1
+    versions = [0]
+    try:
+        for index_name in es_client.indices.get(index=f"{PRODUCT_INDEX_NAME}-v*").keys():
+            suffix = index_name.rsplit("-v", 1)[-1]
+            if suffix.isdigit():
+                versions.append(int(suffix))
+    except NotFoundError:
+        pass
+
+    index_name = f"{PRODUCT_INDEX_NAME}-v{max(versions) + 1}"
+    index_mapping = build_index_mapping()
+    # 전체 색인 중에는 refresh 를 끄고, alias 교체 전에 기본값으로 되돌린다
+    index_mapping["settings"]["index"] = {"refresh_interval": "-1"}
+    es_client.indices.create(index=index_name, body=index_mapping)
+    return index_name
+
+
+def swap_product_alias(new_index: str, delete_old: bool = True) -> List[str]:
+    old_indices = get_alias_indices()
+    actions: List[Dict[str, Any]] = [{"add": {"index": new_index, "alias": PRODUCT_INDEX_NAME}}]
+
+    if not old_indices and es_client.indices.exists(index=PRODUCT_INDEX_NAME):
+        # alias 도입 이전의 단일 인덱스는 alias 추가와 함께 원자적으로 제거
+        actions.append({"remove_index": {"index": PRODUCT_INDEX_NAME}})
+    for old_index in old_indices:
+        actions.append({"remove": {"index": old_index, "alias": PRODUCT_INDEX_NAME}})
+
+    es_client.indices.update_aliases(actions=actions)
+
+    if delete_old:
+        for old_index in old_indices:
+            if old_index != new_index:
+                es_client.indices.delete(index=old_index, ignore_unavailable=True)
+    return old_indices
+
+
+def create_product_index() -> None:
     if not es_client.indices.exists(index=PRODUCT_INDEX_NAME):
-        es_client.indices.create(index=PRODUCT_INDEX_NAME, body=index_mapping)
-    elif force_reset:
-        try:
-            es_client.indices.delete(index=PRODUCT_INDEX_NAME)
-        except NotFoundError:
-            pass  # 인덱스가 존재하지 않으므로 무시
-        es_client.indices.create(index=PRODUCT_INDEX_NAME, body=index_mapping)
-        
-
-
-def bulk_index_products(products: Any, reset_index: bool = False) -> tuple[int, int]:
-    create_product_index(force_reset=reset_index)
-    actions = []
-    for product in products:
-        doc = {
-            "_index": PRODUCT_INDEX_NAME,
+        new_index = create_versioned_index()
+        es_client.indices.put_settings(index=new_index, settings={"refresh_interval": None})
+        swap_product_alias(new_index)
+
+
+def build_suggest_field(product: Any, categories: List[str], colors: List[str]) -> List[Dict[str, Any]]:
+    color_terms: List[str] = []
+    for color in colors:
+        color_terms.extend(ElasticSearchService.get_color_synonyms(color))
+
+    contexts = {"status": ["live"] if product.is_live and not product.is_sold else ["hidden"]}
+    suggestions = [
+        {"input": [product.name], "weight": 10, "contexts": contexts},
+        {"input": categories, "weight": 5, "contexts": contexts},
+        {"input": color_terms, "weight": 3, "contexts": contexts},
+    ]
+    return [suggestion for suggestion in suggestions if suggestion["input"]]
+
+
+def product_to_document(product: Any) -> Dict[str, Any]:
+    categories = [cat.name for cat in product.categories.all()]
+    colors = [color.name for color in product.colors.all()]
+    return {
+        "id": product.id,
+        "name": product.name,
+        "description": product.description,
+        "price": float(product.price),
+        "sale_price": float(product.sale_price) if product.sale_price else None,
+        # sale_price 는 할인 금액이므로 실제 판매가는 price - sale_price
+        "effective_price": float(product.price - (product.sale_price or 0)),
+        "stock": product.stock,
+        "is_live": product.is_live,
+        "is_sold": product.is_sold,
+        "categories": categories,
+        "colors": colors,
+        "suggest": build_suggest_field(product, categories, colors),
+        "created_at": product.created_at.isoformat(),
+        "updated_at": product.updated_at.isoformat(),
+    }
+
+
+def generate_product_actions(products: Any, index_name: str, chunk_size: int) -> Iterator[Dict[str, Any]]:
+    # 전체 상품을 메모리에 올리지 않고 chunk 단위로 읽는다 (prefetch 도 chunk 단위로 수행)
+    for product in products.iterator(chunk_size=chunk_size):
+        yield {
+            "_index": index_name,
             "_id": product.id,
-            "_source": {
-                "id": product.id,
-                "name": product.name,
-                "description": product.description,
-                "price": float(product.price),
-                "sale_price": float(product.sale_price) if product.sale_price else None,
-                "stock": product.stock,
-                "is_live": product.is_live,
-                "is_sold": product.is_sold,
-                "categories": [cat.name for cat in product.categories.all()],
-                "colors": [color.name for color in product.colors.all()],
-                "created_at": product.created_at.isoformat(),
-                "updated_at": product.updated_at.isoformat(),
+            "_source": product_to_document(product),
+        }
+
+
+def bulk_index_products(
+    products: Any,
+    index_name: str = PRODUCT_INDEX_NAME,
+    chunk_size: int = 500,
+    workers: int = 1,
+) -> tuple[int, int]:
+    actions = generate_product_actions(products, index_name, chunk_size)
+
+    if workers > 1:
+        results = helpers.parallel_bulk(
+            es_client, actions, thread_count=workers, chunk_size=chunk_size, raise_on_error=False
+        )
+    else:
+        results = helpers.streaming_bulk(es_client, actions, chunk_size=chunk_size, raise_on_error=False)
+
+    success_count = 0
+    failed_count = 0
+    for ok, _ in results:
+        if ok:
+            success_count += 1
+        else:
+            failed_count += 1
+
+    if index_name == PRODUCT_INDEX_NAME:
+        # 새 문서가 검색되기 전에 세대를 올리면 그 사이의 검색이 이전 결과를 새 세대로 캐시하므로 refresh 이후에 올린다
+        es_client.indices.refresh(index=index_name)
+        bump_index_generation()
+    return success_count, failed_count
+
+
+def rebuild_product_index(products: Any, chunk_size: int = 500, workers: int = 1) -> Tuple[str, int, int]:
+    """
+    새 버전 인덱스에 전체 색인 후 alias 를 원자적으로 교체한다. 색인 중에도 검색은 기존 인덱스를 사용한다.
+    한 건이라도 실패하면 새 인덱스를 지우고 IndexRebuildError 를 던진다 (기존 인덱스 유지).
+    """
+    new_index = create_versioned_index()
+    try:
+        success_count, failed_count = bulk_index_products(products, new_index, chunk_size, workers)
+    except Exception:
+        es_client.indices.delete(index=new_index, ignore_unavailable=True)
+        raise
+
+    if failed_count:
+        es_client.indices.delete(index=new_index, ignore_unavailable=True)
+        raise IndexRebuildError(new_index, success_count, failed_count)
+
+    es_client.indices.put_settings(index=new_index, settings={"refresh_interval": None})
+    es_client.indices.refresh(index=new_index)
+    swap_product_alias(new_index)
+    bump_index_generation()
+    return new_index, success_count, failed_count
+
+
+def index_products_by_ids(product_ids: List[int]) -> Tuple[int, List[int]]:
+    """
+    변경된 상품만 색인한다. DB 에 없거나 더 이상 색인 대상이 아닌 상품은 인덱스에서 삭제한다.
+    (성공 건수, 실패한 상품 ID 목록) 을 반환하며, ES 연결 오류는 그대로 전파된다.
+    """
+    if not product_ids:
+        return 0, []
+
+    products = indexable_products().filter(id__in=product_ids)
+    products_dict = {product.id: product for product in products}
+
+    actions: List[Dict[str, Any]] = []
+    for product_id in product_ids:
+        product = products_dict.get(product_id)
+        if product is None:
+            actions.append({"_op_type": "delete", "_index": PRODUCT_INDEX_NAME, "_id": product_id})
+        else:
+            actions.append({"_index": PRODUCT_INDEX_NAME, "_id": product_id, "_source": product_to_document(product)})
+
+    # 변경 내용이 검색에 보이게 된 뒤에 세대를 올리도록 refresh 까지 기다린다
+    success, errors = helpers.bulk(
+        es_client, actions, raise_on_error=False, ignore_status=(404,), refresh='wait_for'
+    )
+
+    failed_ids: List[int] = []
+    for error in errors if isinstance(errors, list) else []:
+        for item in error.values():
+            failed_ids.append(int(item["_id"]))
+
+    bump_index_generation()
+    return success, failed_ids
+
+
+def build_es_filters(filters: SearchFilters, exclude: str | None = None) -> List[Dict[str, Any]]:
+    # exclude: 해당 facet 의 집계에서는 자기 자신의 필터를 빼야 다른 선택지의 개수가 보인다
+    es_filters: List[Dict[str, Any]] = []
+    if filters.categories and exclude != "categories":
+        es_filters.append({"terms": {"categories": filters.categories}})
+    if filters.colors and exclude != "colors":
+        es_filters.append({"terms": {"colors": filters.colors}})
+    price_bounds = filters.get_price_bounds()
+    if price_bounds and exclude != "price":
+        bounds = {}
+        if price_bounds[0] is not None:
+            bounds["gte"] = price_bounds[0]
+        if price_bounds[1] is not None:
+            bounds["lt"] = price_bounds[1]
+        es_filters.append({"range": {"effective_price": bounds}})
+    return es_filters
+
+
+def build_search_query(query: str) -> Dict[str, Any]:
+    if query:
+        must: Dict[str, Any] = {
+            "multi_match": {
+                "query": query,
+                "fields": [
+                    "name^5", "name.synonym^5",
+                    "description^3", "description.synonym^3",
+                    "categories.text^10",
+                    "colors.text^8"
+                ],
+                "type": "best_fields",
+                "analyzer": "text_with_color_synonym_analyzer",
+                "fuzziness": "AUTO",
             }
         }
-        actions.append(doc)
-    
-    if actions:
-        result = helpers.bulk(es_client, actions, raise_on_error=False)
-        if isinstance(result, tuple):
-            success, failed = result
-            failed_count = len(failed) if isinstance(failed, list) else 0
-            return success, failed_count
-        return len(actions), 0
-    
-    return 0, 0
+    else:
+        must = {"match_all": {}}
+
+    return {
+        "function_score": {
+            "query": {
+                "bool": {
+                    "must": [must],
+                    "filter": [
+                        {"term": {"is_live": True}},
+                        {"term": {"is_sold": False}},
+                    ],
+                }
+            },
+            # 관련도 점수에 최신성 가중치를 곱한다 (30일마다 절반)
+            "functions": [
+                {"gauss": {"created_at": {"origin": "now", "scale": "30d", "decay": 0.5}}}
+            ],
+            "boost_mode": "multiply",
+        }
+    }
 
 
-def search_products(query: str, limit: int = 100) -> List[Dict[str, Any]]:
-    if not query:
-        return []
-    
+def build_facet_aggregations(filters: SearchFilters) -> Dict[str, Any]:
+    def with_filters(name: str, aggregation: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "filter": {"bool": {"filter": build_es_filters(filters, exclude=name)}},
+            "aggs": {name: aggregation},
+        }
+
+    return {
+        "categories": with_filters("categories", {"terms": {"field": "categories", "size": FACET_SIZE}}),
+        "colors": with_filters("colors", {"terms": {"field": "colors", "size": FACET_SIZE}}),
+        "price": with_filters("price", {"range": {"field": "effective_price", "ranges": PRICE_RANGES}}),
+    }
+
+
+def parse_facets(aggregations: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    facets: Dict[str, List[Dict[str, Any]]] = {}
+    for name, aggregation in aggregations.items():
+        facets[name] = [
+            {"key": bucket["key"], "count": bucket["doc_count"]}
+            for bucket in aggregation[name]["buckets"]
+        ]
+    return facets
+
+
+def execute_search(query: str, page: int, page_size: int, filters: SearchFilters) -> SearchResult:
+    # 선택된 필터는 post_filter 로 적용해 facet 집계가 필터 전 결과를 기준으로 계산되도록 한다
     search_body = {
-        "query": {
-            "bool": {
-                "must": [
-                    {
-                        "multi_match": {
-                            "query": query,
-                            "fields": [
-                                "name^5", "name.synonym^5",
-                                "description^3", "description.synonym^3",
-                                "categories.text^10",
-                                "colors.text^8"
-                            ],
-                            "type": "best_fields",
-                            "analyzer": "text_with_color_synonym_analyzer",
-                            "fuzziness": "AUTO",
-                        }
-                    }
-                ],
-                "filter": [
-                    {"term": {"is_live": True}},
-                    {"term": {"is_sold": False}}
-                ]
+        "query": build_search_query(query),
+        "post_filter": {"bool": {"filter": build_es_filters(filters)}},
+        "aggs": build_facet_aggregations(filters),
+        "from": (page - 1) * page_size,
+        "size": page_size,
+        "sort": [
+            {"_score": {"order": "desc"}},
+            {"created_at": {"order": "desc"}},
+            {"id": {"order": "desc"}},
+        ],
+        "_source": False,
+        "track_total_hits": True,
+    }
+
+    response = es_client.options(request_timeout=SEARCH_REQUEST_TIMEOUT).search(
+        index=PRODUCT_INDEX_NAME, body=search_body
+    )
+    hits = response["hits"]
+    return SearchResult(
+        product_ids=[int(hit["_id"]) for hit in hits["hits"]],
+        total=hits["total"]["value"],
+        page=page,
+        page_size=page_size,
+        facets=parse_facets(response.get("aggregations", {})),
+    )
+
+
+def search_products(
+    query: str,
+    page: int = 1,
+    page_size: int = SEARCH_PAGE_SIZE,
+    filters: SearchFilters | None = None,
+) -> SearchResult:
+    """
+    정규화된 검색어 + 필터 기준으로 Redis 에 캐시된 결과를 반환한다.
+    ES 오류(서킷 open 시 CircuitOpenError 포함)는 캐시하지 않고 그대로 전파하므로 호출부에서 fallback 을 처리해야 한다.
+    """
+    filters = filters or SearchFilters()
+    query = normalize_query(query)
+    if not query and filters.is_empty():
+        return SearchResult(page=page, page_size=page_size)
+
+    # from + size 는 max_result_window 를 넘을 수 없다
+    page = max(1, min(page, MAX_RESULT_WINDOW // page_size))
+
+    cache_key = build_search_cache_key(query, page, page_size, {
+        "categories": sorted(filters.categories),
+        "colors": sorted(filters.colors),
+        "price_range": filters.price_range,
+    })
+    data = CacheHelper.get_or_compute(
+        cache_key,
+        lambda: asdict(es_search_breaker.call(execute_search, query, page, page_size, filters)),
+        ttl=SEARCH_RESULT_CACHE_TIMEOUT,
+    )
+    return SearchResult(**data)
+
+
+def suggest_products(prefix: str, size: int = AUTOCOMPLETE_SIZE) -> List[str]:
+    if not prefix:
+        return []
+
+    # completion suggester 는 FST 기반 prefix 조회라 fuzzy multi_match 보다 훨씬 가볍다
+    suggest_body = {
+        "_source": False,
+        "suggest": {
+            "product-suggest": {
+                "prefix": prefix,
+                "completion": {
+                    "field": "suggest",
+                    "size": size,
+                    "skip_duplicates": True,
+                    "contexts": {"status": ["live"]},
+                },
             }
         },
-        "size": limit,
-        "sort": [
-            {"created_at": {"order": "desc"}}
-        ]
     }
-    
+
     try:
-        response = es_client.search(index=PRODUCT_INDEX_NAME, body=search_body)
-        product_ids = [hit["_source"]["id"] for hit in response["hits"]["hits"]]
-        return product_ids
+        response = es_search_breaker.call(
+            es_client.options(request_timeout=AUTOCOMPLETE_REQUEST_TIMEOUT).search,
+            index=PRODUCT_INDEX_NAME,
+            body=suggest_body,
+        )
+        options = response["suggest"]["product-suggest"][0]["options"]
+        return [option["text"] for option in options]
     except Exception:
         return []
 
 
 def delete_product_from_index(product_id: int) -> None:
     try:
-        es_client.delete(index=PRODUCT_INDEX_NAME, id=str(product_id))
+        es_client.delete(index=PRODUCT_INDEX_NAME, id=str(product_id), refresh='wait_for')
     except NotFoundError:
-        pass  # 문서 또는 인덱스가 존재하지 않으므로 무시
\ No newline at end of file
+        pass  # 문서 또는 인덱스가 존재하지 않으므로 무시
+    bump_index_generation()
\ No newline at end of file
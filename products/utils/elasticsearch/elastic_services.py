@@ -1,5 +1,6 @@
+import functools
 import os
-from typing import List
+from typing import Dict, List
 
 
 class ElasticSearchService:
@@ -21,4 +22,22 @@ class ElasticSearchService:
 
     @staticmethod
     def load_color_synonyms() -> List[str]:
-        return ElasticSearchService.load_synonyms("color_synonyms")
\ No newline at end of file
+        return ElasticSearchService.load_synonyms("color_synonyms")
+
+    @staticmethod
+    @functools.cache
+    def load_synonym_groups(filename: str) -> Dict[str, List[str]]:
+        # "black,블랙,검정" -> {"black": [...], "블랙": [...], "검정": [...]}
+        groups: Dict[str, List[str]] = {}
+        for line in ElasticSearchService.load_synonyms(filename):
+            if "=>" in line:
+                continue
+            terms = [term.strip().lower() for term in line.split(",") if term.strip()]
+            for term in terms:
+                groups[term] = terms
+        return groups
+
+    @staticmethod
+    def get_color_synonyms(color_name: str) -> List[str]:
+        groups = ElasticSearchService.load_synonym_groups("color_synonyms")
+        return groups.get(color_name.strip().lower(), [color_name])
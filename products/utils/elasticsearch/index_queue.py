@@ -0,0 +1,206 @@
+import json
+import time
+from typing import Iterable, List, Optional, cast
+
+from django.core.cache import cache as django_cache
+from django.db import transaction
+from django.utils import timezone
+
+from config.utils.cache_helper import CacheHelper
+from products.utils.search import get_search_backend
+
+PENDING_QUEUE_KEY = 'es:product:pending'
+PROCESSING_QUEUE_KEY = 'es:product:processing'
+RETRY_COUNT_KEY = 'es:product:retries'
+DEAD_LETTER_KEY = 'es:product:dead'
+# 전체 재색인 도중 삭제된 상품을 새 인덱스에서도 지우기 위한 삭제 기록 (score = 삭제 시각)
+DELETED_LOG_KEY = 'es:product:deleted'
+DELETED_LOG_RETENTION = 60 * 60 * 24
+MAX_RETRIES = 8
+# 실패할 때마다 2, 4, 8 ... 초 뒤로 미룬다 (최대 5분). 8번이면 약 4분간의 ES 장애를 버틴다
+RETRY_BACKOFF_BASE = 2
+RETRY_BACKOFF_MAX = 60 * 5
+# 이 시간 안에 ack 되지 않은 배치는 워커가 죽은 것으로 보고 다시 대기열로 돌려보낸다
+VISIBILITY_TIMEOUT = 60 * 5
+
+# KEYS: [대기 zset, 처리 중 zset]
+# ARGV: [현재 시각, 처리 만료 시각, 배치 크기]
+# 처리 시한이 지난 항목을 먼저 대기열로 되돌린 뒤, 실행 시각이 된 항목을 처리 중으로 옮긴다.
+_CLAIM_SCRIPT = """
+local expired = redis.call('zrangebyscore', KEYS[2], '-inf', ARGV[1])
+for _, product_id in ipairs(expired) do
+    redis.call('zrem', KEYS[2], product_id)
+    redis.call('zadd', KEYS[1], 'LT', ARGV[1], product_id)
+end
+local product_ids = redis.call('zrangebyscore', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[3])
+for _, product_id in ipairs(product_ids) do
+    redis.call('zrem', KEYS[1], product_id)
+    redis.call('zadd', KEYS[2], ARGV[2], product_id)
+end
+return product_ids
+"""
+
+# KEYS: [dead-letter 리스트, 대기 zset]
+# ARGV: [현재 시각, 최대 개수]
+_REDRIVE_SCRIPT = """
+local entries = redis.call('rpop', KEYS[1], ARGV[2])
+if not entries then
+    return 0
+end
+for _, entry in ipairs(entries) do
+    redis.call('zadd', KEYS[2], 'LT', ARGV[1], cjson.decode(entry)['product_id'])
+end
+return #entries
+"""
+
+
+class ProductIndexQueue:
+    """
+    ES 색인이 필요한 상품 ID 를 Redis sorted set 에 모아두는 큐 (score = 색인 가능 시각).
+    - 같은 상품이 여러 번 수정되어도 한 번만 색인된다
+    - 꺼낸 ID 는 ack 전까지 처리 중 zset 에 남아, 워커가 죽으면 VISIBILITY_TIMEOUT 뒤 다시 색인된다
+    - 실패한 ID 는 지수 백오프로 미뤄서 재시도하고, MAX_RETRIES 를 넘으면 dead-letter 로 옮긴다
+    """
+
+    @staticmethod
+    def _key(key: str) -> str:
+        return django_cache.make_key(key)
+
+    @staticmethod
+    def _add(product_ids: List[int], ready_at: Optional[float] = None) -> None:
+        if product_ids:
+            score = time.time() if ready_at is None else ready_at
+            # 이미 백오프 중인 상품이 다시 수정되면 바로 색인되도록 더 이른 시각만 반영
+            pipeline = CacheHelper.get_redis_client().pipeline(transaction=False)
+            pipeline.zadd(
+                ProductIndexQueue._key(PENDING_QUEUE_KEY),
+                {str(product_id): score for product_id in product_ids},
+                lt=True,
+            )
+            pipeline.execute()
+
+    @staticmethod
+    def enqueue(product_ids: Iterable[int]) -> None:
+        # DB 트리거로 검색 데이터가 유지되는 백엔드(Postgres)는 색인 큐가 필요 없다
+        if not get_search_backend().requires_indexing:
+            return
+        ids = [int(product_id) for product_id in product_ids]
+        if not ids:
+            return
+        # 커밋된 데이터를 색인하도록 트랜잭션 커밋 이후에 큐에 넣는다
+        transaction.on_commit(lambda: ProductIndexQueue._add(ids))
+
+    @staticmethod
+    def _record_deleted(product_ids: List[int]) -> None:
+        now = time.time()
+        pipeline = CacheHelper.get_redis_client().pipeline(transaction=False)
+        pipeline.zadd(ProductIndexQueue._key(DELETED_LOG_KEY), {str(product_id): now for product_id in product_ids})
+        pipeline.zremrangebyscore(ProductIndexQueue._key(DELETED_LOG_KEY), '-inf', now - DELETED_LOG_RETENTION)
+        pipeline.execute()
+
+    @staticmethod
+    def enqueue_deleted(product_ids: Iterable[int]) -> None:
+        if not get_search_backend().requires_indexing:
+            return
+        ids = [int(product_id) for product_id in product_ids]
+        if not ids:
+            return
+
+        def add() -> None:
+            ProductIndexQueue._record_deleted(ids)
+            ProductIndexQueue._add(ids)
+
+        transaction.on_commit(add)
+
+    @staticmethod
+    def deleted_since(timestamp: float) -> List[int]:
+        members = cast(List[bytes], CacheHelper.get_redis_client().zrangebyscore(
+            ProductIndexQueue._key(DELETED_LOG_KEY), timestamp, '+inf'
+        ))
+        return [int(member) for member in members]
+
+    @staticmethod
+    def pop_batch(batch_size: int) -> List[int]:
+        """색인할 차례가 된 ID 를 꺼내 처리 중으로 옮긴다. 처리 후 ack 또는 retry 를 호출해야 한다."""
+        now = time.time()
+        members = cast(Optional[List[bytes]], CacheHelper.get_redis_client().eval(
+            _CLAIM_SCRIPT,
+            2,
+            ProductIndexQueue._key(PENDING_QUEUE_KEY),
+            ProductIndexQueue._key(PROCESSING_QUEUE_KEY),
+            now,
+            now + VISIBILITY_TIMEOUT,
+            batch_size,
+        ))
+        return [int(member) for member in members or []]
+
+    @staticmethod
+    def pending_count() -> int:
+        return cast(int, CacheHelper.get_redis_client().zcard(ProductIndexQueue._key(PENDING_QUEUE_KEY)))
+
+    @staticmethod
+    def ack(product_ids: Iterable[int]) -> None:
+        ids = [str(product_id) for product_id in product_ids]
+        if ids:
+            pipeline = CacheHelper.get_redis_client().pipeline(transaction=False)
+            pipeline.zrem(ProductIndexQueue._key(PROCESSING_QUEUE_KEY), *ids)
+            pipeline.hdel(ProductIndexQueue._key(RETRY_COUNT_KEY), *ids)
+            pipeline.execute()
+
+    @staticmethod
+    def _backoff(retries: int) -> float:
+        return float(min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * (2 ** (retries - 1))))
+
+    @staticmethod
+    def retry(product_ids: Iterable[int], reason: str) -> List[int]:
+        """실패한 ID 를 백오프 후 다시 색인하도록 미루고, 재시도 횟수를 초과한 ID 는 dead-letter 리스트로 옮긴다."""
+        ids = [int(product_id) for product_id in product_ids]
+        if not ids:
+            return []
+
+        redis_client = CacheHelper.get_redis_client()
+        retry_key = ProductIndexQueue._key(RETRY_COUNT_KEY)
+
+        pipeline = redis_client.pipeline(transaction=False)
+        for product_id in ids:
+            pipeline.hincrby(retry_key, str(product_id), 1)
+        retry_counts = pipeline.execute()
+
+        now = time.time()
+        dead: List[int] = []
+        pipeline = redis_client.pipeline(transaction=False)
+        for product_id, retries in zip(ids, retry_counts):
+            if retries >= MAX_RETRIES:
+                dead.append(product_id)
+                pipeline.lpush(ProductIndexQueue._key(DEAD_LETTER_KEY), json.dumps({
+                    'product_id': product_id,
+                    'reason': reason,
+                    'failed_at': timezone.now().isoformat(),
+                }, ensure_ascii=False))
+                pipeline.hdel(retry_key, str(product_id))
+            else:
+                pipeline.zadd(
+                    ProductIndexQueue._key(PENDING_QUEUE_KEY),
+                    {str(product_id): now + ProductIndexQueue._backoff(retries)},
+                    lt=True,
+                )
+        # 대기열에 다시 넣은 뒤에 처리 중에서 제거 (그 사이에 죽어도 처리 시한이 지나면 회수된다)
+        pipeline.zrem(ProductIndexQueue._key(PROCESSING_QUEUE_KEY), *[str(product_id) for product_id in ids])
+        pipeline.execute()
+        return dead
+
+    @staticmethod
+    def dead_letter_count() -> int:
+        return cast(int, CacheHelper.get_redis_client().llen(ProductIndexQueue._key(DEAD_LETTER_KEY)))
+
+    @staticmethod
+    def redrive_dead_letters(limit: int = 1000) -> int:
+        """ES 복구 후 dead-letter 의 ID 를 오래된 것부터 대기열로 되돌리고 옮긴 개수를 반환"""
+        return cast(int, CacheHelper.get_redis_client().eval(
+            _REDRIVE_SCRIPT,
+            2,
+            ProductIndexQueue._key(DEAD_LETTER_KEY),
+            ProductIndexQueue._key(PENDING_QUEUE_KEY),
+            time.time(),
+            limit,
+        ))
@@ -0,0 +1,62 @@
+import functools
+import hashlib
+import json
+import unicodedata
+from typing import Any, Dict, List, Optional, cast
+
+from django.core.cache import cache as django_cache
+
+from config.utils.cache_helper import CacheHelper
+from products.utils.elasticsearch.elastic_services import ElasticSearchService
+
+SEARCH_RESULT_CACHE_TIMEOUT = 300
+INDEX_GENERATION_KEY = 'search:index:generation'
+
+
+@functools.cache
+def get_canonical_terms() -> Dict[str, str]:
+    """
+    동의어 파일을 기준으로 term -> 대표 term 매핑을 만든다.
+    여러 그룹에 속한 term(예: 셔츠, 재킷)은 ES 에서 확장되는 범위가 달라지므로 그대로 둔다.
+    """
+    memberships: Dict[str, List[str]] = {}
+    for filename in ("category_synonyms", "color_synonyms"):
+        for line in ElasticSearchService.load_synonyms(filename):
+            if "=>" in line:
+                continue
+            terms = [term.strip().lower() for term in line.split(",") if term.strip()]
+            for term in terms:
+                memberships.setdefault(term, []).append(terms[0])
+
+    return {
+        term: canonicals[0]
+        for term, canonicals in memberships.items()
+        if len(set(canonicals)) == 1
+    }
+
+
+def normalize_query(query: str) -> str:
+    # 전각/반각, 대소문자, 공백 차이와 동의어 표기를 하나로 맞춘다
+    canonical_terms = get_canonical_terms()
+    tokens = unicodedata.normalize("NFKC", query).lower().split()
+    return " ".join(canonical_terms.get(token, token) for token in tokens)
+
+
+def get_index_generation() -> int:
+    generation = cast(Optional[bytes], CacheHelper.get_redis_client().get(django_cache.make_key(INDEX_GENERATION_KEY)))
+    return int(generation) if generation else 0
+
+
+def bump_index_generation() -> None:
+    # 색인이 바뀔 때마다 세대를 올려 이전 세대의 검색 결과 캐시를 무효화
+    CacheHelper.get_redis_client().incr(django_cache.make_key(INDEX_GENERATION_KEY))
+
+
+def build_search_cache_key(query: str, page: int, page_size: int, filters: Dict[str, Any]) -> str:
+    payload = json.dumps(
+        {"query": query, "page": page, "page_size": page_size, "filters": filters},
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+    return f"search:result:{get_index_generation()}:{digest}"
@@ -0,0 +1,42 @@
+import functools
+from typing import List
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from products.utils.search.base import (
+    AUTOCOMPLETE_SIZE,
+    SEARCH_PAGE_SIZE,
+    SearchBackend,
+    SearchFilters,
+    SearchResult,
+)
+
+__all__ = [
+    'SEARCH_PAGE_SIZE',
+    'SearchBackend',
+    'SearchFilters',
+    'SearchResult',
+    'get_search_backend',
+    'search_products',
+    'suggest_products',
+]
+
+
+@functools.cache
+def get_search_backend() -> SearchBackend:
+    backend: SearchBackend = import_string(settings.PRODUCT_SEARCH_BACKEND)()
+    return backend
+
+
+def search_products(
+    query: str,
+    page: int = 1,
+    page_size: int = SEARCH_PAGE_SIZE,
+    filters: SearchFilters | None = None,
+) -> SearchResult:
+    return get_search_backend().search(query, page=page, page_size=page_size, filters=filters)
+
+
+def suggest_products(prefix: str, size: int = AUTOCOMPLETE_SIZE) -> List[str]:
+    return get_search_backend().suggest(prefix, size=size)
@@ -0,0 +1,82 @@
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+SEARCH_PAGE_SIZE = 24
+# ES index.max_result_window 기본값. 백엔드와 무관하게 같은 페이지 상한을 사용한다.
+MAX_RESULT_WINDOW = 10000
+FACET_SIZE = 30
+AUTOCOMPLETE_SIZE = 8
+
+PRICE_RANGES: List[Dict[str, Any]] = [
+    {"key": "~30000", "to": 30000},
+    {"key": "30000~50000", "from": 30000, "to": 50000},
+    {"key": "50000~100000", "from": 50000, "to": 100000},
+    {"key": "100000~", "from": 100000},
+]
+
+
+@dataclass
+class SearchFilters:
+    categories: List[str] = field(default_factory=list)
+    colors: List[str] = field(default_factory=list)
+    price_range: str | None = None
+
+    def is_empty(self) -> bool:
+        return not (self.categories or self.colors or self.price_range)
+
+    def get_price_bounds(self) -> Optional[Tuple[Optional[int], Optional[int]]]:
+        """선택된 가격대의 (이상, 미만) 경계. 알 수 없는 가격대면 None."""
+        if not self.price_range:
+            return None
+        price_range = next((r for r in PRICE_RANGES if r["key"] == self.price_range), None)
+        if price_range is None:
+            return None
+        return price_range.get("from"), price_range.get("to")
+
+
+@dataclass
+class SearchResult:
+    product_ids: List[int] = field(default_factory=list)
+    total: int = 0
+    page: int = 1
+    page_size: int = SEARCH_PAGE_SIZE
+    facets: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+
+    @property
+    def num_pages(self) -> int:
+        max_pages = MAX_RESULT_WINDOW // self.page_size
+        return min(max(1, math.ceil(self.total / self.page_size)), max_pages)
+
+    @property
+    def has_next(self) -> bool:
+        return self.page < self.num_pages
+
+    @property
+    def has_previous(self) -> bool:
+        return self.page > 1
+
+
+class SearchBackend(ABC):
+    """
+    상품 검색 백엔드 인터페이스.
+    settings.PRODUCT_SEARCH_BACKEND 로 구현체를 선택한다.
+    """
+
+    # 별도 색인(ES 등)을 동기화해야 하는 백엔드인지 여부
+    requires_indexing: bool = False
+
+    @abstractmethod
+    def search(
+        self,
+        query: str,
+        page: int = 1,
+        page_size: int = SEARCH_PAGE_SIZE,
+        filters: SearchFilters | None = None,
+    ) -> SearchResult:
+        ...
+
+    @abstractmethod
+    def suggest(self, prefix: str, size: int = AUTOCOMPLETE_SIZE) -> List[str]:
+        ...
@@ -0,0 +1,28 @@
+from typing import List
+
+from products.utils.elasticsearch import elastic_search
+from products.utils.search.base import (
+    AUTOCOMPLETE_SIZE,
+    SEARCH_PAGE_SIZE,
+    SearchBackend,
+    SearchFilters,
+    SearchResult,
+)
+
+
+class ElasticsearchSearchBackend(SearchBackend):
+    """ES 검색 (결과 캐시 + 서킷 브레이커는 elastic_search 모듈에서 처리)"""
+
+    requires_indexing = True
+
+    def search(
+        self,
+        query: str,
+        page: int = 1,
+        page_size: int = SEARCH_PAGE_SIZE,
+        filters: SearchFilters | None = None,
+    ) -> SearchResult:
+        return elastic_search.search_products(query, page=page, page_size=page_size, filters=filters)
+
+    def suggest(self, prefix: str, size: int = AUTOCOMPLETE_SIZE) -> List[str]:
+        return elastic_search.suggest_products(prefix, size=size)
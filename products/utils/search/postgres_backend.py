@@ -0,0 +1,203 @@
+import re
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Dict, List, TypedDict
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import (
+    Count,
+    DecimalField,
+    Exists,
+    ExpressionWrapper,
+    F,
+    OuterRef,
+    Q,
+    QuerySet,
+    Value,
+)
+from django.db.models.functions import Coalesce
+
+from categories.models import Category
+from products.models import Product
+from products.utils.elasticsearch.elastic_services import ElasticSearchService
+from products.utils.elasticsearch.search_cache import normalize_query
+from products.utils.search.base import (
+    AUTOCOMPLETE_SIZE,
+    FACET_SIZE,
+    MAX_RESULT_WINDOW,
+    PRICE_RANGES,
+    SEARCH_PAGE_SIZE,
+    SearchBackend,
+    SearchFilters,
+    SearchResult,
+)
+
+# 형태소 분석 없이 공백 단위로 토큰화 (트리거의 to_tsvector 와 같은 설정이어야 한다)
+SEARCH_CONFIG = 'simple'
+# tsquery 연산자로 해석되는 문자는 제거한다
+TSQUERY_SPECIAL_CHARS = re.compile(r"[&|!():*<>'\\]")
+
+
+def build_tsquery(query: str) -> str:
+    """
+    검색어를 raw tsquery 로 변환한다.
+    토큰마다 동의어를 OR 로 확장하고 prefix 매칭(:*)을 허용하며, 토큰끼리는 AND 로 묶는다.
+    예: "검정 니트" -> (검정:* | black:* | 블랙:*) & (니트:* | knit:*)
+    """
+    synonym_groups = [
+        ElasticSearchService.load_synonym_groups("category_synonyms"),
+        ElasticSearchService.load_synonym_groups("color_synonyms"),
+    ]
+
+    clauses: List[str] = []
+    for token in normalize_query(query).split():
+        terms = [token]
+        for groups in synonym_groups:
+            terms.extend(term for term in groups.get(token, []) if term not in terms)
+
+        lexemes: List[str] = []
+        for term in terms:
+            words = TSQUERY_SPECIAL_CHARS.sub(" ", term).split()
+            if words:
+                lexemes.append(" & ".join(f"{word}:*" for word in words))
+        if lexemes:
+            clauses.append("(" + " | ".join(f"({lexeme})" for lexeme in lexemes) + ")")
+
+    return " & ".join(clauses)
+
+
+class EffectivePrice(TypedDict):
+    effective_price: Decimal
+
+
+if TYPE_CHECKING:
+    from django_stubs_ext import WithAnnotations
+
+    # effective_price 가 annotate 된 상품 queryset (mypy 가 effective_price 조회를 확인할 수 있도록)
+    SearchableProducts = QuerySet[WithAnnotations[Product, EffectivePrice]]
+
+
+def with_effective_price(products: QuerySet[Product]) -> "SearchableProducts":
+    # sale_price 는 할인 금액이므로 실제 판매가는 price - sale_price (ES effective_price 와 동일)
+    return products.annotate(
+        effective_price=ExpressionWrapper(
+            F('price') - Coalesce('sale_price', Value(Decimal(0))),
+            output_field=DecimalField(max_digits=10, decimal_places=2),
+        )
+    )
+
+
+def get_searchable_products() -> "SearchableProducts":
+    return with_effective_price(Product.objects.filter(is_live=True, is_sold=False))
+
+
+def apply_filters(
+    products: "SearchableProducts", filters: SearchFilters, exclude: str | None = None
+) -> "SearchableProducts":
+    # exclude: 해당 facet 의 집계에서는 자기 자신의 필터를 빼야 다른 선택지의 개수가 보인다
+    if filters.categories and exclude != "categories":
+        products = products.filter(Exists(Product.categories.through.objects.filter(
+            product_id=OuterRef('pk'), category__name__in=filters.categories,
+        )))
+    if filters.colors and exclude != "colors":
+        products = products.filter(Exists(Product.colors.through.objects.filter(
+            product_id=OuterRef('pk'), color__name__in=filters.colors,
+        )))
+    price_bounds = filters.get_price_bounds()
+    if price_bounds and exclude != "price":
+        if price_bounds[0] is not None:
+            products = products.filter(effective_price__gte=Decimal(price_bounds[0]))
+        if price_bounds[1] is not None:
+            products = products.filter(effective_price__lt=Decimal(price_bounds[1]))
+    return products
+
+
+def count_facets(products: "SearchableProducts", filters: SearchFilters) -> Dict[str, List[Dict[str, Any]]]:
+    def terms_facet(through: Any, field: str, name: str) -> List[Dict[str, Any]]:
+        product_ids = apply_filters(products, filters, exclude=name).values('pk')
+        rows = (
+            through.objects.filter(product_id__in=product_ids)
+            .values(key=F(f'{field}__name'))
+            .annotate(count=Count('product_id', distinct=True))
+            .order_by('-count', 'key')[:FACET_SIZE]
+        )
+        return [{"key": row["key"], "count": row["count"]} for row in rows]
+
+    price_counts = apply_filters(products, filters, exclude="price").aggregate(**{
+        f"price_{index}": Count('pk', filter=Q(
+            **({"effective_price__gte": price_range["from"]} if "from" in price_range else {}),
+            **({"effective_price__lt": price_range["to"]} if "to" in price_range else {}),
+        ))
+        for index, price_range in enumerate(PRICE_RANGES)
+    })
+
+    return {
+        "categories": terms_facet(Product.categories.through, "category", "categories"),
+        "colors": terms_facet(Product.colors.through, "color", "colors"),
+        "price": [
+            {"key": price_range["key"], "count": price_counts[f"price_{index}"]}
+            for index, price_range in enumerate(PRICE_RANGES)
+        ],
+    }
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    Product.search_vector (DB 트리거로 유지되는 tsvector + GIN 인덱스) 기반 검색.
+    별도 색인 동기화가 필요 없어 ES 클러스터 없이 운영할 때 사용한다.
+    """
+
+    requires_indexing = False
+
+    def search(
+        self,
+        query: str,
+        page: int = 1,
+        page_size: int = SEARCH_PAGE_SIZE,
+        filters: SearchFilters | None = None,
+    ) -> SearchResult:
+        filters = filters or SearchFilters()
+        tsquery = build_tsquery(query)
+        if not tsquery and filters.is_empty():
+            return SearchResult(page=page, page_size=page_size)
+
+        page = max(1, min(page, MAX_RESULT_WINDOW // page_size))
+
+        products = get_searchable_products()
+        if tsquery:
+            search_query = SearchQuery(tsquery, config=SEARCH_CONFIG, search_type='raw')
+            products = products.filter(search_vector=search_query).annotate(
+                rank=SearchRank(F('search_vector'), search_query)
+            )
+            ordering = ['-rank', '-created_at', '-id']
+        else:
+            ordering = ['-created_at', '-id']
+
+        filtered = apply_filters(products, filters)
+        offset = (page - 1) * page_size
+        product_ids = list(filtered.order_by(*ordering).values_list('pk', flat=True)[offset:offset + page_size])
+
+        return SearchResult(
+            product_ids=product_ids,
+            total=filtered.count(),
+            page=page,
+            page_size=page_size,
+            facets=count_facets(products, filters),
+        )
+
+    def suggest(self, prefix: str, size: int = AUTOCOMPLETE_SIZE) -> List[str]:
+        if not prefix:
+            return []
+
+        # istartswith 는 UPPER(col) LIKE 'PREFIX%' 로 변환되어 trigram 인덱스를 사용한다
+        names = list(
+            Product.objects.filter(is_live=True, is_sold=False, name__istartswith=prefix)
+            .order_by('-created_at')
+            .values_list('name', flat=True)[:size]
+        )
+        if len(names) < size:
+            names.extend(
+                Category.objects.filter(name__istartswith=prefix)
+                .order_by('name')
+                .values_list('name', flat=True)[:size - len(names)]
+            )
+        return list(dict.fromkeys(names))[:size]
@@ -0,0 +1,24 @@
+from django.http import HttpRequest, JsonResponse
+from django.views import View
+
+from config.utils.cache_helper import CacheHelper
+from products.utils.search import suggest_products
+
+AUTOCOMPLETE_CACHE_TIMEOUT = 60
+AUTOCOMPLETE_MAX_LENGTH = 30
+
+
+class ProductAutocompleteView(View):
+    def get(self, request: HttpRequest) -> JsonResponse:
+        prefix = " ".join(request.GET.get('q', '').lower().split())[:AUTOCOMPLETE_MAX_LENGTH]
+
+        if not prefix:
+            return JsonResponse({'suggestions': []})
+
+        # 인기 prefix 는 짧은 TTL 로 Redis 에서 응답
+        suggestions = CacheHelper.get_or_compute(
+            f"search:autocomplete:{prefix}",
+            lambda: suggest_products(prefix),
+            ttl=AUTOCOMPLETE_CACHE_TIMEOUT,
+        )
+        return JsonResponse({'suggestions': suggestions})
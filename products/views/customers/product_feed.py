@@ -0,0 +1,20 @@
+from django.http import HttpRequest, JsonResponse
+from django.views import View
+
+from products.services.home_sections import HomeSectionService
+
+
+class ProductFeedView(View):
+    """홈 화면 무한 스크롤 (keyset 커서)"""
+
+    def get(self, request: HttpRequest) -> JsonResponse:
+        try:
+            products, next_cursor = HomeSectionService.get_feed_page(request.GET.get('cursor'))
+        except ValueError as e:
+            return JsonResponse({'success': False, 'error': str(e)}, status=400)
+
+        return JsonResponse({
+            'success': True,
+            'products': [HomeSectionService.serialize_product(product) for product in products],
+            'next_cursor': next_cursor,
+        })
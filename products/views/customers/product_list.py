@@ -1,45 +1,156 @@
-from django.db.models import Q
+from typing import Any, Dict, List
+
+from django.db.models import Exists, OuterRef, Q
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import render
 from django.views import View
 
 from categories.models import Category
+from config.utils.page_cache import (
+    CATALOG_SCOPE,
+    FRAGMENT_CACHE_TIMEOUT,
+    PageCacheVersion,
+    build_page_validators,
+    get_not_modified_response,
+    patch_page_validators,
+)
+from config.utils.pagination import KeysetPage, KeysetPaginator
 from products.models import Product
-from products.utils.elasticsearch.elastic_search import search_products
+from products.utils.search import (
+    SEARCH_PAGE_SIZE,
+    SearchFilters,
+    SearchResult,
+    search_products,
+)
+from products.utils.search.postgres_backend import apply_filters, with_effective_price
+
+FACET_PARAMS = {'categories': 'category', 'colors': 'color', 'price': 'price'}
 
 
 class ProductListView(View):
+    @staticmethod
+    def _toggle_query(request: HttpRequest, param: str, value: str, multiple: bool) -> str:
+        params = request.GET.copy()
+        params.pop('page', None)
+        params.pop('cursor', None)
+        values = params.getlist(param)
+        if value in values:
+            values.remove(value)
+        elif multiple:
+            values.append(value)
+        else:
+            values = [value]
+        params.setlist(param, values)
+        return params.urlencode()
+
+    @staticmethod
+    def _build_facets(request: HttpRequest, search_result: SearchResult) -> Dict[str, List[Dict[str, Any]]]:
+        facets: Dict[str, List[Dict[str, Any]]] = {}
+        for name, buckets in search_result.facets.items():
+            param = FACET_PARAMS[name]
+            selected = request.GET.getlist(param)
+            facets[name] = [
+                {
+                    **bucket,
+                    'selected': bucket['key'] in selected,
+                    'query': ProductListView._toggle_query(request, param, bucket['key'], multiple=name != 'price'),
+                }
+                for bucket in buckets
+                if bucket['count'] > 0 or bucket['key'] in selected
+            ]
+        return facets
+
+    @staticmethod
+    def _fallback_search(products: Any, search_query: str, filters: SearchFilters) -> Any:
+        if search_query:
+            # icontains 는 UPPER(col) LIKE 로 변환되어 products_*_trgm_idx (GIN) 를 사용한다.
+            # 카테고리는 JOIN + DISTINCT 대신 EXISTS 로 확인
+            category_match = Product.categories.through.objects.filter(
+                product_id=OuterRef('pk'),
+                category__name__icontains=search_query,
+            )
+            products = products.filter(
+                Q(name__icontains=search_query) |
+                Q(description__icontains=search_query) |
+                Exists(category_match)
+            )
+        # 검색 백엔드와 같은 기준으로 카테고리(전체)/색상/가격대 필터를 적용
+        return apply_filters(with_effective_price(products), filters)
+
     def get(self, request: HttpRequest) -> HttpResponse:
-        products = Product.objects.filter(is_live=True, is_sold=False).prefetch_related('colors', 'image', 'categories').order_by('-created_at')
+        # 목록 자체는 개인화 요소가 없고 헤더만 로그인 상태에 따라 달라지므로 사용자 정보를 ETag 에 함께 넣는다
+        catalog_version = PageCacheVersion.get_many([CATALOG_SCOPE])
+        etag, last_modified = build_page_validators(
+            request, catalog_version, request.user.pk, getattr(request.user, 'role', None)
+        )
+        not_modified = get_not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        products: Any = Product.objects.filter(is_live=True, is_sold=False).select_related('review_stats').prefetch_related('colors', 'image', 'categories').order_by('-created_at')
         
         search_query = request.GET.get('search', '')
-        category_name = request.GET.get('category', '')
+        category_names = request.GET.getlist('category')
+        filters = SearchFilters(
+            categories=category_names,
+            colors=request.GET.getlist('color'),
+            price_range=request.GET.get('price') or None,
+        )
         selected_category = None
+        search_result: SearchResult | None = None
+
+        try:
+            page = max(1, int(request.GET.get('page') or 1))
+        except ValueError:
+            page = 1
+
+        if category_names:
+            selected_category = Category.objects.filter(name=category_names[0]).first()
+            if not selected_category:
+                products = products.none()
+
+        # 검색어 또는 색상/가격/복수 카테고리 필터가 있으면 검색 백엔드에서 필터와 facet 을 한 번에 처리
+        use_search = bool(search_query or filters.colors or filters.price_range or len(category_names) > 1)
         
-        if search_query:
+        if use_search and (selected_category or not category_names):
             try:
-                product_ids = search_products(search_query)
-                if product_ids:
-                    products = products.filter(id__in=product_ids)
-                else:
-                    products = products.none()
+                search_result = search_products(search_query, page=page, filters=filters)
+                # 검색 백엔드가 정한 순서를 유지한 채 현재 페이지의 상품만 조회
+                products_dict = {p.id: p for p in products.filter(id__in=search_result.product_ids)}
+                page_products: List[Product] = [
+                    products_dict[product_id] for product_id in search_result.product_ids if product_id in products_dict
+                ]
+                products = page_products
             except Exception:
-                products = products.filter(
-                    Q(name__icontains=search_query) |
-                    Q(description__icontains=search_query) |
-                    Q(categories__name__icontains=search_query)
-                ).distinct()
-
-        if category_name:
-            selected_category = Category.objects.filter(name=category_name).first()
-            if selected_category:
-                products = products.filter(categories=selected_category)
-            else:
-                products = products.none()
+                # 검색 백엔드 장애(ES 서킷 open 등) 시 trigram 인덱스를 타는 DB 검색으로 대체
+                products = self._fallback_search(products, search_query, filters)
+        elif selected_category:
+            products = products.filter(categories=selected_category)
+
+        # 검색 백엔드를 거치지 않은 목록(카테고리/DB fallback)은 (created_at, id) keyset 으로 나눈다
+        keyset_page: KeysetPage[Product] | None = None
+        if search_result is None:
+            paginator = KeysetPaginator(products, ('-created_at', '-id'), per_page=SEARCH_PAGE_SIZE)
+            try:
+                keyset_page = paginator.get_page(request.GET.get('cursor'))
+            except ValueError:
+                keyset_page = paginator.get_page()
+            products = keyset_page.object_list
+
+        page_params = request.GET.copy()
+        page_params.pop('page', None)
+        page_params.pop('cursor', None)
         
         context = {
             'products': products,
             'search_query': search_query,
+            'search_result': search_result,
+            'keyset_page': keyset_page,
+            'facets': self._build_facets(request, search_result) if search_result else {},
+            'page_query': page_params.urlencode(),
             'category': selected_category,
+            'page_cache_timeout': FRAGMENT_CACHE_TIMEOUT,
+            'page_version': catalog_version[CATALOG_SCOPE],
         }
-        return render(request, 'products/customers/product_list.html', context)
\ No newline at end of file
+        response = render(request, 'products/customers/product_list.html', context)
+        return patch_page_validators(response, etag, last_modified)
@@ -1,14 +1,23 @@
-from django.db.models import Prefetch
 from django.http.request import HttpRequest
 from django.http.response import Http404, HttpResponse
 from django.shortcuts import render
 from django.views.generic.base import View
 
+from config.utils.page_cache import (
+    CATALOG_SCOPE,
+    FRAGMENT_CACHE_TIMEOUT,
+    PageCacheVersion,
+    build_page_validators,
+    get_not_modified_response,
+    patch_page_validators,
+    product_reviews_scope,
+    product_scope,
+)
 from favorites.services.favorite_service import FavoriteService
 from products.utils.url_slug import find_product_by_slug
 from reviews.forms.review_create import ReviewCommentForm, ReviewForm, ReviewImageForm
-from reviews.models import Review, ReviewComment
 from reviews.services.review_count import ReviewCountService
+from reviews.services.review_page import ReviewPageService
 
 
 class ProductsDetailView(View):
@@ -17,19 +26,23 @@ class ProductsDetailView(View):
         if not product:
             raise Http404("상품을 찾을 수 없습니다.")
         
-        reviews = Review.objects.filter(
-            product=product,
-            is_published=True
-        ).select_related('user').prefetch_related(
-            'images', 
-            Prefetch('comments', queryset=ReviewComment.objects.all().select_related('user'))
-        ).order_by('-created_at')
+        # 상품/리뷰/카탈로그(카테고리 메뉴) 중 하나라도 바뀌면 버전이 바뀐다
+        versions = PageCacheVersion.get_many([product_scope(product.id), product_reviews_scope(product.id), CATALOG_SCOPE])
+        # 로그인 사용자는 찜/본인 리뷰가 포함된 개인화 페이지라 조건부 응답을 쓰지 않는다
+        etag, last_modified = build_page_validators(request, versions)
+        if not request.user.is_authenticated:
+            not_modified = get_not_modified_response(request, etag, last_modified)
+            if not_modified is not None:
+                return not_modified
+        
+        # 첫 페이지만 렌더링하고 나머지 리뷰/댓글은 JSON 으로 더 불러온다
+        reviews, review_next_cursor = ReviewPageService.get_review_page(product.id)
         
         review_stats = ReviewCountService.get_product_review_stats(product)
         
         user_review = None
         if request.user.is_authenticated:
-            user_review = next((review for review in reviews if review.user == request.user), None)
+            user_review = ReviewPageService.get_user_review(product.id, request.user)
         
         is_favorited = False
         if request.user.is_authenticated:
@@ -43,6 +56,7 @@ class ProductsDetailView(View):
         context = {
             "products": product,
             "reviews": reviews,
+            "review_next_cursor": review_next_cursor,
             "avg_rating": review_stats['avg_rating'],
             "review_count": review_stats['review_count'],
             "photo_review_count": review_stats['photo_review_count'],
@@ -52,5 +66,11 @@ class ProductsDetailView(View):
             "review_form": review_form,
             "review_image_form": review_image_form,
             "comment_form": comment_form,
+            "page_cache_timeout": FRAGMENT_CACHE_TIMEOUT,
+            "product_page_version": versions[product_scope(product.id)],
+            "review_page_version": versions[product_reviews_scope(product.id)],
         }
-        return render(request, "products/detail.html", context)
\ No newline at end of file
+        response = render(request, "products/detail.html", context)
+        if not request.user.is_authenticated:
+            patch_page_validators(response, etag, last_modified)
+        return response
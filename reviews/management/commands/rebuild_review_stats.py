@@ -0,0 +1,22 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from reviews.services.review_stats import ReviewStatsService
+
+
+class Command(BaseCommand):
+    help = 'Recompute ProductReviewStats from published reviews'
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            '--product-id',
+            type=int,
+            action='append',
+            dest='product_ids',
+            help='Only rebuild the given product (repeatable)',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        count = ReviewStatsService.rebuild(options['product_ids'])
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt review stats for {count} products'))
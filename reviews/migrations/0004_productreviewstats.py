@@ -0,0 +1,47 @@
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Exists, OuterRef, Q, Sum
+
+
+def backfill_review_stats(apps, schema_editor):  # type: ignore[no-untyped-def]
+    Review = apps.get_model('reviews', 'Review')
+    ProductReviewStats = apps.get_model('reviews', 'ProductReviewStats')
+
+    has_photo = Exists(Review.images.through.objects.filter(review_id=OuterRef('pk')))
+    rows = Review.objects.filter(is_published=True).values('product_id').annotate(
+        review_count=Count('id'),
+        rating_sum=Sum('rating'),
+        **{f'rating_{rating}_count': Count('id', filter=Q(rating=rating)) for rating in range(1, 6)},
+        photo_review_count=Count('id', filter=Q(has_photo)),
+    ).order_by('product_id')
+    ProductReviewStats.objects.bulk_create([ProductReviewStats(**row) for row in rows], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0010_product_search_vector'),
+        ('reviews', '0003_remove_review_images_alter_review_rating_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductReviewStats',
+            fields=[
+                ('product', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='review_stats', serialize=False, to='products.product')),
+                ('review_count', models.PositiveIntegerField(default=0)),
+                ('rating_sum', models.PositiveIntegerField(default=0)),
+                ('rating_1_count', models.PositiveIntegerField(default=0)),
+                ('rating_2_count', models.PositiveIntegerField(default=0)),
+                ('rating_3_count', models.PositiveIntegerField(default=0)),
+                ('rating_4_count', models.PositiveIntegerField(default=0)),
+                ('rating_5_count', models.PositiveIntegerField(default=0)),
+                ('photo_review_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'product_review_stats',
+            },
+        ),
+        migrations.RunPython(backfill_review_stats, migrations.RunPython.noop),
+    ]
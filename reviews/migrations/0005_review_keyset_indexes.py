@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0004_productreviewstats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['product', '-created_at', '-id'], name='reviews_product_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['product', 'user'], name='reviews_product_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reviewcomment',
+            index=models.Index(fields=['review', 'created_at', 'id'], name='review_comments_review_idx'),
+        ),
+    ]
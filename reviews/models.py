@@ -1,5 +1,8 @@
+from typing import Any
+
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Q
 
 from config.basemodel import BaseModel
 from config.utils.image_path import image_upload_path
@@ -31,7 +34,22 @@ class Review(BaseModel):
     
     class Meta:
         db_table = 'reviews'
+        indexes = [
+            # 상품 상세의 공개 리뷰 keyset 페이지네이션 (created_at, id)
+            models.Index(
+                fields=['product', '-created_at', '-id'],
+                name='reviews_product_created_idx',
+                condition=Q(is_published=True),
+            ),
+            # 상품별 본인 리뷰 조회
+            models.Index(fields=['product', 'user'], name='reviews_product_user_idx'),
+        ]
     
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        # pre_save 에서 잠근 집계 스냅샷 행을 post_save 의 집계 갱신까지 유지
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
     def get_star_display(self) -> str:
         return '★' * self.rating + '☆' * (5 - self.rating)
     
@@ -49,4 +67,35 @@ class ReviewComment(BaseModel):
     is_published = models.BooleanField(default=True)
     
     class Meta:
-        db_table = 'review_comments'
\ No newline at end of file
+        db_table = 'review_comments'
+        indexes = [
+            models.Index(fields=['review', 'created_at', 'id'], name='review_comments_review_idx'),
+        ]
+
+
+class ProductReviewStats(models.Model):
+    """
+    상품별 공개 리뷰 집계 (리뷰 작성/수정/삭제/공개 여부 변경 시 F-expression 으로 갱신).
+    어긋난 경우 rebuild_review_stats 명령으로 다시 계산한다.
+    """
+    product = models.OneToOneField(Product, on_delete=models.CASCADE, primary_key=True, related_name='review_stats')
+    review_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveIntegerField(default=0)
+    rating_1_count = models.PositiveIntegerField(default=0)
+    rating_2_count = models.PositiveIntegerField(default=0)
+    rating_3_count = models.PositiveIntegerField(default=0)
+    rating_4_count = models.PositiveIntegerField(default=0)
+    rating_5_count = models.PositiveIntegerField(default=0)
+    photo_review_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'product_review_stats'
+
+    @property
+    def avg_rating(self) -> float:
+        return self.rating_sum / self.review_count if self.review_count else 0.0
+
+    def get_rating_count(self, rating: int) -> int:
+        count: int = getattr(self, f'rating_{rating}_count')
+        return count
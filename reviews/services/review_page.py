@@ -0,0 +1,75 @@
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, TypedDict
+
+from django.db.models import Count, Q
+from django.urls import reverse
+
+from config.utils.pagination import KeysetPaginator
+from reviews.models import Review, ReviewComment
+from users.models import User
+
+REVIEW_PAGE_SIZE = 10
+COMMENT_PAGE_SIZE = 20
+
+
+class CommentCount(TypedDict):
+    comment_count: int
+
+
+if TYPE_CHECKING:
+    from django_stubs_ext import WithAnnotations
+
+    ReviewWithCommentCount = WithAnnotations[Review, CommentCount]
+
+
+class ReviewPageService:
+    """(created_at, id) 기준 keyset 페이지네이션이라 리뷰 수와 관계없이 페이지 비용이 일정하다. 잘못된 커서는 ValueError"""
+
+    @staticmethod
+    def get_review_page(
+        product_id: int, cursor: Optional[str] = None, limit: int = REVIEW_PAGE_SIZE
+    ) -> Tuple[List["ReviewWithCommentCount"], Optional[str]]:
+        reviews = Review.objects.filter(product_id=product_id, is_published=True).select_related(
+            'user'
+        ).prefetch_related('images').annotate(
+            comment_count=Count('comments', filter=Q(comments__is_published=True))
+        )
+        page = KeysetPaginator(reviews, ('-created_at', '-id'), per_page=limit).get_page(cursor)
+        return page.object_list, page.next_cursor
+
+    @staticmethod
+    def get_comment_page(
+        review_id: int, cursor: Optional[str] = None, limit: int = COMMENT_PAGE_SIZE
+    ) -> Tuple[List[ReviewComment], Optional[str]]:
+        comments = ReviewComment.objects.filter(review_id=review_id, is_published=True).select_related('user')
+        page = KeysetPaginator(comments, ('created_at', 'id'), per_page=limit).get_page(cursor)
+        return page.object_list, page.next_cursor
+
+    @staticmethod
+    def get_user_review(product_id: int, user: User) -> Optional[Review]:
+        # (product, user) 인덱스로 본인 리뷰만 조회
+        return Review.objects.filter(product_id=product_id, user=user, is_published=True).first()
+
+    @staticmethod
+    def serialize_review(review: Review) -> Dict[str, Any]:
+        return {
+            'id': review.id,
+            'username': review.get_masked_username(),
+            'first_name': review.user.first_name or review.get_masked_username(),
+            'rating': review.get_star_display(),
+            'content': review.content,
+            'date': review.created_at.strftime('%Y.%m.%d'),
+            'hasProfileImage': bool(review.user.profile_image),
+            'profileImage': review.user.profile_image or None,
+            'images': [image.image.url for image in review.images.all()],
+            'comment_count': getattr(review, 'comment_count', 0),
+            'comments_url': reverse('review-comment-list', args=[review.id]),
+        }
+
+    @staticmethod
+    def serialize_comment(comment: ReviewComment) -> Dict[str, Any]:
+        return {
+            'id': comment.id,
+            'username': comment.user.username,
+            'content': comment.content,
+            'date': comment.created_at.strftime('%Y.%m.%d'),
+        }
@@ -0,0 +1,128 @@
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from django.db import transaction
+from django.db.models import Count, Exists, F, OuterRef, Q, Sum
+
+from reviews.models import ProductReviewStats, Review
+
+RATING_RANGE = range(1, 6)
+STATS_FIELDS = [
+    'review_count',
+    'rating_sum',
+    *[f'rating_{rating}_count' for rating in RATING_RANGE],
+    'photo_review_count',
+]
+
+
+class ReviewContribution(NamedTuple):
+    product_id: int
+    rating: int
+    is_published: bool
+    has_photo: bool
+
+
+class ReviewStatsService:
+    @staticmethod
+    def snapshot(review_ids: Iterable[int]) -> Dict[int, ReviewContribution]:
+        """리뷰별로 집계에 반영되는 값(상품/평점/공개 여부/포토 여부)을 한 번의 쿼리로 조회"""
+        ids = [review_id for review_id in review_ids if review_id is not None]
+        if not ids:
+            return {}
+
+        reviews = Review.objects.filter(pk__in=ids).order_by('pk')
+        # 변경 전/후 스냅샷 사이에 다른 트랜잭션이 같은 리뷰를 바꿔 차이가 이중 반영되지 않도록 행을 잠근다
+        if transaction.get_connection().in_atomic_block:
+            reviews = reviews.select_for_update()
+        rows = reviews.annotate(
+            has_photo=Exists(Review.images.through.objects.filter(review_id=OuterRef('pk')))
+        ).values_list('pk', 'product_id', 'rating', 'is_published', 'has_photo')
+        return {
+            pk: ReviewContribution(product_id, rating, is_published, has_photo)
+            for pk, product_id, rating, is_published, has_photo in rows
+        }
+
+    @staticmethod
+    def _contribution_fields(contribution: Optional[ReviewContribution]) -> Counter[str]:
+        fields: Counter[str] = Counter()
+        if contribution is None or not contribution.is_published:
+            return fields
+
+        fields['review_count'] += 1
+        fields['rating_sum'] += contribution.rating
+        fields[f'rating_{contribution.rating}_count'] += 1
+        fields['photo_review_count'] += int(contribution.has_photo)
+        return fields
+
+    @staticmethod
+    def apply_changes(
+        before: Dict[int, ReviewContribution], after: Dict[int, ReviewContribution]
+    ) -> None:
+        """변경 전/후 스냅샷의 차이만큼 상품별 집계를 F-expression 으로 증감"""
+        deltas: Dict[int, Counter[str]] = defaultdict(Counter)
+        for review_id in set(before) | set(after):
+            old, new = before.get(review_id), after.get(review_id)
+            if old is not None:
+                deltas[old.product_id].subtract(ReviewStatsService._contribution_fields(old))
+            if new is not None:
+                deltas[new.product_id].update(ReviewStatsService._contribution_fields(new))
+
+        changes = {
+            product_id: {name: value for name, value in delta.items() if value}
+            for product_id, delta in deltas.items()
+        }
+        changes = {product_id: fields for product_id, fields in changes.items() if fields}
+        if not changes:
+            return
+
+        # 감소만 있는 경우(삭제)에는 행을 만들지 않는다. 상품 삭제로 cascade 된 리뷰 삭제에서
+        # 이미 지워진 집계 행을 다시 만들면 커밋 시 FK 위반이 되기 때문
+        new_product_ids = [
+            product_id for product_id, fields in changes.items() if any(value > 0 for value in fields.values())
+        ]
+        with transaction.atomic():
+            ProductReviewStats.objects.bulk_create(
+                [ProductReviewStats(product_id=product_id) for product_id in new_product_ids],
+                ignore_conflicts=True,
+            )
+            for product_id, fields in sorted(changes.items()):
+                ProductReviewStats.objects.filter(product_id=product_id).update(
+                    **{name: F(name) + value for name, value in fields.items()}
+                )
+
+    @staticmethod
+    def get_stats(product_id: int) -> ProductReviewStats:
+        stats = ProductReviewStats.objects.filter(product_id=product_id).first()
+        return stats or ProductReviewStats(product_id=product_id)
+
+    @staticmethod
+    def rebuild(product_ids: Optional[List[int]] = None) -> int:
+        """공개 리뷰를 다시 집계해 ProductReviewStats 를 덮어쓴다. 갱신된 상품 수를 반환"""
+        reviews = Review.objects.filter(is_published=True)
+        if product_ids is not None:
+            reviews = reviews.filter(product_id__in=product_ids)
+
+        has_photo = Exists(Review.images.through.objects.filter(review_id=OuterRef('pk')))
+        rows = reviews.values('product_id').annotate(
+            review_count=Count('id'),
+            rating_sum=Sum('rating'),
+            **{f'rating_{rating}_count': Count('id', filter=Q(rating=rating)) for rating in RATING_RANGE},
+            photo_review_count=Count('id', filter=Q(has_photo)),
+        ).order_by('product_id')
+
+        stats = [ProductReviewStats(**row) for row in rows]
+        with transaction.atomic():
+            # 공개 리뷰가 더 이상 없는 상품도 0 이 되도록 대상 범위를 먼저 초기화한 뒤 덮어쓴다
+            scope = ProductReviewStats.objects.all()
+            if product_ids is not None:
+                scope = scope.filter(product_id__in=product_ids)
+            scope.update(**{name: 0 for name in STATS_FIELDS})
+
+            ProductReviewStats.objects.bulk_create(
+                stats,
+                update_conflicts=True,
+                unique_fields=['product'],
+                update_fields=STATS_FIELDS,
+                batch_size=1000,
+            )
+        return len(stats)
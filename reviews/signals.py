@@ -0,0 +1,93 @@
+from typing import Any, Dict, Iterable
+
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+
+from config.utils.page_cache import (
+    CATALOG_SCOPE,
+    PageCacheVersion,
+    product_reviews_scope,
+)
+from reviews.models import Review, ReviewComment, ReviewImage
+from reviews.services.review_stats import ReviewContribution, ReviewStatsService
+
+# 변경 전 스냅샷을 pre_* 시그널에서 인스턴스에 보관해 두었다가 post_* 에서 차이만 반영한다
+SNAPSHOT_ATTR = '_review_stats_snapshot'
+
+
+def apply_review_changes(before: Dict[int, ReviewContribution], after: Dict[int, ReviewContribution]) -> None:
+    ReviewStatsService.apply_changes(before, after)
+    product_ids = {contribution.product_id for contribution in [*before.values(), *after.values()]}
+    bump_review_pages(product_ids)
+
+
+def bump_review_pages(product_ids: Iterable[int]) -> None:
+    # 리뷰 요약 프래그먼트/상품 상세 ETag 와 평점을 보여주는 목록(catalog) 무효화
+    scopes = [product_reviews_scope(product_id) for product_id in product_ids]
+    if scopes:
+        PageCacheVersion.bump(CATALOG_SCOPE, *scopes)
+
+
+@receiver(pre_save, sender=Review)
+def snapshot_review_before_save(sender: type[Review], instance: Review, **kwargs: Any) -> None:
+    setattr(instance, SNAPSHOT_ATTR, ReviewStatsService.snapshot([instance.pk]) if instance.pk else {})
+
+
+@receiver(post_save, sender=Review)
+def update_stats_after_save(sender: type[Review], instance: Review, **kwargs: Any) -> None:
+    before = getattr(instance, SNAPSHOT_ATTR, {})
+    apply_review_changes(before, ReviewStatsService.snapshot([instance.pk]))
+
+
+@receiver(pre_delete, sender=Review)
+def snapshot_review_before_delete(sender: type[Review], instance: Review, **kwargs: Any) -> None:
+    setattr(instance, SNAPSHOT_ATTR, ReviewStatsService.snapshot([instance.pk]))
+
+
+@receiver(post_delete, sender=Review)
+def update_stats_after_delete(sender: type[Review], instance: Review, **kwargs: Any) -> None:
+    apply_review_changes(getattr(instance, SNAPSHOT_ATTR, {}), {})
+
+
+@receiver(m2m_changed, sender=Review.images.through)
+def update_photo_review_stats(
+    sender: Any, instance: Any, action: str, reverse: bool, pk_set: set[int] | None, **kwargs: Any
+) -> None:
+    if reverse:
+        # image.reviews.add/remove/clear
+        review_ids = list(instance.reviews.values_list('id', flat=True)) if action.endswith('clear') else list(pk_set or [])
+    else:
+        review_ids = [instance.pk]
+
+    if action in ('pre_add', 'pre_remove', 'pre_clear'):
+        setattr(instance, SNAPSHOT_ATTR, ReviewStatsService.snapshot(review_ids))
+    elif action in ('post_add', 'post_remove', 'post_clear'):
+        before = getattr(instance, SNAPSHOT_ATTR, {})
+        apply_review_changes(before, ReviewStatsService.snapshot(before.keys() or review_ids))
+
+
+@receiver(pre_delete, sender=ReviewImage)
+def snapshot_image_reviews_before_delete(sender: type[ReviewImage], instance: ReviewImage, **kwargs: Any) -> None:
+    # 이미지 삭제 시 중간 테이블 행은 m2m_changed 없이 함께 지워진다
+    review_ids = list(instance.reviews.values_list('id', flat=True))
+    setattr(instance, SNAPSHOT_ATTR, ReviewStatsService.snapshot(review_ids))
+
+
+@receiver(post_delete, sender=ReviewImage)
+def update_stats_after_image_delete(sender: type[ReviewImage], instance: ReviewImage, **kwargs: Any) -> None:
+    before = getattr(instance, SNAPSHOT_ATTR, {})
+    apply_review_changes(before, ReviewStatsService.snapshot(before.keys()))
+
+
+@receiver(post_save, sender=ReviewComment)
+@receiver(post_delete, sender=ReviewComment)
+def invalidate_review_comment_pages(sender: type[ReviewComment], instance: ReviewComment, **kwargs: Any) -> None:
+    product_id = Review.objects.filter(pk=instance.review_id).values_list('product_id', flat=True).first()
+    if product_id is not None:
+        bump_review_pages([product_id])
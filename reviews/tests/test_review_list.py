@@ -0,0 +1,71 @@
+import pytest
+from django.urls import reverse
+
+from config.utils.setup_test_method import TestSetupMixin
+from reviews.models import Review, ReviewComment
+from reviews.services.review_page import ReviewPageService
+
+
+@pytest.mark.django_db
+class TestReviewKeysetPagination(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.setup_test_products_data()
+        self.reviews = [
+            Review.objects.create(product=self.product, user=self.customer_user, content=f"리뷰 {i}", rating=5)
+            for i in range(5)
+        ]
+
+    def test_pages_follow_created_at_desc(self) -> None:
+        first_page, cursor = ReviewPageService.get_review_page(self.product.id, limit=2)
+        second_page, cursor = ReviewPageService.get_review_page(self.product.id, cursor=cursor, limit=2)
+        last_page, cursor = ReviewPageService.get_review_page(self.product.id, cursor=cursor, limit=2)
+
+        ids = [review.id for review in first_page + second_page + last_page]
+        assert ids == [review.id for review in reversed(self.reviews)]
+        assert cursor is None
+
+    def test_unpublished_reviews_skipped(self) -> None:
+        Review.objects.filter(id=self.reviews[-1].id).update(is_published=False)
+
+        page, _ = ReviewPageService.get_review_page(self.product.id, limit=10)
+
+        assert self.reviews[-1].id not in [review.id for review in page]
+
+    def test_load_more_endpoint(self) -> None:
+        _, cursor = ReviewPageService.get_review_page(self.product.id, limit=3)
+        assert cursor is not None
+
+        response = self.client.get(reverse('review-list', args=[self.product.id]), {'cursor': cursor})
+
+        data = response.json()
+        assert response.status_code == 200
+        assert [review['id'] for review in data['reviews']] == [self.reviews[1].id, self.reviews[0].id]
+        assert data['next_cursor'] is None
+
+    def test_invalid_cursor(self) -> None:
+        response = self.client.get(reverse('review-list', args=[self.product.id]), {'cursor': 'invalid'})
+
+        assert response.status_code == 400
+
+    def test_comments_loaded_per_review(self) -> None:
+        review = self.reviews[0]
+        comments = [
+            ReviewComment.objects.create(review=review, user=self.admin_user, content=f"댓글 {i}") for i in range(3)
+        ]
+
+        page, _ = ReviewPageService.get_review_page(self.product.id, limit=10)
+        response = self.client.get(reverse('review-comment-list', args=[review.id]))
+
+        assert next(item for item in page if item.id == review.id).comment_count == 3
+        assert [comment['id'] for comment in response.json()['comments']] == [comment.id for comment in comments]
+
+    def test_detail_renders_first_page_only(self) -> None:
+        self.client.force_login(self.customer_user)
+
+        response = self.client.get(reverse('products-detail', args=[self.product.slug]))
+
+        assert response.status_code == 200
+        assert len(response.context['reviews']) == 5
+        assert response.context['review_next_cursor'] is None
+        assert response.context['user_review'] is not None
@@ -0,0 +1,79 @@
+import pytest
+from django.core.management import call_command
+
+from config.utils.setup_test_method import TestSetupMixin
+from reviews.models import ProductReviewStats, ReviewImage
+from reviews.services.review_count import ReviewCountService
+
+
+@pytest.mark.django_db
+class TestProductReviewStats(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.setup_test_products_data()
+        self.setup_test_reviews_data()
+
+    def get_stats(self) -> ProductReviewStats:
+        return ProductReviewStats.objects.get(product=self.product)
+
+    def test_created_reviews_counted(self) -> None:
+        stats = self.get_stats()
+
+        assert stats.review_count == 2
+        assert stats.rating_sum == 9
+        assert stats.rating_4_count == 1
+        assert stats.rating_5_count == 1
+        assert stats.avg_rating == 4.5
+
+    def test_rating_update_moves_histogram(self) -> None:
+        self.customer_review.rating = 2
+        self.customer_review.save()
+
+        stats = self.get_stats()
+        assert stats.rating_sum == 7
+        assert stats.rating_4_count == 0
+        assert stats.rating_2_count == 1
+
+    def test_unpublish_and_delete(self) -> None:
+        self.customer_review.is_published = False
+        self.customer_review.save()
+
+        assert self.get_stats().review_count == 1
+
+        self.admin_review.delete()
+
+        stats = self.get_stats()
+        assert stats.review_count == 0
+        assert stats.rating_sum == 0
+
+    def test_photo_review_count(self) -> None:
+        image = ReviewImage.objects.create(image='reviews/images/test.jpg')
+        self.customer_review.images.add(image)
+
+        assert self.get_stats().photo_review_count == 1
+
+        image.delete()
+
+        assert self.get_stats().photo_review_count == 0
+
+    def test_detail_stats_single_query(self, django_assert_num_queries) -> None:  # type: ignore[no-untyped-def]
+        with django_assert_num_queries(1):
+            stats = ReviewCountService.get_product_review_stats(self.product)
+
+        rating_distribution = stats['rating_distribution']
+        assert isinstance(rating_distribution, dict)
+        assert rating_distribution[5] == {'count': 1, 'percentage': 50.0}
+
+    def test_rebuild_command_fixes_drift(self) -> None:
+        ProductReviewStats.objects.filter(product=self.product).update(review_count=10, rating_sum=0)
+
+        call_command('rebuild_review_stats')
+
+        stats = self.get_stats()
+        assert stats.review_count == 2
+        assert stats.rating_sum == 9
+
+    def test_product_delete_cascades(self) -> None:
+        self.product.delete()
+
+        assert not ProductReviewStats.objects.exists()
@@ -6,6 +6,7 @@ from reviews.views.comment_update import ReviewCommentUpdateView
 from reviews.views.image_delete import DeleteReviewImageView
 from reviews.views.review_create import ReviewCreateView
 from reviews.views.review_delete import ReviewDeleteView
+from reviews.views.review_list import ProductReviewListView, ReviewCommentListView
 from reviews.views.review_update import ReviewUpdateView
 
 urlpatterns = [
@@ -17,5 +18,8 @@ urlpatterns = [
     path('comment/create/<int:review_id>/', ReviewCommentCreateView.as_view(), name='review-comment-create'),
     path('comment/update/<int:comment_id>/', ReviewCommentUpdateView.as_view(), name='review-comment-update'),
     path('comment/delete/<int:comment_id>/', ReviewCommentDeleteView.as_view(), name='review-comment-delete'),
+    # 리뷰/댓글 더 보기 (JSON)
+    path('list/<int:product_id>/', ProductReviewListView.as_view(), name='review-list'),
+    path('comment/list/<int:review_id>/', ReviewCommentListView.as_view(), name='review-comment-list'),
 ]
 
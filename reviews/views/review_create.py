@@ -2,6 +2,7 @@
 from typing import cast
 
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db import transaction
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.views import View
@@ -29,16 +30,18 @@ class ReviewCreateView(LoginRequiredMixin, View):
         image_form = ReviewImageForm(request.POST, request.FILES)
 
         if form.is_valid() and image_form.is_valid():
-            review = form.save(commit=False)
-            review.user = cast(User, request.user)
-            review.product = product
-            review.save()
-            
-            images = request.FILES.getlist('image')
-            if images:
-                for image in images:
-                    review_image = ReviewImage.objects.create(image=image)
-                    review.images.add(review_image)
+            # 리뷰와 상품 리뷰 집계(ProductReviewStats)가 함께 커밋되도록 한 트랜잭션으로 처리
+            with transaction.atomic():
+                review = form.save(commit=False)
+                review.user = cast(User, request.user)
+                review.product = product
+                review.save()
+
+                images = request.FILES.getlist('image')
+                if images:
+                    for image in images:
+                        review_image = ReviewImage.objects.create(image=image)
+                        review.images.add(review_image)
 
             return redirect('products-detail', product_name=product_name_to_slug(product.name))
 
@@ -0,0 +1,36 @@
+from django.http import HttpRequest, JsonResponse
+from django.views import View
+
+from reviews.services.review_page import ReviewPageService
+
+
+class ProductReviewListView(View):
+    """상품 상세의 리뷰 더 보기 (keyset 커서)"""
+
+    def get(self, request: HttpRequest, product_id: int) -> JsonResponse:
+        try:
+            reviews, next_cursor = ReviewPageService.get_review_page(product_id, request.GET.get('cursor'))
+        except ValueError as e:
+            return JsonResponse({'success': False, 'error': str(e)}, status=400)
+
+        return JsonResponse({
+            'success': True,
+            'reviews': [ReviewPageService.serialize_review(review) for review in reviews],
+            'next_cursor': next_cursor,
+        })
+
+
+class ReviewCommentListView(View):
+    """리뷰별 댓글을 요청 시점에 불러온다"""
+
+    def get(self, request: HttpRequest, review_id: int) -> JsonResponse:
+        try:
+            comments, next_cursor = ReviewPageService.get_comment_page(review_id, request.GET.get('cursor'))
+        except ValueError as e:
+            return JsonResponse({'success': False, 'error': str(e)}, status=400)
+
+        return JsonResponse({
+            'success': True,
+            'comments': [ReviewPageService.serialize_comment(comment) for comment in comments],
+            'next_cursor': next_cursor,
+        })
@@ -1,6 +1,7 @@
 import json
 
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db import transaction
 from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.views import View
@@ -80,14 +81,15 @@ class ReviewUpdateView(LoginRequiredMixin, View):
         image_form = ReviewImageForm(request.POST, request.FILES)
 
         if form.is_valid() and image_form.is_valid():
-            form.save()
-
-            # 새 이미지 추가
-            images = request.FILES.getlist('image')
-            if images:
-                for image in images:
-                    review_image = ReviewImage.objects.create(image=image)
-                    review.images.add(review_image)
+            with transaction.atomic():
+                form.save()
+
+                # 새 이미지 추가
+                images = request.FILES.getlist('image')
+                if images:
+                    for image in images:
+                        review_image = ReviewImage.objects.create(image=image)
+                        review.images.add(review_image)
 
             return redirect('products-detail', product_name=product_name_to_slug(review.product.name))
 
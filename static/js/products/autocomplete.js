@@ -0,0 +1,64 @@
+document.addEventListener('DOMContentLoaded', () => {
+    const datalist = document.getElementById('searchSuggestions');
+    const inputs = document.querySelectorAll('[data-autocomplete-url]');
+    if (!datalist || inputs.length === 0) {
+        return;
+    }
+
+    const DEBOUNCE_MS = 150;
+    const cache = new Map();
+    let debounceTimer = null;
+    let controller = null;
+
+    function renderSuggestions(suggestions) {
+        datalist.innerHTML = '';
+        suggestions.forEach((suggestion) => {
+            const option = document.createElement('option');
+            option.value = suggestion;
+            datalist.appendChild(option);
+        });
+    }
+
+    async function fetchSuggestions(url, prefix) {
+        if (cache.has(prefix)) {
+            renderSuggestions(cache.get(prefix));
+            return;
+        }
+
+        // 이전 요청이 아직 진행 중이면 취소하고 마지막 입력만 조회
+        if (controller) {
+            controller.abort();
+        }
+        controller = new AbortController();
+
+        try {
+            const response = await fetch(`${url}?q=${encodeURIComponent(prefix)}`, { signal: controller.signal });
+            if (!response.ok) {
+                return;
+            }
+            const data = await response.json();
+            cache.set(prefix, data.suggestions);
+            renderSuggestions(data.suggestions);
+        } catch (error) {
+            if (error.name !== 'AbortError') {
+                console.error('Autocomplete error:', error);
+            }
+        }
+    }
+
+    inputs.forEach((input) => {
+        input.addEventListener('input', () => {
+            const prefix = input.value.trim().toLowerCase();
+            clearTimeout(debounceTimer);
+
+            if (!prefix) {
+                renderSuggestions([]);
+                return;
+            }
+
+            debounceTimer = setTimeout(() => {
+                fetchSuggestions(input.dataset.autocompleteUrl, prefix);
+            }, DEBOUNCE_MS);
+        });
+    });
+});
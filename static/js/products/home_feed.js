@@ -0,0 +1,95 @@
+document.addEventListener('DOMContentLoaded', () => {
+    const grid = document.getElementById('homeFeedGrid');
+    const sentinel = document.getElementById('homeFeedSentinel');
+    if (!grid || !sentinel) {
+        return;
+    }
+
+    let loading = false;
+
+    function createElement(tag, className, text) {
+        const element = document.createElement(tag);
+        if (className) {
+            element.className = className;
+        }
+        if (text !== undefined) {
+            element.textContent = text;
+        }
+        return element;
+    }
+
+    function formatPrice(value) {
+        return `${Number(value).toLocaleString('ko-KR')}원`;
+    }
+
+    function renderProduct(product) {
+        const card = createElement('article', 'product-card');
+
+        const thumb = createElement('a', 'product-thumb');
+        thumb.href = product.url;
+        thumb.setAttribute('aria-label', '상품 상세');
+        const primary = product.images[0] || `https://picsum.photos/seed/${product.id}/600/750`;
+        const hover = product.images[1] || primary;
+        [[primary, 'product-image-primary'], [hover, 'product-image-hover']].forEach(([src, className]) => {
+            const img = document.createElement('img');
+            img.src = src;
+            img.alt = product.name;
+            img.className = className;
+            thumb.appendChild(img);
+        });
+        card.appendChild(thumb);
+
+        const info = createElement('div', 'product-info');
+        info.appendChild(createElement('h4', 'product-name', product.name));
+
+        const colors = createElement('div', 'product-colors');
+        product.colors.forEach((hexCode) => {
+            const color = createElement('span', 'product-color');
+            color.style.backgroundColor = hexCode;
+            colors.appendChild(color);
+        });
+        info.appendChild(colors);
+
+        const price = createElement('div', 'product-price');
+        if (product.sale_price !== null) {
+            price.appendChild(createElement('span', 'sale', formatPrice(product.sale_price)));
+            price.appendChild(createElement('span', 'origin', formatPrice(product.price)));
+        } else {
+            price.appendChild(createElement('span', 'price', formatPrice(product.price)));
+        }
+        info.appendChild(price);
+
+        card.appendChild(info);
+        return card;
+    }
+
+    const observer = new IntersectionObserver(async (entries) => {
+        if (!entries.some((entry) => entry.isIntersecting) || loading) {
+            return;
+        }
+
+        loading = true;
+        try {
+            const query = `?cursor=${encodeURIComponent(sentinel.dataset.cursor)}`;
+            const response = await fetch(`${sentinel.dataset.url}${query}`, { headers: { 'Accept': 'application/json' } });
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}`);
+            }
+            const data = await response.json();
+            data.products.forEach((product) => grid.appendChild(renderProduct(product)));
+
+            if (data.next_cursor) {
+                sentinel.dataset.cursor = data.next_cursor;
+            } else {
+                observer.disconnect();
+                sentinel.remove();
+            }
+        } catch (error) {
+            console.error('상품을 불러오지 못했습니다.', error);
+        } finally {
+            loading = false;
+        }
+    }, { rootMargin: '400px 0px' });
+
+    observer.observe(sentinel);
+});
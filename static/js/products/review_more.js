@@ -0,0 +1,130 @@
+document.addEventListener('DOMContentLoaded', () => {
+    const reviewContainer = document.querySelector('.customer-review-content');
+    const moreButton = document.querySelector('.customer-review-more-btn');
+
+    function createElement(tag, className, text) {
+        const element = document.createElement(tag);
+        if (className) {
+            element.className = className;
+        }
+        if (text !== undefined) {
+            element.textContent = text;
+        }
+        return element;
+    }
+
+    function renderReview(review) {
+        const grid = createElement('div', 'customer-review-grid');
+        const item = createElement('div', 'customer-review-item');
+
+        const section = createElement('div', 'customer-review-item-section');
+        section.appendChild(createElement('span', 'customer-review-item-title', review.username));
+        section.appendChild(createElement('span', 'customer-review-item-rating-stars', review.rating));
+        section.appendChild(createElement('span', 'customer-review-item-date', review.date));
+        item.appendChild(section);
+
+        if (review.images.length > 0) {
+            const images = createElement('div', 'customer-review-item-images');
+            review.images.forEach((url) => {
+                const img = document.createElement('img');
+                img.src = url;
+                img.alt = '리뷰 이미지';
+                images.appendChild(img);
+            });
+            item.appendChild(images);
+        }
+
+        const body = createElement('div', 'customer-review-item-body');
+        body.appendChild(createElement('span', 'customer-review-item-content', review.content));
+        item.appendChild(body);
+
+        if (review.comment_count > 0) {
+            const button = createElement('button', 'customer-review-comments-btn', `댓글 ${review.comment_count}개 보기`);
+            button.type = 'button';
+            button.dataset.url = review.comments_url;
+            item.appendChild(button);
+            item.appendChild(createElement('div', 'customer-review-comments'));
+        }
+
+        grid.appendChild(item);
+        return grid;
+    }
+
+    function renderComment(comment) {
+        const wrapper = createElement('div', 'customer-review-comment');
+        const meta = createElement('div', 'customer-review-comment-meta');
+        meta.appendChild(createElement('span', null, comment.username));
+        meta.appendChild(createElement('span', null, comment.date));
+        wrapper.appendChild(meta);
+        wrapper.appendChild(createElement('div', null, comment.content));
+        return wrapper;
+    }
+
+    async function fetchPage(url, cursor) {
+        const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : '';
+        const response = await fetch(`${url}${query}`, { headers: { 'Accept': 'application/json' } });
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status}`);
+        }
+        return response.json();
+    }
+
+    if (moreButton && reviewContainer) {
+        moreButton.addEventListener('click', async () => {
+            moreButton.disabled = true;
+            try {
+                const data = await fetchPage(moreButton.dataset.url, moreButton.dataset.cursor);
+                data.reviews.forEach((review) => {
+                    reviewContainer.appendChild(renderReview(review));
+                    if (window.reviewData) {
+                        // 리뷰 모달의 이전/다음 탐색에도 포함
+                        window.reviewData.push({ ...review, productImages: [] });
+                    }
+                });
+
+                if (data.next_cursor) {
+                    moreButton.dataset.cursor = data.next_cursor;
+                    moreButton.disabled = false;
+                } else {
+                    moreButton.remove();
+                }
+            } catch (error) {
+                console.error('리뷰를 불러오지 못했습니다.', error);
+                moreButton.disabled = false;
+            }
+        });
+    }
+
+    // 댓글은 버튼을 누른 리뷰만 불러온다 (동적으로 추가된 리뷰 포함)
+    document.addEventListener('click', async (event) => {
+        const button = event.target.closest('.customer-review-comments-btn, .customer-review-comments-more');
+        if (!button) {
+            return;
+        }
+
+        const container = button.parentElement.querySelector('.customer-review-comments');
+        button.disabled = true;
+        try {
+            const data = await fetchPage(button.dataset.url, button.dataset.cursor);
+            data.comments.forEach((comment) => container.appendChild(renderComment(comment)));
+
+            if (data.next_cursor) {
+                let nextButton = button;
+                if (button.classList.contains('customer-review-comments-btn')) {
+                    nextButton = createElement('button', 'customer-review-comments-more', '댓글 더 보기');
+                    nextButton.type = 'button';
+                    nextButton.dataset.url = button.dataset.url;
+                    button.parentElement.appendChild(nextButton);
+                    button.remove();
+                }
+                nextButton.dataset.cursor = data.next_cursor;
+                nextButton.disabled = false;
+            } else {
+                button.remove();
+            }
+        } catch (error) {
+            console.error('댓글을 불러오지 못했습니다.', error);
+            button.disabled = false;
+        }
+    });
+});
@@ -1,5 +1,7 @@
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 from config.basemodel import BaseModel
 
@@ -28,6 +30,18 @@ class User(AbstractUser, BaseModel):
 
     class Meta:
         db_table = 'users'
+        indexes = [
+            # 관리자 회원 목록 keyset 페이지네이션용
+            models.Index(fields=['-date_joined', '-id'], name='users_date_joined_idx'),
+            # 이메일 형태의 검색어는 iexact (UPPER(email) = UPPER(q)) 로 바로 찾는다
+            models.Index(Upper('email'), name='users_email_upper_idx'),
+            # 관리자 회원 검색(icontains -> UPPER(col) LIKE)용 trigram 인덱스
+            GinIndex(OpClass(Upper('email'), name='gin_trgm_ops'), name='users_email_trgm_idx'),
+            GinIndex(OpClass(Upper('username'), name='gin_trgm_ops'), name='users_username_trgm_idx'),
+            GinIndex(OpClass(Upper('first_name'), name='gin_trgm_ops'), name='users_first_name_trgm_idx'),
+            GinIndex(OpClass(Upper('last_name'), name='gin_trgm_ops'), name='users_last_name_trgm_idx'),
+            GinIndex(OpClass(Upper('phone_number'), name='gin_trgm_ops'), name='users_phone_trgm_idx'),
+        ]
 
 class PermissionAdmin(BaseModel):
     user = models.OneToOneField(User, on_delete=models.CASCADE)
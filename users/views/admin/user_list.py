@@ -1,9 +1,9 @@
-from django.core.paginator import Paginator
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import render
 from django.views import View
 
 from config.utils.filtering import Filtering
+from config.utils.pagination import KeysetPaginator
 from users.utils.permission import AdminPermission
 
 
@@ -11,8 +11,18 @@ class AdminUserListView(AdminPermission, View):
     def get(self, request: HttpRequest) -> HttpResponse:
         users_qs = Filtering.user_list_filter(request)
 
-        paginator = Paginator(users_qs, 20)
-        page_obj = paginator.get_page(request.GET.get("page") or "1")
+        paginator = KeysetPaginator(
+            users_qs,
+            ('-date_joined', '-id'),
+            per_page=20,
+            approximate_total=True,
+            total_cache_key=f"admin:users:{request.GET.get('q') or ''}:{request.GET.get('role') or ''}",
+        )
+        try:
+            page_obj = paginator.get_page(request.GET.get("cursor"))
+        except ValueError:
+            # 잘못되었거나 오래된 커서는 첫 페이지로
+            page_obj = paginator.get_page()
 
         context = {
             "q": request.GET.get("q") or "",